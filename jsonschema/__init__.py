@@ -39,7 +39,18 @@ from jsonschema.validators import (
 )
 
 
+_LAZY = {
+    "DiskCache": "jsonschema._remote",
+    "ECMA262Engine": "jsonschema._regex",
+    "bundle": "jsonschema._bundle",
+}
+
+
 def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY[name]), name)
     if name == "__version__":
         warnings.warn(
             "Accessing jsonschema.__version__ is deprecated and will be "
@@ -0,0 +1,148 @@
+"""
+Bundling of schemas together with the (remote) schemas they reference.
+"""
+from urllib.parse import urldefrag, urljoin
+
+from jsonschema.validators import RefResolver, _references, validator_for
+
+
+def bundle(schema, resolver=None, cls=None):
+    """
+    Bundle a schema with every schema it references into one document.
+
+    Each (remote) schema referenced from within the schema, or from
+    within any schema it references in turn, is retrieved and embedded
+    as a schema resource, under :validator:`$defs` (or ``definitions``,
+    for schemas of drafts which predate it). Resources keep their own
+    :validator:`$id` if they have one, and are otherwise identified by
+    the URI they were referenced by. References are left as-is (other
+    than ones to a resource by a URI other than its own ID, which are
+    changed to use its ID), and resolve to the embedded resources, so
+    that the bundled schema validates instances just as the original
+    does, without retrieving anything.
+
+    Arguments:
+
+        schema:
+
+            the schema to bundle, which is not modified
+
+        resolver (RefResolver):
+
+            the resolver to retrieve referenced schemas with. If
+            unprovided, one is created for the schema.
+
+        cls (jsonschema.protocols.Validator):
+
+            the validator class for the schema's draft, which determines
+            where and how resources are embedded. If unprovided, it is
+            determined from the schema's :validator:`$schema` as in
+            `jsonschema.validators.validator_for`.
+
+    Returns:
+
+        the bundled schema
+
+    Raises:
+
+        `jsonschema.exceptions.RefResolutionError`:
+
+            if a referenced schema cannot be retrieved
+    """
+    if not isinstance(schema, dict):
+        return schema
+
+    if cls is None:
+        cls = validator_for(schema)
+    if resolver is None:
+        resolver = RefResolver.from_schema(schema, id_of=cls.ID_OF)
+    base_uri = urldefrag(resolver.resolution_scope)[0].rstrip("/")
+
+    resources, aliases = {}, {}
+    refs, known = _references(schema, base_uri)
+    known.add(base_uri)
+    pending = sorted(refs - known, reverse=True)
+    while pending:
+        url = pending.pop()
+        if url in known:
+            continue
+        known.add(url)
+
+        document = resolver.resolve_from_url(url)
+        if isinstance(document, dict):
+            id = urldefrag(urljoin(url, cls.ID_OF(document)))[0]
+            resource = dict(document, **{_id_keyword(cls): id})
+        elif document:
+            id, resource = url, {_id_keyword(cls): url}
+        else:
+            id, resource = url, {_id_keyword(cls): url, "not": {}}
+
+        id = id.rstrip("/")
+        if id != url:
+            aliases[url] = id
+            if id in known:
+                continue
+            known.add(id)
+        resources[id] = resource
+
+        refs, embedded = _references(resource, id)
+        known.update(embedded)
+        pending.extend(sorted(refs - known, reverse=True))
+
+    if not resources:
+        return schema
+
+    bundled = dict(schema)
+    if base_uri and "$id" not in bundled and "id" not in bundled:
+        bundled[_id_keyword(cls)] = base_uri
+    container = _container(cls)
+    bundled[container] = dict(bundled.get(container, {}), **resources)
+    if aliases:
+        bundled = _with_references_to_ids(bundled, base_uri, aliases)
+    return bundled
+
+
+def _id_keyword(cls):
+    """
+    The keyword a draft identifies schemas with.
+    """
+    return "id" if cls.ID_OF({"id": "id"}) == "id" else "$id"
+
+
+def _container(cls):
+    """
+    The keyword a draft's schemas embed other schemas within.
+    """
+    return "$defs" if "$vocabulary" in cls.META_SCHEMA else "definitions"
+
+
+def _with_references_to_ids(value, base_uri, aliases):
+    """
+    A copy of a schema whose references use the IDs of the resources they
+    reference rather than any other URI they were retrieved from.
+    """
+    if isinstance(value, list):
+        return [
+            _with_references_to_ids(each, base_uri, aliases)
+            for each in value
+        ]
+    elif not isinstance(value, dict):
+        return value
+
+    for keyword in "$id", "id":
+        id = value.get(keyword)
+        if isinstance(id, str):
+            base_uri = urljoin(base_uri, id)
+            break
+
+    copied = {
+        k: _with_references_to_ids(v, base_uri, aliases)
+        for k, v in value.items()
+    }
+    ref = value.get("$ref")
+    if isinstance(ref, str):
+        url, fragment = urldefrag(urljoin(base_uri, ref))
+        id = aliases.get(url.rstrip("/"))
+        if id is not None:
+            copied["$ref"] = f"{id}#{fragment}" if fragment else id
+    return copied
@@ -0,0 +1,675 @@
+"""
+Generation of Python code specialized to validating under a given schema.
+
+Each subschema is turned into a single Python function which takes an
+instance and returns whether it is valid, with the checks for each of
+the subschema's keywords inlined, and with calls to the functions for
+any subschemas (including the targets of :validator:`$ref`) it contains.
+
+Keywords whose code cannot be generated are interpreted (by calling the
+keyword's callable from ``VALIDATORS``) from within the generated code.
+Schemas which use dynamic scoping (:validator:`$dynamicRef` or
+:validator:`$recursiveRef`) are interpreted entirely.
+"""
+from fractions import Fraction
+from numbers import Number
+import itertools
+import re
+
+from jsonschema import _legacy_validators, _types, _utils, _validators
+from jsonschema.exceptions import RefResolutionError, UnknownType
+
+
+class _Uninlineable(Exception):
+    """
+    Code cannot be generated for a keyword, so it must be interpreted.
+    """
+
+
+class _DynamicScope(Exception):
+    """
+    The schema needs its dynamic scope, so it must be interpreted entirely.
+    """
+
+
+_INLINE_TYPES = {
+    _types.is_any: "True",
+    _types.is_array: "isinstance({0}, list)",
+    _types.is_bool: "isinstance({0}, bool)",
+    _types.is_integer: "(isinstance({0}, int) and not isinstance({0}, bool))",
+    _types.is_null: "{0} is None",
+    _types.is_number: (
+        "(isinstance({0}, Number) and not isinstance({0}, bool))"
+    ),
+    _types.is_object: "isinstance({0}, dict)",
+    _types.is_string: "isinstance({0}, str)",
+}
+
+
+def generate(validator):
+    """
+    Generate a function which checks whether instances are valid.
+
+    Arguments:
+
+        validator (jsonschema.protocols.Validator):
+
+            the validator whose schema should be used, and which will
+            be used to interpret any keywords code cannot be generated
+            for
+
+    Returns:
+
+        collections.abc.Callable:
+
+            a function taking an instance and returning whether it is
+            valid under the validator's schema
+    """
+    try:
+        return _Generator(validator).generate()
+    except _DynamicScope:
+        return validator.is_valid
+
+
+class _Generator(object):
+    def __init__(self, validator):
+        self._validator = validator
+        self._resolver = validator.resolver
+        self._namespace = dict(
+            Number=Number,
+            _valid=_valid,
+            _invalid=_invalid,
+        )
+        self._functions = []
+        self._names = {}
+        self._counter = itertools.count()
+
+    def generate(self):
+        name = self._function_for(self._validator.schema)
+        source = "\n\n".join(self._functions)
+        code = compile(source, "<generated jsonschema>", "exec")
+        exec(code, self._namespace)
+        return self._namespace[name]
+
+    def _function_for(self, schema):
+        """
+        Generate (once) the function for the given subschema.
+        """
+        if schema is True:
+            return "_valid"
+        elif schema is False:
+            return "_invalid"
+
+        key = id(schema), self._resolver.resolution_scope
+        name = self._names.get(key)
+        if name is not None:
+            return name
+        name = self._names[key] = f"_schema{len(self._names)}"
+        self._constant(schema)  # keep it alive, and so its id unique
+
+        validator = self._validator
+        scope = validator.ID_OF(schema)
+        if scope:
+            self._resolver.push_scope(scope)
+        try:
+            body = []
+            for k, v in validator._APPLICABLE_VALIDATORS(schema):
+                fn = validator.VALIDATORS.get(k)
+                if fn is None:
+                    continue
+                if fn in _DYNAMIC:
+                    raise _DynamicScope()
+
+                generate = _KEYWORDS.get(fn)
+                try:
+                    if generate is None:
+                        raise _Uninlineable()
+                    body.extend(generate(self, v, schema))
+                except _Uninlineable:
+                    body.extend(self._interpret(k, fn, v, schema))
+        finally:
+            if scope:
+                self._resolver.pop_scope()
+
+        lines = [f"def {name}(instance):"]
+        lines.extend("    " + line for line in body)
+        lines.append("    return True")
+        self._functions.append("\n".join(lines))
+        return name
+
+    def _interpret(self, k, fn, value, schema):
+        """
+        Call a keyword's callable from ``VALIDATORS`` from generated code.
+        """
+        validator = self._validator._child_for(schema)
+        resolver, scope = self._resolver, self._resolver.resolution_scope
+        is_valid = self._validator._BOOLEAN_VALIDATORS.get(k)
+
+        def interpret(instance):
+            resolver.push_scope(scope)
+            try:
+                if is_valid is not None:
+                    return is_valid(validator, value, instance, schema)
+                errors = fn(validator, value, instance, schema) or ()
+                return next(iter(errors), None) is None
+            finally:
+                resolver.pop_scope()
+
+        return _fail_unless(f"{self._constant(interpret)}(instance)")
+
+    def _constant(self, value):
+        name = f"_constant{next(self._counter)}"
+        self._namespace[name] = value
+        return name
+
+    def _literal(self, value):
+        if value.__class__ in {str, int}:
+            return repr(value)
+        return self._constant(value)
+
+    def _local(self, name):
+        return f"{name}{next(self._counter)}"
+
+    def _is(self, type, name="instance"):
+        """
+        An expression checking whether ``name`` is of the given type.
+        """
+        checker = self._validator.TYPE_CHECKER
+        try:
+            fn = checker._type_checkers[type]
+        except (KeyError, TypeError):
+            raise _Uninlineable()
+
+        inline = _INLINE_TYPES.get(fn)
+        if inline is not None:
+            return inline.format(name)
+        return f"{self._constant(fn)}({self._constant(checker)}, {name})"
+
+    def _schema_is(self, value, type):
+        """
+        Check, while generating code, whether a schema value is of a type.
+        """
+        try:
+            return self._validator.is_type(value, type)
+        except UnknownType:
+            raise _Uninlineable()
+
+    def _when(self, type, body):
+        if not body:
+            return []
+        return [f"if {self._is(type)}:"] + ["    " + line for line in body]
+
+    def additionalItems(self, aI, schema):
+        items = schema.get("items", {})
+        if self._schema_is(items, "object"):
+            return []
+
+        length = len(schema.get("items", []))
+        if self._schema_is(aI, "object"):
+            return self._when("array", self._each_item(aI, start=length))
+        elif not aI:
+            return self._when(
+                "array", _fail_unless(f"len(instance) <= {length}"),
+            )
+        return []
+
+    def additionalProperties(self, aP, schema):
+        properties = self._constant(schema.get("properties", {}))
+        key = self._local("key")
+        extra = f"{key} not in {properties}"
+        for pattern in schema.get("patternProperties", {}):
+            search = self._constant(self._compile(pattern).search)
+            extra += f" and not {search}({key})"
+
+        if self._schema_is(aP, "object"):
+            function = self._function_for(aP)
+            body = [f"for {key} in instance:"] + [
+                "    " + line for line in _fail_if(
+                    f"{extra} and not {function}(instance[{key}])",
+                )
+            ]
+        elif not aP:
+            body = [f"for {key} in instance:"] + [
+                "    " + line for line in _fail_if(extra)
+            ]
+        else:
+            return []
+        return self._when("object", body)
+
+    def allOf(self, allOf, schema):
+        return [
+            line
+            for subschema in allOf
+            for line in _fail_unless(
+                f"{self._function_for(subschema)}(instance)",
+            )
+        ]
+
+    def anyOf(self, anyOf, schema):
+        any_valid = " or ".join(
+            f"{self._function_for(subschema)}(instance)"
+            for subschema in anyOf
+        )
+        return _fail_unless(any_valid or "False")
+
+    def const(self, const, schema):
+        equal = self._constant(_utils.equal)
+        return _fail_unless(f"{equal}(instance, {self._constant(const)})")
+
+    def contains(self, contains, schema):
+        function = self._function_for(contains)
+        matches, item = self._local("matches"), self._local("item")
+        min_contains = self._literal(schema.get("minContains", 1))
+        if "maxContains" in schema:
+            max_contains = self._literal(schema["maxContains"])
+        else:
+            max_contains = "len(instance)"
+        return self._when(
+            "array", [
+                f"{matches} = 0",
+                f"for {item} in instance:",
+                f"    if {function}({item}):",
+                f"        {matches} += 1",
+                f"        if {matches} > {max_contains}:",
+                "            return False",
+                *_fail_if(f"{matches} < {min_contains}"),
+            ],
+        )
+
+    def contains_draft6_draft7(self, contains, schema):
+        function, item = self._function_for(contains), self._local("item")
+        return self._when(
+            "array", [
+                f"for {item} in instance:",
+                f"    if {function}({item}):",
+                "        break",
+                "else:",
+                "    return False",
+            ],
+        )
+
+    def dependencies(self, dependencies, schema):
+        body = []
+        for property, dependency in dependencies.items():
+            present = f"{self._literal(property)} in instance"
+            if self._schema_is(dependency, "array"):
+                if dependency:
+                    missing = _missing(self, dependency)
+                    body.extend(_fail_if(f"{present} and ({missing})"))
+            else:
+                function = self._function_for(dependency)
+                body.extend(
+                    _fail_if(f"{present} and not {function}(instance)"),
+                )
+        return self._when("object", body)
+
+    def dependentRequired(self, dependentRequired, schema):
+        body = []
+        for property, dependency in dependentRequired.items():
+            if dependency:
+                present = f"{self._literal(property)} in instance"
+                missing = _missing(self, dependency)
+                body.extend(_fail_if(f"{present} and ({missing})"))
+        return self._when("object", body)
+
+    def dependentSchemas(self, dependentSchemas, schema):
+        body = []
+        for property, dependency in dependentSchemas.items():
+            present = f"{self._literal(property)} in instance"
+            function = self._function_for(dependency)
+            body.extend(_fail_if(f"{present} and not {function}(instance)"))
+        return self._when("object", body)
+
+    def enum(self, enums, schema):
+        if all(each.__class__ is str for each in enums):
+            strings = self._constant(frozenset(enums))
+            return _fail_unless(
+                f"isinstance(instance, str) and instance in {strings}",
+            )
+        in_enum = self._constant(_in_enum)
+        return _fail_unless(f"{in_enum}(instance, {self._constant(enums)})")
+
+    def exclusiveMaximum(self, maximum, schema):
+        return self._when(
+            "number", _fail_if(f"instance >= {self._literal(maximum)}"),
+        )
+
+    def exclusiveMinimum(self, minimum, schema):
+        return self._when(
+            "number", _fail_if(f"instance <= {self._literal(minimum)}"),
+        )
+
+    def format(self, format, schema):
+        validator = self._validator
+        if validator.format_checker is None:
+            return []
+
+        def conforms(instance):
+            return _validators._conforms(validator, format, instance)
+        return _fail_unless(f"{self._constant(conforms)}(instance)")
+
+    def if_(self, if_schema, schema):
+        body = [f"if {self._function_for(if_schema)}(instance):"]
+        if "then" in schema:
+            then = self._function_for(schema["then"])
+            body.extend(
+                "    " + line for line in _fail_unless(f"{then}(instance)")
+            )
+        else:
+            body.append("    pass")
+        if "else" in schema:
+            else_ = self._function_for(schema["else"])
+            body.append("else:")
+            body.extend(
+                "    " + line for line in _fail_unless(f"{else_}(instance)")
+            )
+        return body
+
+    def items(self, items, schema):
+        prefix = len(schema.get("prefixItems", []))
+        if items is False:
+            return self._when(
+                "array", _fail_if(f"len(instance) > {prefix}"),
+            )
+        return self._when("array", self._each_item(items, start=prefix))
+
+    def items_draft3_draft4(self, items, schema):
+        if self._schema_is(items, "object"):
+            return self._when("array", self._each_item(items))
+        return self._when("array", self._each_prefix_item(items))
+
+    def items_draft6_draft7_draft201909(self, items, schema):
+        if self._schema_is(items, "array"):
+            return self._when("array", self._each_prefix_item(items))
+        return self._when("array", self._each_item(items))
+
+    def maxItems(self, mI, schema):
+        return self._when(
+            "array", _fail_if(f"len(instance) > {self._literal(mI)}"),
+        )
+
+    def maxLength(self, mL, schema):
+        return self._when(
+            "string", _fail_if(f"len(instance) > {self._literal(mL)}"),
+        )
+
+    def maxProperties(self, mP, schema):
+        return self._when(
+            "object", _fail_if(f"len(instance) > {self._literal(mP)}"),
+        )
+
+    def maximum(self, maximum, schema):
+        return self._when(
+            "number", _fail_if(f"instance > {self._literal(maximum)}"),
+        )
+
+    def maximum_draft3_draft4(self, maximum, schema):
+        cmp = ">=" if schema.get("exclusiveMaximum", False) else ">"
+        return self._when(
+            "number", _fail_if(f"instance {cmp} {self._literal(maximum)}"),
+        )
+
+    def minItems(self, mI, schema):
+        return self._when(
+            "array", _fail_if(f"len(instance) < {self._literal(mI)}"),
+        )
+
+    def minLength(self, mL, schema):
+        return self._when(
+            "string", _fail_if(f"len(instance) < {self._literal(mL)}"),
+        )
+
+    def minProperties(self, mP, schema):
+        return self._when(
+            "object", _fail_if(f"len(instance) < {self._literal(mP)}"),
+        )
+
+    def minimum(self, minimum, schema):
+        return self._when(
+            "number", _fail_if(f"instance < {self._literal(minimum)}"),
+        )
+
+    def minimum_draft3_draft4(self, minimum, schema):
+        cmp = "<=" if schema.get("exclusiveMinimum", False) else "<"
+        return self._when(
+            "number", _fail_if(f"instance {cmp} {self._literal(minimum)}"),
+        )
+
+    def multipleOf(self, dB, schema):
+        if isinstance(dB, float):
+            not_multiple = self._constant(_not_float_multiple)
+            failed = f"{not_multiple}(instance, {self._literal(dB)})"
+        else:
+            failed = f"instance % {self._literal(dB)}"
+        return self._when("number", _fail_if(failed))
+
+    def not_(self, not_schema, schema):
+        return _fail_if(f"{self._function_for(not_schema)}(instance)")
+
+    def oneOf(self, oneOf, schema):
+        functions = ", ".join(
+            self._function_for(subschema) for subschema in oneOf
+        )
+        valid, function = self._local("valid"), self._local("function")
+        return [
+            f"{valid} = 0",
+            f"for {function} in ({functions},):",
+            f"    if {function}(instance):",
+            f"        {valid} += 1",
+            f"        if {valid} > 1:",
+            "            return False",
+            *_fail_if(f"{valid} != 1"),
+        ] if oneOf else ["return False"]
+
+    def pattern(self, patrn, schema):
+        search = self._constant(self._compile(patrn).search)
+        return self._when("string", _fail_unless(f"{search}(instance)"))
+
+    def patternProperties(self, patternProperties, schema):
+        key, value = self._local("key"), self._local("value")
+        body = []
+        for pattern, subschema in patternProperties.items():
+            search = self._constant(self._compile(pattern).search)
+            function = self._function_for(subschema)
+            body.append(f"for {key}, {value} in instance.items():")
+            body.extend(
+                "    " + line for line in _fail_if(
+                    f"{search}({key}) and not {function}({value})",
+                )
+            )
+        return self._when("object", body)
+
+    def prefixItems(self, prefixItems, schema):
+        return self._when("array", self._each_prefix_item(prefixItems))
+
+    def properties(self, properties, schema):
+        body = []
+        for property, subschema in properties.items():
+            if subschema is True:
+                continue
+            key = self._literal(property)
+            function = self._function_for(subschema)
+            body.extend(
+                _fail_if(
+                    f"{key} in instance and not {function}(instance[{key}])",
+                ),
+            )
+        return self._when("object", body)
+
+    def propertyNames(self, propertyNames, schema):
+        if propertyNames is True:
+            return []
+        function, key = self._function_for(propertyNames), self._local("key")
+        return self._when(
+            "object", [f"for {key} in instance:"] + [
+                "    " + line for line in _fail_unless(f"{function}({key})")
+            ],
+        )
+
+    def ref(self, ref, schema):
+        resolver = self._resolver
+        if not hasattr(resolver, "resolve"):
+            raise _Uninlineable()
+
+        try:
+            url, resolved = resolver.resolve(ref)
+        except RefResolutionError:
+            raise _Uninlineable()
+
+        resolver.push_scope(url)
+        try:
+            function = self._function_for(resolved)
+        finally:
+            resolver.pop_scope()
+        return _fail_unless(f"{function}(instance)")
+
+    def required(self, required, schema):
+        if not required:
+            return []
+        return self._when("object", _fail_if(_missing(self, required)))
+
+    def type(self, types, schema):
+        types = _utils.ensure_list(types)
+        any_type = " or ".join(self._is(each) for each in types)
+        return _fail_unless(any_type or "False")
+
+    def uniqueItems(self, uI, schema):
+        if not uI:
+            return []
+        uniq = self._constant(_utils.uniq)
+        return self._when("array", _fail_unless(f"{uniq}(instance)"))
+
+    def _compile(self, pattern):
+        try:
+            return self._validator._patterns.compile(pattern)
+        except re.error:
+            raise _Uninlineable()
+
+    def _each_item(self, items, start=0):
+        """
+        Check each item of an array (from the given index) under a schema.
+        """
+        if items is True:
+            return []
+        function, item = self._function_for(items), self._local("item")
+        if start:
+            islice = self._constant(itertools.islice)
+            loop = f"for {item} in {islice}(instance, {start}, None):"
+        else:
+            loop = f"for {item} in instance:"
+        return [loop] + [
+            "    " + line for line in _fail_unless(f"{function}({item})")
+        ]
+
+    def _each_prefix_item(self, items):
+        """
+        Check each item of an array under the corresponding schema.
+        """
+        length, body = self._local("length"), []
+        for index, subschema in enumerate(items):
+            if subschema is True:
+                continue
+            function = self._function_for(subschema)
+            body.extend(
+                _fail_if(
+                    f"{length} > {index} "
+                    f"and not {function}(instance[{index}])",
+                ),
+            )
+        if not body:
+            return []
+        return [f"{length} = len(instance)"] + body
+
+
+def _fail_if(condition):
+    return [f"if {condition}:", "    return False"]
+
+
+def _fail_unless(condition):
+    return [f"if not ({condition}):", "    return False"]
+
+
+def _missing(generator, properties):
+    return " or ".join(
+        f"{generator._literal(each)} not in instance" for each in properties
+    )
+
+
+def _valid(instance):
+    return True
+
+
+def _invalid(instance):
+    return False
+
+
+def _in_enum(instance, enums):
+    if instance == 0 or instance == 1:
+        unbooled = _utils.unbool(instance)
+        return any(unbooled == _utils.unbool(each) for each in enums)
+    return instance in enums
+
+
+def _not_float_multiple(instance, dB):
+    quotient = instance / dB
+    try:
+        return int(quotient) != quotient
+    except OverflowError:
+        # See the corresponding comment in `_validators.multipleOf`.
+        return (Fraction(instance) / Fraction(dB)).denominator != 1
+
+
+_DYNAMIC = {_validators.dynamicRef, _legacy_validators.recursiveRef}
+
+_KEYWORDS = {
+    _legacy_validators.contains_draft6_draft7: (
+        _Generator.contains_draft6_draft7
+    ),
+    _legacy_validators.dependencies_draft4_draft6_draft7: (
+        _Generator.dependencies
+    ),
+    _legacy_validators.items_draft3_draft4: _Generator.items_draft3_draft4,
+    _legacy_validators.items_draft6_draft7_draft201909: (
+        _Generator.items_draft6_draft7_draft201909
+    ),
+    _legacy_validators.maximum_draft3_draft4: (
+        _Generator.maximum_draft3_draft4
+    ),
+    _legacy_validators.minimum_draft3_draft4: (
+        _Generator.minimum_draft3_draft4
+    ),
+    _validators.additionalItems: _Generator.additionalItems,
+    _validators.additionalProperties: _Generator.additionalProperties,
+    _validators.allOf: _Generator.allOf,
+    _validators.anyOf: _Generator.anyOf,
+    _validators.const: _Generator.const,
+    _validators.contains: _Generator.contains,
+    _validators.dependentRequired: _Generator.dependentRequired,
+    _validators.dependentSchemas: _Generator.dependentSchemas,
+    _validators.enum: _Generator.enum,
+    _validators.exclusiveMaximum: _Generator.exclusiveMaximum,
+    _validators.exclusiveMinimum: _Generator.exclusiveMinimum,
+    _validators.format: _Generator.format,
+    _validators.if_: _Generator.if_,
+    _validators.items: _Generator.items,
+    _validators.maxItems: _Generator.maxItems,
+    _validators.maxLength: _Generator.maxLength,
+    _validators.maxProperties: _Generator.maxProperties,
+    _validators.maximum: _Generator.maximum,
+    _validators.minItems: _Generator.minItems,
+    _validators.minLength: _Generator.minLength,
+    _validators.minProperties: _Generator.minProperties,
+    _validators.minimum: _Generator.minimum,
+    _validators.multipleOf: _Generator.multipleOf,
+    _validators.not_: _Generator.not_,
+    _validators.oneOf: _Generator.oneOf,
+    _validators.pattern: _Generator.pattern,
+    _validators.patternProperties: _Generator.patternProperties,
+    _validators.prefixItems: _Generator.prefixItems,
+    _validators.properties: _Generator.properties,
+    _validators.propertyNames: _Generator.propertyNames,
+    _validators.ref: _Generator.ref,
+    _validators.required: _Generator.required,
+    _validators.type: _Generator.type,
+    _validators.uniqueItems: _Generator.uniqueItems,
+}
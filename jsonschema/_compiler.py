@@ -0,0 +1,153 @@
+"""
+Compilation of schemas into trees of pre-bound keyword callables.
+
+Validating with an uncompiled validator re-discovers, for each (sub)schema
+it is asked to validate an instance under, which of the schema's keywords
+are applicable and which callable implements each one. Compilation does
+this work once for each subschema, ahead of validation.
+"""
+from jsonschema import _validators
+
+
+class _Node(object):
+    """
+    A single compiled (sub)schema.
+    """
+
+    __slots__ = (
+        "compiled",
+        "schema",
+        "scope",
+        "keywords",
+        "validators",
+        "boolean_validators",
+        "validator",
+    )
+
+    def __init__(self, compiled, schema, scope, keywords=()):
+        self.compiled = compiled
+        self.schema = schema
+        self.scope = scope
+
+        #: the applicable keywords (with their values), along with the
+        #: callable for each, and its boolean form (if it has one)
+        self.keywords = tuple((k, v) for k, v, _, _ in keywords)
+        self.validators = {k: fn for k, _, fn, _ in keywords}
+        self.boolean_validators = {
+            k: is_valid for k, _, _, is_valid in keywords
+            if is_valid is not None
+        }
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} for {self.schema!r}>"
+
+
+class Compiled(object):
+    """
+    A schema, along with each of its subschemas, compiled for a validator.
+
+    Compiled subschemas are keyed by identity, and hold a reference to
+    their schema for as long as this object lives. Subschemas which are
+    only created during validation (and are therefore unknown when
+    compiling) are compiled each time they are seen, rather than stored.
+    """
+
+    def __init__(self, validator):
+        self._validator = validator
+        self._nodes = {}
+        for schema in True, False:
+            self._nodes[id(schema)] = self._compile(schema)
+        self.add(validator.schema)
+
+    def add(self, schema):
+        """
+        Compile ``schema`` along with anything within it which may be used
+        as a subschema.
+        """
+        if id(schema) not in self._nodes:
+            self._nodes[id(schema)] = self._compile(schema)
+
+        children = list(_children(schema))
+        while children:
+            each = children.pop()
+            if isinstance(each, dict):
+                if id(each) in self._nodes:
+                    continue
+                self._nodes[id(each)] = self._compile(each)
+            children.extend(_children(each))
+
+    def validator_for(self, schema):
+        """
+        Retrieve a compiled validator for the given subschema.
+        """
+        node = self._nodes.get(id(schema))
+        if node is None:
+            node = self._compile(schema)
+        return node.validator
+
+    def _compile(self, schema):
+        if schema is True or schema is False:
+            node = _Node(compiled=self, schema=schema, scope="")
+        else:
+            node = _Node(
+                compiled=self,
+                schema=schema,
+                scope=self._validator.ID_OF(schema),
+                keywords=list(self._keywords(schema)),
+            )
+        node.validator = self._validator._frame(schema, location=None)
+        node.validator._node = node
+        return node
+
+    def _keywords(self, schema):
+        validator = self._validator
+        resolves = hasattr(validator.resolver, "resolve")
+        for k, v in validator._APPLICABLE_VALIDATORS(schema):
+            fn = validator.VALIDATORS.get(k)
+            if fn is None:
+                continue
+            is_valid = validator._BOOLEAN_VALIDATORS.get(k)
+            if fn is _validators.ref and resolves:
+                fn, is_valid = self._ref()
+            yield k, v, fn, is_valid
+
+    def _ref(self):
+        """
+        A :validator:`$ref` which resolves once for each resolution scope,
+        along with its boolean form.
+        """
+        resolved = {}
+
+        def resolve(resolver, ref):
+            scope = resolver.resolution_scope
+            target = resolved.get(scope)
+            if target is None:
+                target = resolved[scope] = resolver.resolve(ref)
+                self.add(target[1])
+            return target
+
+        def ref(validator, ref, instance, schema):
+            url, subschema = resolve(validator.resolver, ref)
+            validator.resolver.push_scope(url)
+            try:
+                yield from validator.descend(instance, subschema)
+            finally:
+                validator.resolver.pop_scope()
+
+        def is_valid(validator, ref, instance, schema):
+            url, subschema = resolve(validator.resolver, ref)
+            validator.resolver.push_scope(url)
+            try:
+                return validator._child_for(subschema).is_valid(instance)
+            finally:
+                validator.resolver.pop_scope()
+
+        return ref, is_valid
+
+
+def _children(value):
+    if isinstance(value, dict):
+        return value.values()
+    elif isinstance(value, list):
+        return value
+    return ()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from contextlib import suppress
-from uuid import UUID
 import datetime
-import ipaddress
+import functools
+import importlib
+import importlib.util
 import re
 import typing
 
@@ -63,7 +63,10 @@ class FormatChecker(object):
             raises (Exception):
 
                 The exception(s) raised by the decorated function when an
-                invalid instance is found.
+                invalid instance is found. Each may also be given by name
+                (e.g. ``"jsonpointer.JsonPointerException"``), in which
+                case its module is imported only once the decorated
+                function raises an exception.
 
                 The exception object will be accessible as the
                 `jsonschema.exceptions.ValidationError.cause` attribute of the
@@ -104,7 +107,7 @@ class FormatChecker(object):
         result, cause = None, None
         try:
             result = func(instance)
-        except raises as e:
+        except _exceptions(raises) as e:
             cause = e
         if not result:
             raise FormatError(f"{instance!r} is not a {format!r}", cause=cause)
@@ -153,6 +156,49 @@ _draft_checkers = dict(
 )
 
 
+def _exceptions(raises):
+    """
+    The exception(s) to catch, importing any given by name.
+    """
+    if isinstance(raises, str):
+        module, _, name = raises.rpartition(".")
+        return getattr(importlib.import_module(module), name)
+    elif isinstance(raises, tuple):
+        return tuple(_exceptions(each) for each in raises)
+    return raises
+
+
+def _is_installed(module):
+    """
+    Whether a module can be imported, without importing it.
+    """
+    return importlib.util.find_spec(module) is not None
+
+
+def _unless_unimportable(func):
+    """
+    Treat instances as conforming if the checker's dependency won't import.
+
+    Dependencies are found to be installed without importing them, so one
+    may nonetheless fail to import once needed (or lack something needed,
+    e.g. for a newer version of it), in which case the format is unchecked,
+    just as it would be if the dependency weren't installed at all.
+    """
+    unimportable = False
+
+    @functools.wraps(func)
+    def checker(instance):
+        nonlocal unimportable
+        if unimportable:
+            return True
+        try:
+            return func(instance)
+        except ImportError:
+            unimportable = True
+            return True
+    return checker
+
+
 def _checks_drafts(
     name=None,
     draft3=None,
@@ -214,25 +260,28 @@ def is_email(instance):
     draft7="ipv4",
     draft201909="ipv4",
     draft202012="ipv4",
-    raises=ipaddress.AddressValueError,
+    raises="ipaddress.AddressValueError",
 )
 def is_ipv4(instance):
     if not isinstance(instance, str):
         return True
+    import ipaddress
     return ipaddress.IPv4Address(instance)
 
 
-@_checks_drafts(name="ipv6", raises=ipaddress.AddressValueError)
+@_checks_drafts(name="ipv6", raises="ipaddress.AddressValueError")
 def is_ipv6(instance):
     if not isinstance(instance, str):
         return True
+    import ipaddress
     address = ipaddress.IPv6Address(instance)
     return not getattr(address, "scope_id", "")
 
 
-with suppress(ImportError):
-    from fqdn import FQDN
-
+# Formats requiring optional dependencies are checked only if they're
+# installed, but the dependencies are imported only once (and if) the
+# format is checked, rather than when jsonschema is.
+if _is_installed("fqdn"):
     @_checks_drafts(
         draft3="host-name",
         draft4="hostname",
@@ -241,63 +290,43 @@ with suppress(ImportError):
         draft201909="hostname",
         draft202012="hostname",
     )
+    @_unless_unimportable
     def is_host_name(instance):
         if not isinstance(instance, str):
             return True
+        from fqdn import FQDN
         return FQDN(instance).is_valid
 
 
-with suppress(ImportError):
-    # The built-in `idna` codec only implements RFC 3890, so we go elsewhere.
-    import idna
-
+# The built-in `idna` codec only implements RFC 3890, so we go elsewhere.
+if _is_installed("idna"):
     @_checks_drafts(
         draft7="idn-hostname",
         draft201909="idn-hostname",
         draft202012="idn-hostname",
-        raises=(idna.IDNAError, UnicodeError),
+        raises=("idna.IDNAError", UnicodeError),
     )
+    @_unless_unimportable
     def is_idn_host_name(instance):
         if not isinstance(instance, str):
             return True
+        import idna
         idna.encode(instance)
         return True
 
 
-try:
-    import rfc3987
-except ImportError:
-    with suppress(ImportError):
-        from rfc3986_validator import validate_rfc3986
-
-        @_checks_drafts(name="uri")
-        def is_uri(instance):
-            if not isinstance(instance, str):
-                return True
-            return validate_rfc3986(instance, rule="URI")
-
-        @_checks_drafts(
-            draft6="uri-reference",
-            draft7="uri-reference",
-            draft201909="uri-reference",
-            draft202012="uri-reference",
-            raises=ValueError,
-        )
-        def is_uri_reference(instance):
-            if not isinstance(instance, str):
-                return True
-            return validate_rfc3986(instance, rule="URI_reference")
-
-else:
+if _is_installed("rfc3987"):
     @_checks_drafts(
         draft7="iri",
         draft201909="iri",
         draft202012="iri",
         raises=ValueError,
     )
+    @_unless_unimportable
     def is_iri(instance):
         if not isinstance(instance, str):
             return True
+        import rfc3987
         return rfc3987.parse(instance, rule="IRI")
 
     @_checks_drafts(
@@ -306,15 +335,19 @@ else:
         draft202012="iri-reference",
         raises=ValueError,
     )
+    @_unless_unimportable
     def is_iri_reference(instance):
         if not isinstance(instance, str):
             return True
+        import rfc3987
         return rfc3987.parse(instance, rule="IRI_reference")
 
     @_checks_drafts(name="uri", raises=ValueError)
+    @_unless_unimportable
     def is_uri(instance):
         if not isinstance(instance, str):
             return True
+        import rfc3987
         return rfc3987.parse(instance, rule="URI")
 
     @_checks_drafts(
@@ -324,18 +357,43 @@ else:
         draft202012="uri-reference",
         raises=ValueError,
     )
+    @_unless_unimportable
     def is_uri_reference(instance):
         if not isinstance(instance, str):
             return True
+        import rfc3987
         return rfc3987.parse(instance, rule="URI_reference")
 
-with suppress(ImportError):
-    from rfc3339_validator import validate_rfc3339
+elif _is_installed("rfc3986_validator"):
+    @_checks_drafts(name="uri")
+    @_unless_unimportable
+    def is_uri(instance):
+        if not isinstance(instance, str):
+            return True
+        from rfc3986_validator import validate_rfc3986
+        return validate_rfc3986(instance, rule="URI")
+
+    @_checks_drafts(
+        draft6="uri-reference",
+        draft7="uri-reference",
+        draft201909="uri-reference",
+        draft202012="uri-reference",
+        raises=ValueError,
+    )
+    @_unless_unimportable
+    def is_uri_reference(instance):
+        if not isinstance(instance, str):
+            return True
+        from rfc3986_validator import validate_rfc3986
+        return validate_rfc3986(instance, rule="URI_reference")
 
+if _is_installed("rfc3339_validator"):
     @_checks_drafts(name="date-time")
+    @_unless_unimportable
     def is_datetime(instance):
         if not isinstance(instance, str):
             return True
+        from rfc3339_validator import validate_rfc3339
         return validate_rfc3339(instance.upper())
 
     @_checks_drafts(
@@ -343,6 +401,7 @@ with suppress(ImportError):
         draft201909="time",
         draft202012="time",
     )
+    @_unless_unimportable
     def is_time(instance):
         if not isinstance(instance, str):
             return True
@@ -376,15 +435,15 @@ def is_draft3_time(instance):
     return datetime.datetime.strptime(instance, "%H:%M:%S")
 
 
-with suppress(ImportError):
-    from webcolors import CSS21_NAMES_TO_HEX
-    import webcolors
-
+if _is_installed("webcolors"):
     def is_css_color_code(instance):
+        import webcolors
         return webcolors.normalize_hex(instance)
 
     @_checks_drafts(draft3="color", raises=(ValueError, TypeError))
+    @_unless_unimportable
     def is_css21_color(instance):
+        from webcolors import CSS21_NAMES_TO_HEX
         if (
             not isinstance(instance, str)
             or instance.lower() in CSS21_NAMES_TO_HEX
@@ -393,19 +452,19 @@ with suppress(ImportError):
         return is_css_color_code(instance)
 
 
-with suppress(ImportError):
-    import jsonpointer
-
+if _is_installed("jsonpointer"):
     @_checks_drafts(
         draft6="json-pointer",
         draft7="json-pointer",
         draft201909="json-pointer",
         draft202012="json-pointer",
-        raises=jsonpointer.JsonPointerException,
+        raises="jsonpointer.JsonPointerException",
     )
+    @_unless_unimportable
     def is_json_pointer(instance):
         if not isinstance(instance, str):
             return True
+        import jsonpointer
         return jsonpointer.JsonPointer(instance)
 
     # TODO: I don't want to maintain this, so it
@@ -416,13 +475,15 @@ with suppress(ImportError):
         draft7="relative-json-pointer",
         draft201909="relative-json-pointer",
         draft202012="relative-json-pointer",
-        raises=jsonpointer.JsonPointerException,
+        raises="jsonpointer.JsonPointerException",
     )
+    @_unless_unimportable
     def is_relative_json_pointer(instance):
         # Definition taken from:
         # https://tools.ietf.org/html/draft-handrews-relative-json-pointer-01#section-3
         if not isinstance(instance, str):
             return True
+        import jsonpointer
         non_negative_integer, rest = [], ""
         for i, character in enumerate(instance):
             if character.isdigit():
@@ -441,32 +502,32 @@ with suppress(ImportError):
         return (rest == "#") or jsonpointer.JsonPointer(rest)
 
 
-with suppress(ImportError):
-    import uri_template
-
+if _is_installed("uri_template"):
     @_checks_drafts(
         draft6="uri-template",
         draft7="uri-template",
         draft201909="uri-template",
         draft202012="uri-template",
     )
+    @_unless_unimportable
     def is_uri_template(instance):
         if not isinstance(instance, str):
             return True
+        import uri_template
         return uri_template.validate(instance)
 
 
-with suppress(ImportError):
-    import isoduration
-
+if _is_installed("isoduration"):
     @_checks_drafts(
         draft201909="duration",
         draft202012="duration",
-        raises=isoduration.DurationParsingException,
+        raises="isoduration.DurationParsingException",
     )
+    @_unless_unimportable
     def is_duration(instance):
         if not isinstance(instance, str):
             return True
+        import isoduration
         return isoduration.parse_duration(instance)
 
 
@@ -478,5 +539,6 @@ with suppress(ImportError):
 def is_uuid(instance):
     if not isinstance(instance, str):
         return True
+    from uuid import UUID
     UUID(instance)
     return all(instance[position] == "-" for position in (8, 13, 18, 23))
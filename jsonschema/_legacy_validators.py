@@ -40,6 +40,26 @@ def dependencies_draft3(validator, dependencies, instance, schema):
                     yield ValidationError(message)
 
 
+@_utils.is_valid_for(dependencies_draft3)
+def _dependencies_draft3(validator, dependencies, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    for property, dependency in dependencies.items():
+        if property not in instance:
+            continue
+
+        if validator.is_type(dependency, "object"):
+            if not validator._child_for(dependency).is_valid(instance):
+                return False
+        elif validator.is_type(dependency, "string"):
+            if dependency not in instance:
+                return False
+        elif not all(each in instance for each in dependency):
+            return False
+    return True
+
+
 def dependencies_draft4_draft6_draft7(
     validator,
     dependencies,
@@ -70,13 +90,47 @@ def dependencies_draft4_draft6_draft7(
             )
 
 
+@_utils.is_valid_for(dependencies_draft4_draft6_draft7)
+def _dependencies_draft4_draft6_draft7(
+    validator,
+    dependencies,
+    instance,
+    schema,
+):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    for property, dependency in dependencies.items():
+        if property not in instance:
+            continue
+
+        if validator.is_type(dependency, "array"):
+            if not all(each in instance for each in dependency):
+                return False
+        elif not validator._child_for(dependency).is_valid(instance):
+            return False
+    return True
+
+
 def disallow_draft3(validator, disallow, instance, schema):
     for disallowed in _utils.ensure_list(disallow):
-        if validator.evolve(schema={"type": [disallowed]}).is_valid(instance):
-            message = f"{disallowed!r} is disallowed for {instance!r}"
+        if validator._child_for({"type": [disallowed]}).is_valid(instance):
+            message = _utils.Message(
+                "{disallowed!r} is disallowed for {instance!r}",
+                disallowed=disallowed,
+                instance=instance,
+            )
             yield ValidationError(message)
 
 
+@_utils.is_valid_for(disallow_draft3)
+def _disallow_draft3(validator, disallow, instance, schema):
+    return not any(
+        validator._child_for({"type": [disallowed]}).is_valid(instance)
+        for disallowed in _utils.ensure_list(disallow)
+    )
+
+
 def extends_draft3(validator, extends, instance, schema):
     if validator.is_type(extends, "object"):
         yield from validator.descend(instance, extends)
@@ -85,6 +139,16 @@ def extends_draft3(validator, extends, instance, schema):
         yield from validator.descend(instance, subschema, schema_path=index)
 
 
+@_utils.is_valid_for(extends_draft3)
+def _extends_draft3(validator, extends, instance, schema):
+    if validator.is_type(extends, "object"):
+        return validator._child_for(extends).is_valid(instance)
+    return all(
+        validator._child_for(subschema).is_valid(instance)
+        for subschema in extends
+    )
+
+
 def items_draft3_draft4(validator, items, instance, schema):
     if not validator.is_type(instance, "array"):
         return
@@ -99,6 +163,20 @@ def items_draft3_draft4(validator, items, instance, schema):
             )
 
 
+@_utils.is_valid_for(items_draft3_draft4)
+def _items_draft3_draft4(validator, items, instance, schema):
+    if not validator.is_type(instance, "array"):
+        return True
+
+    if validator.is_type(items, "object"):
+        validator = validator._child_for(items)
+        return all(validator.is_valid(item) for item in instance)
+    return all(
+        validator._child_for(subschema).is_valid(item)
+        for item, subschema in zip(instance, items)
+    )
+
+
 def items_draft6_draft7_draft201909(validator, items, instance, schema):
     if not validator.is_type(instance, "array"):
         return
@@ -113,6 +191,20 @@ def items_draft6_draft7_draft201909(validator, items, instance, schema):
             yield from validator.descend(item, items, path=index)
 
 
+@_utils.is_valid_for(items_draft6_draft7_draft201909)
+def _items_draft6_draft7_draft201909(validator, items, instance, schema):
+    if not validator.is_type(instance, "array"):
+        return True
+
+    if validator.is_type(items, "array"):
+        return all(
+            validator._child_for(subschema).is_valid(item)
+            for item, subschema in zip(instance, items)
+        )
+    validator = validator._child_for(items)
+    return all(validator.is_valid(item) for item in instance)
+
+
 def minimum_draft3_draft4(validator, minimum, instance, schema):
     if not validator.is_type(instance, "number"):
         return
@@ -125,10 +217,25 @@ def minimum_draft3_draft4(validator, minimum, instance, schema):
         cmp = "less than"
 
     if failed:
-        message = f"{instance!r} is {cmp} the minimum of {minimum!r}"
+        message = _utils.Message(
+            "{instance!r} is {cmp} the minimum of {minimum!r}",
+            instance=instance,
+            cmp=cmp,
+            minimum=minimum,
+        )
         yield ValidationError(message)
 
 
+@_utils.is_valid_for(minimum_draft3_draft4)
+def _minimum_draft3_draft4(validator, minimum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+
+    if schema.get("exclusiveMinimum", False):
+        return not instance <= minimum
+    return not instance < minimum
+
+
 def maximum_draft3_draft4(validator, maximum, instance, schema):
     if not validator.is_type(instance, "number"):
         return
@@ -141,10 +248,25 @@ def maximum_draft3_draft4(validator, maximum, instance, schema):
         cmp = "greater than"
 
     if failed:
-        message = f"{instance!r} is {cmp} the maximum of {maximum!r}"
+        message = _utils.Message(
+            "{instance!r} is {cmp} the maximum of {maximum!r}",
+            instance=instance,
+            cmp=cmp,
+            maximum=maximum,
+        )
         yield ValidationError(message)
 
 
+@_utils.is_valid_for(maximum_draft3_draft4)
+def _maximum_draft3_draft4(validator, maximum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+
+    if schema.get("exclusiveMaximum", False):
+        return not instance >= maximum
+    return not instance > maximum
+
+
 def properties_draft3(validator, properties, instance, schema):
     if not validator.is_type(instance, "object"):
         return
@@ -170,6 +292,21 @@ def properties_draft3(validator, properties, instance, schema):
             yield error
 
 
+@_utils.is_valid_for(properties_draft3)
+def _properties_draft3(validator, properties, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    for property, subschema in properties.items():
+        if property in instance:
+            subvalidator = validator._child_for(subschema)
+            if not subvalidator.is_valid(instance[property]):
+                return False
+        elif subschema.get("required", False):
+            return False
+    return True
+
+
 def type_draft3(validator, types, instance, schema):
     types = _utils.ensure_list(types)
 
@@ -191,25 +328,61 @@ def type_draft3(validator, types, instance, schema):
             except Exception:
                 reprs.append(repr(type))
         yield ValidationError(
-            f"{instance!r} is not of type {', '.join(reprs)}",
+            _utils.Message(
+                "{instance!r} is not of type {reprs}",
+                instance=instance,
+                reprs=", ".join(reprs),
+            ),
             context=all_errors,
         )
 
 
+@_utils.is_valid_for(type_draft3)
+def _type_draft3(validator, types, instance, schema):
+    for type in _utils.ensure_list(types):
+        if validator.is_type(type, "object"):
+            if validator._child_for(type).is_valid(instance):
+                return True
+        elif validator.is_type(instance, type):
+            return True
+    return False
+
+
 def contains_draft6_draft7(validator, contains, instance, schema):
     if not validator.is_type(instance, "array"):
         return
 
-    if not any(
-        validator.evolve(schema=contains).is_valid(element)
-        for element in instance
-    ):
+    contains_validator = validator._child_for(contains)
+    if not any(contains_validator.is_valid(element) for element in instance):
         yield ValidationError(
-            f"None of {instance!r} are valid under the given schema",
+            _utils.Message(
+                "None of {instance!r} are valid under the given schema",
+                instance=instance,
+            ),
         )
 
 
+@_utils.is_valid_for(contains_draft6_draft7)
+def _contains_draft6_draft7(validator, contains, instance, schema):
+    if not validator.is_type(instance, "array"):
+        return True
+
+    validator = validator._child_for(contains)
+    return any(validator.is_valid(element) for element in instance)
+
+
 def recursiveRef(validator, recursiveRef, instance, schema):
+    subschema = _resolve_recursive_ref(validator, recursiveRef)
+    yield from validator.descend(instance, subschema)
+
+
+@_utils.is_valid_for(recursiveRef)
+def _recursiveRef(validator, recursiveRef, instance, schema):
+    subschema = _resolve_recursive_ref(validator, recursiveRef)
+    return validator._child_for(subschema).is_valid(instance)
+
+
+def _resolve_recursive_ref(validator, recursiveRef):
     lookup_url, target = validator.resolver.resolution_scope, validator.schema
 
     for each in reversed(validator.resolver._scopes_stack[1:]):
@@ -220,5 +393,4 @@ def recursiveRef(validator, recursiveRef, instance, schema):
             break
 
     fragment = recursiveRef.lstrip("#")
-    subschema = validator.resolver.resolve_fragment(target, fragment)
-    yield from validator.descend(instance, subschema)
+    return validator.resolver.resolve_fragment(target, fragment)
@@ -0,0 +1,462 @@
+"""
+Support for JSON Schema's (ECMA-262) dialect of regular expressions.
+
+JSON Schema patterns are ECMA-262 regular expressions, which differ from
+Python's both in syntax (e.g. ``\\p{...}`` and ``(?<name>...)``) and in
+semantics (e.g. ``\\d`` and ``\\w`` match only ASCII characters, and ``$``
+only matches at the very end of a string). Patterns are translated into
+equivalent ones for Python's `re` (or, in RE2's slightly different syntax,
+for RE2), rather than implementing a separate matcher.
+"""
+from functools import lru_cache
+import re
+import sys
+import unicodedata
+import warnings
+
+_DIGIT = "0-9"
+_WORD = "a-zA-Z0-9_"
+_SPACE = (
+    "\\t\\n\\x0b\\x0c\\r \\xa0\\u1680\\u2000-\\u200a"
+    "\\u2028\\u2029\\u202f\\u205f\\u3000\\ufeff"
+)
+_LINE_TERMINATORS = "\\n\\r\\u2028\\u2029"
+
+#: escapes for sets of characters, and whether each matches the complement
+_SETS = {
+    "d": (_DIGIT, False),
+    "D": (_DIGIT, True),
+    "w": (_WORD, False),
+    "W": (_WORD, True),
+    "s": (_SPACE, False),
+    "S": (_SPACE, True),
+}
+
+_WORD_BOUNDARY = (
+    f"(?:(?<![{_WORD}])(?=[{_WORD}])|(?<=[{_WORD}])(?![{_WORD}]))"
+)
+_NOT_WORD_BOUNDARY = (
+    f"(?:(?<![{_WORD}])(?![{_WORD}])|(?<=[{_WORD}])(?=[{_WORD}]))"
+)
+
+# Characters which are literal within ECMA-262 character classes but which
+# Python's `re` treats (or warns it will treat) specially.
+_CLASS_SPECIAL = frozenset("[&~|")
+
+_GENERAL_CATEGORIES = {
+    "C": ("Other",),
+    "Cc": ("Control", "cntrl"),
+    "Cf": ("Format",),
+    "Cn": ("Unassigned",),
+    "Co": ("Private_Use",),
+    "Cs": ("Surrogate",),
+    "L": ("Letter",),
+    "LC": ("Cased_Letter",),
+    "Ll": ("Lowercase_Letter",),
+    "Lm": ("Modifier_Letter",),
+    "Lo": ("Other_Letter",),
+    "Lt": ("Titlecase_Letter",),
+    "Lu": ("Uppercase_Letter",),
+    "M": ("Mark", "Combining_Mark"),
+    "Mc": ("Spacing_Mark",),
+    "Me": ("Enclosing_Mark",),
+    "Mn": ("Nonspacing_Mark",),
+    "N": ("Number",),
+    "Nd": ("Decimal_Number", "digit"),
+    "Nl": ("Letter_Number",),
+    "No": ("Other_Number",),
+    "P": ("Punctuation", "punct"),
+    "Pc": ("Connector_Punctuation",),
+    "Pd": ("Dash_Punctuation",),
+    "Pe": ("Close_Punctuation",),
+    "Pf": ("Final_Punctuation",),
+    "Pi": ("Initial_Punctuation",),
+    "Po": ("Other_Punctuation",),
+    "Ps": ("Open_Punctuation",),
+    "S": ("Symbol",),
+    "Sc": ("Currency_Symbol",),
+    "Sk": ("Modifier_Symbol",),
+    "Sm": ("Math_Symbol",),
+    "So": ("Other_Symbol",),
+    "Z": ("Separator",),
+    "Zl": ("Line_Separator",),
+    "Zp": ("Paragraph_Separator",),
+    "Zs": ("Space_Separator",),
+}
+_CATEGORY_NAMES = {
+    name: category
+    for category, aliases in _GENERAL_CATEGORIES.items()
+    for name in (category,) + aliases
+}
+
+
+class ECMA262Engine(object):
+    """
+    A regular expression engine for ECMA-262 patterns.
+
+    Patterns are translated into equivalent ones for Python's `re`, and
+    then compiled by the first of the given engines (objects with a
+    ``compile`` function, such as the `re` module itself) which is able
+    to compile them.
+
+    Arguments:
+
+        engines:
+
+            the engines to try compiling translated patterns with, in
+            order. If unprovided, `re` is used.
+    """
+
+    def __init__(self, *engines):
+        self.engines = engines or (re,)
+
+    def __repr__(self):
+        names = ", ".join(_name(engine) for engine in self.engines)
+        return f"<{self.__class__.__name__} ({names})>"
+
+    @classmethod
+    def linear_time(cls):
+        """
+        An engine which prefers RE2 (which matches in linear time).
+
+        RE2 is used if the ``google-re2`` package is installed, with any
+        patterns it doesn't support (those containing backreferences or
+        lookarounds, or negated character classes containing complemented
+        sets such as ``[^a\\D]``) compiled by `re` instead, as are all
+        patterns if it isn't installed.
+        """
+        try:
+            import re2
+        except ImportError:
+            return cls()
+        return cls(re2, re)
+
+    def compile(self, pattern):
+        """
+        Compile a pattern with the first engine which is able to.
+
+        A warning is issued for each engine which unexpectedly fails to
+        compile the pattern (when a later one does), since patterns are
+        then e.g. matched without RE2's linear time guarantee.
+        """
+        translated = translate(pattern)
+        *engines, last = self.engines
+        failures = []
+        for engine in engines:
+            try:
+                compiled = _compile(engine, pattern, translated)
+            except _Unsupported:
+                continue
+            except Exception as error:
+                failures.append((engine, error))
+                continue
+            break
+        else:
+            compiled = _compile(last, pattern, translated)
+
+        for engine, error in failures:
+            warnings.warn(
+                f"{_name(engine)} failed to compile {pattern!r} ({error}), "
+                "so a later engine was used instead",
+                stacklevel=2,
+            )
+        return compiled
+
+
+class _Unsupported(re.error):
+    """
+    A pattern uses something RE2 doesn't support (e.g. a backreference).
+    """
+
+
+def _name(engine):
+    return getattr(engine, "__name__", repr(engine))
+
+
+def _compile(engine, pattern, translated):
+    """
+    Compile a pattern with an engine, given its translation for `re`.
+    """
+    if _name(engine) != "re2":
+        return engine.compile(translated)
+    options = engine.Options()
+    options.log_errors = False  # rather than writing them to stderr
+    return engine.compile(_translate(pattern, for_re2=True), options)
+
+
+def translate(pattern):
+    """
+    Translate an ECMA-262 regular expression into one for Python's `re`.
+
+    Raises:
+
+        re.error:
+
+            if the pattern uses unsupported (or invalid) escapes
+    """
+    return _translate(pattern, for_re2=False)
+
+
+def _translate(pattern, for_re2):
+    """
+    Translate an ECMA-262 regular expression for `re`, or for RE2.
+
+    RE2's syntax mostly matches `re`'s, but it doesn't support lookarounds
+    or backreferences (raising `_Unsupported` for patterns needing them),
+    spells code point escapes ``\\x{...}`` and the end of a string ``\\z``,
+    and has ASCII (i.e. ECMA-262) word boundaries.
+    """
+    translated = []
+    index, end = 0, len(pattern)
+    while index < end:
+        char = pattern[index]
+        index += 1
+        if char == "\\":
+            if index == end:
+                raise re.error("pattern ends with a backslash", pattern, end)
+            escape = pattern[index]
+            if escape in _SETS:
+                characters, complement = _SETS[escape]
+                translated.append(_set(characters, complement))
+                index += 1
+            elif escape in "pP":
+                characters, index = _property(pattern, index + 1)
+                translated.append(_set(characters, escape == "P"))
+            elif escape in "bB":
+                if for_re2:
+                    translated.append("\\" + escape)
+                elif escape == "b":
+                    translated.append(_WORD_BOUNDARY)
+                else:
+                    translated.append(_NOT_WORD_BOUNDARY)
+                index += 1
+            elif escape == "k" and pattern.startswith("<", index + 1):
+                close = pattern.find(">", index)
+                if close == -1:
+                    raise re.error("unterminated group name", pattern, index)
+                elif for_re2:
+                    raise _Unsupported("backreference", pattern, index)
+                translated.append(f"(?P={pattern[index + 2:close]})")
+                index = close + 1
+            else:
+                character, index = _character_escape(pattern, index, for_re2)
+                translated.append(character)
+        elif char == "[":
+            character_class, index = _class(pattern, index, for_re2)
+            translated.append(character_class)
+        elif char == ".":
+            translated.append(f"[^{_LINE_TERMINATORS}]")
+        elif char == "$":
+            translated.append("\\Z")
+        elif char == "(" and pattern.startswith("?<", index):
+            if not pattern.startswith(("?<=", "?<!"), index):
+                translated.append("(?P<")
+                index += 2
+            elif for_re2:
+                raise _Unsupported("lookbehind", pattern, index)
+            else:
+                translated.append(char)
+        elif char == "(" and pattern.startswith(("?=", "?!"), index):
+            if for_re2:
+                raise _Unsupported("lookahead", pattern, index)
+            translated.append(char)
+        else:
+            translated.append(char)
+
+    translated = "".join(translated)
+    if for_re2:
+        return _PYTHON_ESCAPE.sub(_re2_escape, translated)
+    return translated
+
+
+# the escapes of Python's which RE2 spells differently, along with any
+# other escape (so that e.g. an escaped backslash preceding a u is skipped)
+_PYTHON_ESCAPE = re.compile(
+    r"\\(?:u([0-9a-fA-F]{4})|U([0-9a-fA-F]{8})|(Z)|.)", re.DOTALL,
+)
+
+
+def _re2_escape(match):
+    codepoint = match.group(1) or match.group(2)
+    if codepoint is not None:
+        return f"\\x{{{int(codepoint, 16):x}}}"
+    elif match.group(3):
+        return "\\z"
+    return match.group(0)
+
+
+def _set(characters, complement):
+    return f"[^{characters}]" if complement else f"[{characters}]"
+
+
+def _character_escape(pattern, index, for_re2=False):
+    """
+    Translate an escape (just past its backslash) for a single character.
+    """
+    escape = pattern[index]
+    if for_re2 and escape in "123456789":
+        raise _Unsupported("backreference", pattern, index)
+    if escape == "c" and pattern[index + 1:index + 2].isalpha():
+        return f"\\x{ord(pattern[index + 1]) % 32:02x}", index + 2
+    elif escape == "u" and pattern.startswith("{", index + 1):
+        close = pattern.find("}", index)
+        if close == -1:
+            raise re.error("unterminated unicode escape", pattern, index)
+        try:
+            codepoint = int(pattern[index + 2:close], 16)
+        except ValueError:
+            raise re.error("invalid unicode escape", pattern, index)
+        return f"\\U{codepoint:08x}", close + 1
+    elif escape == "/":
+        return "/", index + 1
+    return "\\" + escape, index + 1
+
+
+def _property(pattern, index):
+    """
+    Find the characters for a ``\\p{...}`` escape (just past its ``p``).
+    """
+    if not pattern.startswith("{", index):
+        raise re.error("invalid property escape", pattern, index)
+    close = pattern.find("}", index)
+    if close == -1:
+        raise re.error("unterminated property escape", pattern, index)
+
+    name = pattern[index + 1:close]
+    property, _, value = name.rpartition("=")
+    if property not in {"", "General_Category", "gc"}:
+        raise re.error(f"unsupported property {name!r}", pattern, index)
+
+    if value == "Any":
+        characters = _ranges([(0, sys.maxunicode)])
+    elif value == "ASCII":
+        characters = _ranges([(0, 0x7F)])
+    elif value in _CATEGORY_NAMES:
+        characters = _category(_CATEGORY_NAMES[value])
+    else:
+        raise re.error(f"unknown property {name!r}", pattern, index)
+    return characters, close + 1
+
+
+def _class(pattern, index, for_re2=False):
+    """
+    Translate a character class (just past its opening bracket).
+    """
+    negated = pattern.startswith("^", index)
+    if negated:
+        index += 1
+
+    characters, complements = [], []
+    end = len(pattern)
+    while True:
+        if index == end:
+            raise re.error("unterminated character set", pattern, index)
+        char = pattern[index]
+        index += 1
+        if char == "]":
+            break
+        elif char == "\\":
+            if index == end:
+                raise re.error("pattern ends with a backslash", pattern, end)
+            escape = pattern[index]
+            if escape in _SETS:
+                set_characters, complement = _SETS[escape]
+                index += 1
+            elif escape in "pP":
+                set_characters, index = _property(pattern, index + 1)
+                complement = escape == "P"
+            else:
+                if escape == "b":
+                    characters.append("\\x08")
+                    index += 1
+                else:
+                    character, index = _character_escape(
+                        pattern, index, for_re2,
+                    )
+                    characters.append(character)
+                continue
+
+            if complement:
+                complements.append(set_characters)
+            else:
+                characters.append(set_characters)
+        elif char in _CLASS_SPECIAL:
+            characters.append("\\" + char)
+        else:
+            characters.append(char)
+
+    body = "".join(characters)
+    if not complements:
+        if not body:
+            if negated:
+                return "[\\s\\S]", index
+            return ("[^\\x00-\\U0010ffff]" if for_re2 else "(?!)"), index
+        return ("[^" if negated else "[") + body + "]", index
+
+    # Python's classes can't contain complemented sets (e.g. [a\D]), so
+    # express them as unions (or, when negated, as intersections) instead.
+    if negated:
+        if for_re2:
+            raise _Unsupported("complemented set", pattern, index)
+        *lookaheads, last = complements
+        parts = [f"(?![{body}])"] if body else []
+        parts.extend(f"(?=[{each}])" for each in lookaheads)
+        parts.append(f"[{last}]")
+        return "(?:" + "".join(parts) + ")", index
+
+    parts = [f"[{body}]"] if body else []
+    parts.extend(f"[^{each}]" for each in complements)
+    return "(?:" + "|".join(parts) + ")", index
+
+
+@lru_cache(maxsize=None)
+def _category(category):
+    """
+    The characters in a Unicode general category, as a character class body.
+    """
+    if category == "LC":
+        subcategories = ["Lu", "Ll", "Lt"]
+    else:
+        subcategories = [
+            each for each in _codepoints_by_category()
+            if each.startswith(category)
+        ]
+
+    ranges = sorted(
+        each
+        for subcategory in subcategories
+        for each in _codepoints_by_category()[subcategory]
+    )
+    merged = ranges[:1]
+    for start, end in ranges[1:]:
+        if start == merged[-1][1] + 1:
+            merged[-1] = merged[-1][0], end
+        else:
+            merged.append((start, end))
+    return _ranges(merged)
+
+
+@lru_cache(maxsize=None)
+def _codepoints_by_category():
+    """
+    The ranges of codepoints in each two-letter Unicode general category.
+
+    Found in a single pass over all codepoints (the first time any property
+    escape is used) rather than once per category.
+    """
+    by_category = {}
+    start, current = 0, unicodedata.category(chr(0))
+    for codepoint in range(1, sys.maxunicode + 1):
+        category = unicodedata.category(chr(codepoint))
+        if category != current:
+            by_category.setdefault(current, []).append((start, codepoint - 1))
+            start, current = codepoint, category
+    by_category.setdefault(current, []).append((start, sys.maxunicode))
+    return by_category
+
+
+def _ranges(ranges):
+    return "".join(
+        f"\\U{start:08x}" if start == end else f"\\U{start:08x}-\\U{end:08x}"
+        for start, end in ranges
+    )
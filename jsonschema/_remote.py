@@ -0,0 +1,170 @@
+"""
+Retrieval of remote schemas, cached persistently.
+"""
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class DiskCache(object):
+    """
+    Retrieve schemas over HTTP(S), caching them within a directory.
+
+    A cache is used as a `RefResolver` handler for the ``http`` and
+    ``https`` schemes, and can be shared by any number of resolvers (or
+    processes), e.g.:
+
+    .. code-block:: python
+
+        cache = DiskCache("~/.cache/schemas")
+        resolver = RefResolver.from_schema(
+            schema, handlers={"http": cache, "https": cache},
+        )
+
+    Cached schemas are used as-is for as long as their server said they
+    could be (via the ``max-age`` of their ``Cache-Control`` header).
+    After that, they're revalidated with a conditional request (using
+    their ``ETag`` or ``Last-Modified`` header), and are retrieved again
+    only if they've changed. If retrieving them fails, stale schemas are
+    used rather than failing.
+
+    Arguments:
+
+        directory (str):
+
+            the directory to cache schemas within, which is created if
+            it doesn't exist
+
+        offline (bool):
+
+            whether to use only the schemas already cached (regardless
+            of whether they are stale), never retrieving any
+    """
+
+    def __init__(self, directory, offline=False):
+        self.directory = os.path.expanduser(directory)
+        self.offline = offline
+
+    def __repr__(self):
+        offline = ", offline" if self.offline else ""
+        return f"<{self.__class__.__name__} {self.directory!r}{offline}>"
+
+    def __call__(self, uri):
+        path = self._path_of(uri)
+        cached = self._load(path, uri)
+        if cached is not None and (
+            self.offline or cached["expires"] > time.time()
+        ):
+            return cached["document"]
+        elif self.offline:
+            raise LookupError(
+                f"{uri!r} is not cached, and retrieval is disabled.",
+            )
+
+        request = Request(uri)
+        if cached is not None:
+            if cached["etag"] is not None:
+                request.add_header("If-None-Match", cached["etag"])
+            if cached["last_modified"] is not None:
+                request.add_header(
+                    "If-Modified-Since", cached["last_modified"],
+                )
+
+        try:
+            response = urlopen(request)
+        except HTTPError as error:
+            if cached is None:
+                raise
+            elif error.code != 304:
+                return cached["document"]
+            headers, document = error.headers, cached["document"]
+        except OSError:
+            if cached is None:
+                raise
+            return cached["document"]
+        else:
+            with response:
+                headers = response.headers
+                charset = headers.get_content_charset("utf-8")
+                document = json.loads(response.read().decode(charset))
+
+        max_age = _max_age(headers)
+        if max_age is None:
+            if cached is not None:
+                # another process may have removed it already
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+            return document
+
+        if cached is None:
+            cached = dict(etag=None, last_modified=None)
+        self._save(
+            path,
+            uri=uri,
+            document=document,
+            etag=headers.get("ETag", cached["etag"]),
+            last_modified=headers.get(
+                "Last-Modified", cached["last_modified"],
+            ),
+            expires=time.time() + max_age,
+        )
+        return document
+
+    def _path_of(self, uri):
+        name = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".json")
+
+    def _load(self, path, uri):
+        try:
+            with open(path, encoding="utf-8") as file:
+                cached = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if cached.get("uri") != uri:
+            return None
+        return cached
+
+    def _save(self, path, **entry):
+        # the document has already been retrieved, so failing to cache it
+        # (e.g. in a read-only or full directory) only means retrieving it
+        # again next time
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # written to a temporary file first so that concurrent readers
+            # never see a partially written entry
+            fd, temporary = tempfile.mkstemp(
+                dir=self.directory, suffix=".tmp",
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(temporary, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(temporary)
+
+
+def _max_age(headers):
+    """
+    How long (in seconds) a response may be used, or None if not at all.
+    """
+    directives = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    elif "no-cache" in directives:
+        return 0
+    try:
+        return max(int(directives.get("max-age", 0)), 0)
+    except ValueError:
+        return 0
@@ -1,10 +1,14 @@
-from collections import deque
+from collections import ChainMap, OrderedDict, deque
 from collections.abc import Mapping, MutableMapping, Sequence
+from functools import lru_cache
 from urllib.parse import urlsplit
 import itertools
 import json
 import re
+import reprlib
+import string
 import sys
+import threading
 
 # The files() API was added in Python 3.9.
 if sys.version_info >= (3, 9):  # pragma: no cover
@@ -13,25 +17,52 @@ else:  # pragma: no cover
     import importlib_resources as resources  # type: ignore
 
 
+@lru_cache(maxsize=1024)
+def _normalized(uri):
+    return urlsplit(uri).geturl()
+
+
 class URIDict(MutableMapping):
     """
     Dictionary which uses normalized URIs as keys.
+
+    Normalizing is memoized, and looking up a URI which is already
+    normalized (as any URI retrieved from the dictionary itself is) skips
+    it entirely.
     """
 
     def normalize(self, uri):
-        return urlsplit(uri).geturl()
+        return _normalized(uri)
 
     def __init__(self, *args, **kwargs):
         self.store = dict()
         self.store.update(*args, **kwargs)
 
+    @classmethod
+    def overlaying(cls, base):
+        """
+        Create a URIDict initially containing the contents of another.
+
+        Rather than being copied, ``base`` is shared (and must therefore
+        not be modified) until a URI is deleted from the new URIDict,
+        so creating one takes constant time however large ``base`` is.
+        """
+        uridict = cls()
+        uridict.store = ChainMap(uridict.store, base.store)
+        return uridict
+
     def __getitem__(self, uri):
-        return self.store[self.normalize(uri)]
+        try:
+            return self.store[uri]
+        except KeyError:
+            return self.store[self.normalize(uri)]
 
     def __setitem__(self, uri, value):
         self.store[self.normalize(uri)] = value
 
     def __delitem__(self, uri):
+        if isinstance(self.store, ChainMap):
+            self.store = dict(self.store)
         del self.store[self.normalize(uri)]
 
     def __iter__(self):
@@ -41,7 +72,7 @@ class URIDict(MutableMapping):
         return len(self.store)
 
     def __repr__(self):
-        return repr(self.store)
+        return repr(dict(self.store))
 
 
 class Unset(object):
@@ -53,6 +84,197 @@ class Unset(object):
         return "<unset>"
 
 
+class Location(object):
+    """
+    A location within an instance, and within the schema validating it.
+
+    Locations are immutable and point at their parent, so descending into
+    a subschema creates a location holding only the part of each path it
+    adds, and errors can note where they occurred without assembling
+    their paths until (and unless) the paths are actually needed.
+    """
+
+    __slots__ = ("parent", "path", "schema_path")
+
+    def __init__(self, parent, path=(), schema_path=()):
+        self.parent = parent
+        self.path = path
+        self.schema_path = schema_path
+
+    def __repr__(self):
+        path, schema_path = self.paths()
+        return f"<Location path={path!r} schema_path={schema_path!r}>"
+
+    def paths(self):
+        """
+        The full instance and schema paths leading to this location.
+        """
+        path, schema_path = deque(), deque()
+        location = self
+        while location is not None:
+            path.extendleft(reversed(location.path))
+            schema_path.extendleft(reversed(location.schema_path))
+            location = location.parent
+        return path, schema_path
+
+
+_MAX_SEARCHED_SCHEMAS = 128
+
+
+class Patterns(object):
+    """
+    A bounded cache of compiled regular expressions.
+
+    `re` keeps a cache of compiled patterns itself, but only a small one,
+    so validating against more patterns than it holds otherwise recompiles
+    each of them every time it's used.
+
+    Patterns are compiled by ``engine``, which is any object with a
+    ``compile`` function (by default the `re` module itself), and the least
+    recently used is evicted once ``maxsize`` are cached.
+    """
+
+    def __init__(self, engine=re, maxsize=4096):
+        self.engine = engine
+        self.maxsize = maxsize
+        self._compiled = OrderedDict()
+        self._within = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<Patterns ({len(self._compiled)} compiled)>"
+
+    def compile(self, pattern):
+        """
+        Retrieve the compiled form of ``pattern``, compiling it if needed.
+        """
+        compiled = self._compiled.get(pattern)
+        if compiled is None:
+            compiled = self.engine.compile(pattern)
+            with self._lock:
+                self._compiled[pattern] = compiled
+                if len(self._compiled) > self.maxsize:
+                    self._compiled.popitem(last=False)
+        else:
+            try:
+                self._compiled.move_to_end(pattern)
+            except KeyError:  # evicted by another thread meanwhile
+                pass
+        return compiled
+
+    def compile_within(self, schema):
+        """
+        Compile each pattern found within ``schema`` (see `find_patterns`).
+
+        The most recent schemas searched (which are identified by identity,
+        and kept alive so that it isn't reused) aren't searched again.
+        """
+        with self._lock:
+            if id(schema) in self._within:
+                self._within.move_to_end(id(schema))
+                return
+        for pattern in find_patterns(schema):
+            self.compile(pattern)
+        with self._lock:
+            self._within[id(schema)] = schema
+            if len(self._within) > _MAX_SEARCHED_SCHEMAS:
+                self._within.popitem(last=False)
+
+    def search(self, pattern, string):
+        return self.compile(pattern).search(string)
+
+
+def exceeds(instance, size):
+    """
+    Check whether an instance has more than ``size`` values within it.
+
+    The instance itself, and each item or property value of any array or
+    object within it, counts as a value. Values are counted only until
+    there are more than ``size``, so this is quick even for huge instances.
+    """
+    count, stack = 1, [instance]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            value = value.values()
+        elif not isinstance(value, list):
+            continue
+        count += len(value)
+        if count > size:
+            return True
+        stack.extend(value)
+    return count > size
+
+
+class Message(object):
+    """
+    An error message, rendered only once it's needed.
+
+    Messages are `str.format` templates whose ``!r`` conversions use the
+    repr they're rendered with, so that (possibly huge) instances aren't
+    repr'ed at all unless the message is looked at, and can be abbreviated
+    when it is.
+    """
+
+    __slots__ = ("template", "fields")
+
+    def __init__(self, template, **fields):
+        self.template = template
+        self.fields = fields
+
+    def __repr__(self):
+        return f"<Message {self.template!r}>"
+
+    def render(self, repr=repr):
+        """
+        Render this message, using the given repr for ``!r`` conversions.
+        """
+        formatter = _MessageFormatter(repr)
+        return formatter.vformat(self.template, (), self.fields)
+
+
+class _AbbreviatingRepr(reprlib.Repr):
+    """
+    A repr which abbreviates only large values, such as huge instances.
+
+    Its limits are generous enough that typical values are repr'ed in
+    full (and, unlike with `reprlib.Repr` itself, dicts keep their order).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.maxlevel = 10
+        self.maxtuple = self.maxlist = self.maxarray = self.maxdict = 100
+        self.maxset = self.maxfrozenset = self.maxdeque = 100
+        self.maxstring = self.maxlong = self.maxother = 1000
+
+    def repr_dict(self, x, level):
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        pieces = [
+            f"{self.repr1(k, level - 1)}: {self.repr1(v, level - 1)}"
+            for k, v in itertools.islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+abbreviated_repr = _AbbreviatingRepr().repr
+
+
+class _MessageFormatter(string.Formatter):
+    def __init__(self, repr):
+        self.repr = repr
+
+    def convert_field(self, value, conversion):
+        if conversion == "r":
+            return self.repr(value)
+        return super().convert_field(value, conversion)
+
+
 def load_schema(name):
     """
     Load a schema from ./schemas/``name``.json and return it.
@@ -63,6 +285,40 @@ def load_schema(name):
     return json.loads(data)
 
 
+_BOOLEAN_FORMS = {}
+
+
+def is_valid_for(keyword):
+    """
+    Register the decorated function as the boolean form of a keyword.
+
+    The boolean form takes the same arguments as the keyword function it
+    is registered for, but rather than yielding errors, simply returns
+    whether the instance is valid, which lets ``is_valid`` avoid creating
+    errors only to throw them away.
+    """
+
+    def _is_valid_for(fn):
+        _BOOLEAN_FORMS[keyword] = fn
+        return fn
+    return _is_valid_for
+
+
+def boolean_forms(validators):
+    """
+    The registered boolean forms of (some of) the given keyword functions.
+
+    Only the very functions they were registered for have them, so that,
+    e.g., wrapping a keyword function to add to what it checks doesn't
+    leave its boolean form checking only what the original did.
+    """
+    return {
+        k: _BOOLEAN_FORMS[fn]
+        for k, fn in dict(validators).items()
+        if fn in _BOOLEAN_FORMS
+    }
+
+
 def format_as_index(container, indices):
     """
     Construct a single string containing indexing operations for the indices.
@@ -85,7 +341,7 @@ def format_as_index(container, indices):
     return f"{container}[{']['.join(repr(index) for index in indices)}]"
 
 
-def find_additional_properties(instance, schema):
+def find_additional_properties(validator, instance, schema):
     """
     Return the set of additional properties for the given ``instance``.
 
@@ -96,14 +352,81 @@ def find_additional_properties(instance, schema):
     """
 
     properties = schema.get("properties", {})
-    patterns = "|".join(schema.get("patternProperties", {}))
+    patterns = [
+        validator._patterns.compile(pattern)
+        for pattern in schema.get("patternProperties", {})
+    ]
     for property in instance:
         if property not in properties:
-            if patterns and re.search(patterns, property):
+            if any(pattern.search(property) for pattern in patterns):
                 continue
             yield property
 
 
+_SUBSCHEMA_KEYWORDS = frozenset(
+    [
+        "additionalItems",
+        "additionalProperties",
+        "allOf",
+        "anyOf",
+        "contains",
+        "else",
+        "extends",
+        "if",
+        "items",
+        "not",
+        "oneOf",
+        "prefixItems",
+        "propertyNames",
+        "then",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    ],
+)
+_SUBSCHEMA_MAPPING_KEYWORDS = frozenset(
+    [
+        "$defs",
+        "definitions",
+        "dependencies",
+        "dependentSchemas",
+        "patternProperties",
+        "properties",
+    ],
+)
+
+
+def find_patterns(schema):
+    """
+    Find the regular expressions used within ``schema`` and its subschemas.
+
+    These are the values of ``pattern`` and keys of ``patternProperties``.
+    Referenced schemas aren't looked within (unless they're also found as
+    subschemas of ``schema``).
+    """
+
+    schemas = [schema]
+    while schemas:
+        schema = schemas.pop()
+        if not isinstance(schema, dict):
+            continue
+
+        pattern = schema.get("pattern")
+        if isinstance(pattern, str):
+            yield pattern
+
+        for keyword, value in schema.items():
+            if keyword in _SUBSCHEMA_KEYWORDS:
+                if isinstance(value, list):
+                    schemas.extend(value)
+                else:
+                    schemas.append(value)
+            elif keyword in _SUBSCHEMA_MAPPING_KEYWORDS:
+                if isinstance(value, dict):
+                    if keyword == "patternProperties":
+                        yield from value
+                    schemas.extend(value.values())
+
+
 def extras_msg(extras):
     """
     Create an error message for extra items or properties.
@@ -233,7 +556,7 @@ def find_evaluated_item_indexes_by_schema(validator, instance, schema):
         evaluated_indexes += list(range(0, len(schema["prefixItems"])))
 
     if "if" in schema:
-        if validator.evolve(schema=schema["if"]).is_valid(instance):
+        if validator._child_for(schema["if"]).is_valid(instance):
             evaluated_indexes += find_evaluated_item_indexes_by_schema(
                 validator, instance, schema["if"],
             )
@@ -249,15 +572,15 @@ def find_evaluated_item_indexes_by_schema(validator, instance, schema):
 
     for keyword in ["contains", "unevaluatedItems"]:
         if keyword in schema:
+            subvalidator = validator._child_for(schema[keyword])
             for k, v in enumerate(instance):
-                if validator.evolve(schema=schema[keyword]).is_valid(v):
+                if subvalidator.is_valid(v):
                     evaluated_indexes.append(k)
 
     for keyword in ["allOf", "oneOf", "anyOf"]:
         if keyword in schema:
             for subschema in schema[keyword]:
-                errs = list(validator.descend(instance, subschema))
-                if not errs:
+                if validator._child_for(subschema).is_valid(instance):
                     evaluated_indexes += find_evaluated_item_indexes_by_schema(
                         validator, instance, subschema,
                     )
@@ -293,25 +616,26 @@ def find_evaluated_property_keys_by_schema(validator, instance, schema):
     ]:
         if keyword in schema:
             if validator.is_type(schema[keyword], "boolean"):
+                subvalidator = validator._child_for(schema[keyword])
                 for property, value in instance.items():
-                    if validator.evolve(schema=schema[keyword]).is_valid(
-                        {property: value},
-                    ):
+                    if subvalidator.is_valid({property: value}):
                         evaluated_keys.append(property)
 
             if validator.is_type(schema[keyword], "object"):
                 for property, subschema in schema[keyword].items():
-                    if property in instance and validator.evolve(
-                        schema=subschema,
+                    if property in instance and validator._child_for(
+                        subschema,
                     ).is_valid(instance[property]):
                         evaluated_keys.append(property)
 
     if "patternProperties" in schema:
+        subvalidator = validator._child_for(schema["patternProperties"])
+        search = validator._patterns.search
         for property, value in instance.items():
             for pattern, _ in schema["patternProperties"].items():
-                if re.search(pattern, property) and validator.evolve(
-                    schema=schema["patternProperties"],
-                ).is_valid({property: value}):
+                if search(pattern, property) and subvalidator.is_valid(
+                    {property: value},
+                ):
                     evaluated_keys.append(property)
 
     if "dependentSchemas" in schema:
@@ -325,14 +649,13 @@ def find_evaluated_property_keys_by_schema(validator, instance, schema):
     for keyword in ["allOf", "oneOf", "anyOf"]:
         if keyword in schema:
             for subschema in schema[keyword]:
-                errs = list(validator.descend(instance, subschema))
-                if not errs:
+                if validator._child_for(subschema).is_valid(instance):
                     evaluated_keys += find_evaluated_property_keys_by_schema(
                         validator, instance, subschema,
                     )
 
     if "if" in schema:
-        if validator.evolve(schema=schema["if"]).is_valid(instance):
+        if validator._child_for(schema["if"]).is_valid(instance):
             evaluated_keys += find_evaluated_property_keys_by_schema(
                 validator, instance, schema["if"],
             )
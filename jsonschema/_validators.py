@@ -2,7 +2,9 @@ from fractions import Fraction
 from urllib.parse import urldefrag, urljoin
 import re
 
+from jsonschema._format import is_regex
 from jsonschema._utils import (
+    Message,
     dynamic_anchor_extender,
     ensure_list,
     equal,
@@ -10,6 +12,7 @@ from jsonschema._utils import (
     find_additional_properties,
     find_evaluated_item_indexes_by_schema,
     find_evaluated_property_keys_by_schema,
+    is_valid_for,
     unbool,
     uniq,
 )
@@ -21,13 +24,27 @@ def patternProperties(validator, patternProperties, instance, schema):
         return
 
     for pattern, subschema in patternProperties.items():
+        search = validator._patterns.compile(pattern).search
         for k, v in instance.items():
-            if re.search(pattern, k):
+            if search(k):
                 yield from validator.descend(
                     v, subschema, path=k, schema_path=pattern,
                 )
 
 
+@is_valid_for(patternProperties)
+def _patternProperties(validator, patternProperties, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    return all(
+        validator._child_for(subschema).is_valid(v)
+        for pattern, subschema in patternProperties.items()
+        for k, v in instance.items()
+        if validator._patterns.search(pattern, k)
+    )
+
+
 def propertyNames(validator, propertyNames, instance, schema):
     if not validator.is_type(instance, "object"):
         return
@@ -36,11 +53,20 @@ def propertyNames(validator, propertyNames, instance, schema):
         yield from validator.descend(instance=property, schema=propertyNames)
 
 
+@is_valid_for(propertyNames)
+def _propertyNames(validator, propertyNames, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    validator = validator._child_for(propertyNames)
+    return all(validator.is_valid(property) for property in instance)
+
+
 def additionalProperties(validator, aP, instance, schema):
     if not validator.is_type(instance, "object"):
         return
 
-    extras = set(find_additional_properties(instance, schema))
+    extras = set(find_additional_properties(validator, instance, schema))
 
     if validator.is_type(aP, "object"):
         for extra in extras:
@@ -63,6 +89,21 @@ def additionalProperties(validator, aP, instance, schema):
             yield ValidationError(error % extras_msg(extras))
 
 
+@is_valid_for(additionalProperties)
+def _additionalProperties(validator, aP, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    extras = find_additional_properties(validator, instance, schema)
+
+    if validator.is_type(aP, "object"):
+        validator = validator._child_for(aP)
+        return all(validator.is_valid(instance[extra]) for extra in extras)
+    elif not aP:
+        return next(extras, None) is None
+    return True
+
+
 def items(validator, items, instance, schema):
     if not validator.is_type(instance, "array"):
         return
@@ -81,6 +122,22 @@ def items(validator, items, instance, schema):
             )
 
 
+@is_valid_for(items)
+def _items(validator, items, instance, schema):
+    if not validator.is_type(instance, "array"):
+        return True
+
+    prefix = len(schema.get("prefixItems", []))
+    if items is False:
+        return len(instance) <= prefix
+
+    validator = validator._child_for(items)
+    return all(
+        validator.is_valid(instance[index])
+        for index in range(prefix, len(instance))
+    )
+
+
 def additionalItems(validator, aI, instance, schema):
     if (
         not validator.is_type(instance, "array")
@@ -99,9 +156,31 @@ def additionalItems(validator, aI, instance, schema):
         )
 
 
+@is_valid_for(additionalItems)
+def _additionalItems(validator, aI, instance, schema):
+    if (
+        not validator.is_type(instance, "array")
+        or validator.is_type(schema.get("items", {}), "object")
+    ):
+        return True
+
+    len_items = len(schema.get("items", []))
+    if validator.is_type(aI, "object"):
+        validator = validator._child_for(aI)
+        return all(validator.is_valid(item) for item in instance[len_items:])
+    elif not aI:
+        return len(instance) <= len_items
+    return True
+
+
 def const(validator, const, instance, schema):
     if not equal(instance, const):
-        yield ValidationError(f"{const!r} was expected")
+        yield ValidationError(Message("{const!r} was expected", const=const))
+
+
+@is_valid_for(const)
+def _const(validator, const, instance, schema):
+    return equal(instance, const)
 
 
 def contains(validator, contains, instance, schema):
@@ -112,8 +191,9 @@ def contains(validator, contains, instance, schema):
     min_contains = schema.get("minContains", 1)
     max_contains = schema.get("maxContains", len(instance))
 
+    contains_validator = validator._child_for(contains)
     for each in instance:
-        if validator.evolve(schema=contains).is_valid(each):
+        if contains_validator.is_valid(each):
             matches += 1
             if matches > max_contains:
                 yield ValidationError(
@@ -127,8 +207,11 @@ def contains(validator, contains, instance, schema):
     if matches < min_contains:
         if not matches:
             yield ValidationError(
-                f"{instance!r} does not contain items "
-                "matching the given schema",
+                Message(
+                    "{instance!r} does not contain items "
+                    "matching the given schema",
+                    instance=instance,
+                ),
             )
         else:
             yield ValidationError(
@@ -139,49 +222,122 @@ def contains(validator, contains, instance, schema):
             )
 
 
+@is_valid_for(contains)
+def _contains(validator, contains, instance, schema):
+    if not validator.is_type(instance, "array"):
+        return True
+
+    matches = 0
+    min_contains = schema.get("minContains", 1)
+    max_contains = schema.get("maxContains", len(instance))
+
+    validator = validator._child_for(contains)
+    for each in instance:
+        if validator.is_valid(each):
+            matches += 1
+            if matches > max_contains:
+                return False
+    return matches >= min_contains
+
+
 def exclusiveMinimum(validator, minimum, instance, schema):
     if not validator.is_type(instance, "number"):
         return
 
     if instance <= minimum:
         yield ValidationError(
-            f"{instance!r} is less than or equal to "
-            f"the minimum of {minimum!r}",
+            Message(
+                "{instance!r} is less than or equal to "
+                "the minimum of {minimum!r}",
+                instance=instance,
+                minimum=minimum,
+            ),
         )
 
 
+@is_valid_for(exclusiveMinimum)
+def _exclusiveMinimum(validator, minimum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+    return not instance <= minimum
+
+
 def exclusiveMaximum(validator, maximum, instance, schema):
     if not validator.is_type(instance, "number"):
         return
 
     if instance >= maximum:
         yield ValidationError(
-            f"{instance!r} is greater than or equal "
-            f"to the maximum of {maximum!r}",
+            Message(
+                "{instance!r} is greater than or equal "
+                "to the maximum of {maximum!r}",
+                instance=instance,
+                maximum=maximum,
+            ),
         )
 
 
+@is_valid_for(exclusiveMaximum)
+def _exclusiveMaximum(validator, maximum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+    return not instance >= maximum
+
+
 def minimum(validator, minimum, instance, schema):
     if not validator.is_type(instance, "number"):
         return
 
     if instance < minimum:
-        message = f"{instance!r} is less than the minimum of {minimum!r}"
+        message = Message(
+            "{instance!r} is less than the minimum of {minimum!r}",
+            instance=instance,
+            minimum=minimum,
+        )
         yield ValidationError(message)
 
 
+@is_valid_for(minimum)
+def _minimum(validator, minimum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+    return not instance < minimum
+
+
 def maximum(validator, maximum, instance, schema):
     if not validator.is_type(instance, "number"):
         return
 
     if instance > maximum:
-        message = f"{instance!r} is greater than the maximum of {maximum!r}"
+        message = Message(
+            "{instance!r} is greater than the maximum of {maximum!r}",
+            instance=instance,
+            maximum=maximum,
+        )
         yield ValidationError(message)
 
 
+@is_valid_for(maximum)
+def _maximum(validator, maximum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+    return not instance > maximum
+
+
 def multipleOf(validator, dB, instance, schema):
+    if not _multipleOf(validator, dB, instance, schema):
+        message = Message(
+            "{instance!r} is not a multiple of {dB}",
+            instance=instance,
+            dB=dB,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(multipleOf)
+def _multipleOf(validator, dB, instance, schema):
     if not validator.is_type(instance, "number"):
-        return
+        return True
 
     if isinstance(dB, float):
         quotient = instance / dB
@@ -202,18 +358,31 @@ def multipleOf(validator, dB, instance, schema):
     else:
         failed = instance % dB
 
-    if failed:
-        yield ValidationError(f"{instance!r} is not a multiple of {dB}")
+    return not failed
 
 
 def minItems(validator, mI, instance, schema):
     if validator.is_type(instance, "array") and len(instance) < mI:
-        yield ValidationError(f"{instance!r} is too short")
+        yield ValidationError(
+            Message("{instance!r} is too short", instance=instance),
+        )
+
+
+@is_valid_for(minItems)
+def _minItems(validator, mI, instance, schema):
+    return not (validator.is_type(instance, "array") and len(instance) < mI)
 
 
 def maxItems(validator, mI, instance, schema):
     if validator.is_type(instance, "array") and len(instance) > mI:
-        yield ValidationError(f"{instance!r} is too long")
+        yield ValidationError(
+            Message("{instance!r} is too long", instance=instance),
+        )
+
+
+@is_valid_for(maxItems)
+def _maxItems(validator, mI, instance, schema):
+    return not (validator.is_type(instance, "array") and len(instance) > mI)
 
 
 def uniqueItems(validator, uI, instance, schema):
@@ -222,33 +391,104 @@ def uniqueItems(validator, uI, instance, schema):
         and validator.is_type(instance, "array")
         and not uniq(instance)
     ):
-        yield ValidationError(f"{instance!r} has non-unique elements")
+        message = Message(
+            "{instance!r} has non-unique elements",
+            instance=instance,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(uniqueItems)
+def _uniqueItems(validator, uI, instance, schema):
+    return not uI or not validator.is_type(instance, "array") or uniq(instance)
 
 
 def pattern(validator, patrn, instance, schema):
     if (
         validator.is_type(instance, "string")
-        and not re.search(patrn, instance)
+        and not validator._patterns.search(patrn, instance)
     ):
-        yield ValidationError(f"{instance!r} does not match {patrn!r}")
+        message = Message(
+            "{instance!r} does not match {patrn!r}",
+            instance=instance,
+            patrn=patrn,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(pattern)
+def _pattern(validator, patrn, instance, schema):
+    return (
+        not validator.is_type(instance, "string")
+        or validator._patterns.search(patrn, instance) is not None
+    )
 
 
 def format(validator, format, instance, schema):
     if validator.format_checker is not None:
         try:
-            validator.format_checker.check(instance, format)
+            _check_format(validator, format, instance)
         except FormatError as error:
             yield ValidationError(error.message, cause=error.cause)
 
 
+@is_valid_for(format)
+def _format(validator, format, instance, schema):
+    return (
+        validator.format_checker is None
+        or _conforms(validator, format, instance)
+    )
+
+
+def _check_format(validator, format, instance):
+    """
+    Check an instance's format with the validator's format checker.
+
+    Unless a format checker checks it with something else, the "regex"
+    format is checked with the validator's regular expression engine (the
+    same one :validator:`pattern` uses) rather than always with `re`.
+    """
+    format_checker = validator.format_checker
+    func, _ = format_checker.checkers.get(format, (None, None))
+    if func is not is_regex:
+        format_checker.check(instance, format)
+    elif isinstance(instance, str):
+        try:
+            validator.REGEX_ENGINE.compile(instance)
+        except re.error as error:
+            raise FormatError(f"{instance!r} is not a {format!r}", cause=error)
+
+
+def _conforms(validator, format, instance):
+    try:
+        _check_format(validator, format, instance)
+    except FormatError:
+        return False
+    return True
+
+
 def minLength(validator, mL, instance, schema):
     if validator.is_type(instance, "string") and len(instance) < mL:
-        yield ValidationError(f"{instance!r} is too short")
+        yield ValidationError(
+            Message("{instance!r} is too short", instance=instance),
+        )
+
+
+@is_valid_for(minLength)
+def _minLength(validator, mL, instance, schema):
+    return not (validator.is_type(instance, "string") and len(instance) < mL)
 
 
 def maxLength(validator, mL, instance, schema):
     if validator.is_type(instance, "string") and len(instance) > mL:
-        yield ValidationError(f"{instance!r} is too long")
+        yield ValidationError(
+            Message("{instance!r} is too long", instance=instance),
+        )
+
+
+@is_valid_for(maxLength)
+def _maxLength(validator, mL, instance, schema):
+    return not (validator.is_type(instance, "string") and len(instance) > mL)
 
 
 def dependentRequired(validator, dependentRequired, instance, schema):
@@ -265,6 +505,19 @@ def dependentRequired(validator, dependentRequired, instance, schema):
                 yield ValidationError(message)
 
 
+@is_valid_for(dependentRequired)
+def _dependentRequired(validator, dependentRequired, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    return all(
+        each in instance
+        for property, dependency in dependentRequired.items()
+        if property in instance
+        for each in dependency
+    )
+
+
 def dependentSchemas(validator, dependentSchemas, instance, schema):
     if not validator.is_type(instance, "object"):
         return
@@ -277,13 +530,34 @@ def dependentSchemas(validator, dependentSchemas, instance, schema):
         )
 
 
+@is_valid_for(dependentSchemas)
+def _dependentSchemas(validator, dependentSchemas, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    return all(
+        validator._child_for(dependency).is_valid(instance)
+        for property, dependency in dependentSchemas.items()
+        if property in instance
+    )
+
+
 def enum(validator, enums, instance, schema):
+    if not _enum(validator, enums, instance, schema):
+        message = Message(
+            "{instance!r} is not one of {enums!r}",
+            instance=instance,
+            enums=enums,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(enum)
+def _enum(validator, enums, instance, schema):
     if instance == 0 or instance == 1:
         unbooled = unbool(instance)
-        if all(unbooled != unbool(each) for each in enums):
-            yield ValidationError(f"{instance!r} is not one of {enums!r}")
-    elif instance not in enums:
-        yield ValidationError(f"{instance!r} is not one of {enums!r}")
+        return any(unbooled == unbool(each) for each in enums)
+    return instance in enums
 
 
 def ref(validator, ref, instance, schema):
@@ -301,6 +575,22 @@ def ref(validator, ref, instance, schema):
             validator.resolver.pop_scope()
 
 
+@is_valid_for(ref)
+def _ref(validator, ref, instance, schema):
+    resolve = getattr(validator.resolver, "resolve", None)
+    if resolve is None:
+        with validator.resolver.resolving(ref) as resolved:
+            return validator._child_for(resolved).is_valid(instance)
+    else:
+        scope, resolved = validator.resolver.resolve(ref)
+        validator.resolver.push_scope(scope)
+
+        try:
+            return validator._child_for(resolved).is_valid(instance)
+        finally:
+            validator.resolver.pop_scope()
+
+
 def dynamicRef(validator, dynamicRef, instance, schema):
     _, fragment = urldefrag(dynamicRef)
     for url in validator.resolver._scopes_stack:
@@ -323,12 +613,48 @@ def dynamicRef(validator, dynamicRef, instance, schema):
             yield from validator.descend(instance, subschema)
 
 
+@is_valid_for(dynamicRef)
+def _dynamicRef(validator, dynamicRef, instance, schema):
+    _, fragment = urldefrag(dynamicRef)
+    for url in validator.resolver._scopes_stack:
+        lookup_url = urljoin(url, dynamicRef)
+        with validator.resolver.resolving(lookup_url) as subschema:
+            if ("$dynamicAnchor" in subschema
+                    and fragment == subschema["$dynamicAnchor"]):
+                scope_stack = list(validator.resolver._scopes_stack)
+                scope_stack.reverse()
+                extended_schema = dynamic_anchor_extender(
+                    validator, scope_stack, fragment, schema, subschema,
+                )
+                if extended_schema:
+                    extended = validator._child_for(extended_schema)
+                    return extended.is_valid(instance)
+
+                if not validator._child_for(subschema).is_valid(instance):
+                    return False
+    else:
+        with validator.resolver.resolving(dynamicRef) as subschema:
+            return validator._child_for(subschema).is_valid(instance)
+
+
 def type(validator, types, instance, schema):
     types = ensure_list(types)
 
     if not any(validator.is_type(instance, type) for type in types):
         reprs = ", ".join(repr(type) for type in types)
-        yield ValidationError(f"{instance!r} is not of type {reprs}")
+        message = Message(
+            "{instance!r} is not of type {reprs}",
+            instance=instance,
+            reprs=reprs,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(type)
+def _type(validator, types, instance, schema):
+    return any(
+        validator.is_type(instance, type) for type in ensure_list(types)
+    )
 
 
 def properties(validator, properties, instance, schema):
@@ -345,6 +671,18 @@ def properties(validator, properties, instance, schema):
             )
 
 
+@is_valid_for(properties)
+def _properties(validator, properties, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    return all(
+        validator._child_for(subschema).is_valid(instance[property])
+        for property, subschema in properties.items()
+        if property in instance
+    )
+
+
 def required(validator, required, instance, schema):
     if not validator.is_type(instance, "object"):
         return
@@ -353,16 +691,41 @@ def required(validator, required, instance, schema):
             yield ValidationError(f"{property!r} is a required property")
 
 
+@is_valid_for(required)
+def _required(validator, required, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+    return all(property in instance for property in required)
+
+
 def minProperties(validator, mP, instance, schema):
     if validator.is_type(instance, "object") and len(instance) < mP:
-        yield ValidationError(f"{instance!r} does not have enough properties")
+        message = Message(
+            "{instance!r} does not have enough properties",
+            instance=instance,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(minProperties)
+def _minProperties(validator, mP, instance, schema):
+    return not (validator.is_type(instance, "object") and len(instance) < mP)
 
 
 def maxProperties(validator, mP, instance, schema):
     if not validator.is_type(instance, "object"):
         return
     if validator.is_type(instance, "object") and len(instance) > mP:
-        yield ValidationError(f"{instance!r} has too many properties")
+        message = Message(
+            "{instance!r} has too many properties",
+            instance=instance,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(maxProperties)
+def _maxProperties(validator, mP, instance, schema):
+    return not (validator.is_type(instance, "object") and len(instance) > mP)
 
 
 def allOf(validator, allOf, instance, schema):
@@ -370,6 +733,14 @@ def allOf(validator, allOf, instance, schema):
         yield from validator.descend(instance, subschema, schema_path=index)
 
 
+@is_valid_for(allOf)
+def _allOf(validator, allOf, instance, schema):
+    return all(
+        validator._child_for(subschema).is_valid(instance)
+        for subschema in allOf
+    )
+
+
 def anyOf(validator, anyOf, instance, schema):
     all_errors = []
     for index, subschema in enumerate(anyOf):
@@ -379,11 +750,22 @@ def anyOf(validator, anyOf, instance, schema):
         all_errors.extend(errs)
     else:
         yield ValidationError(
-            f"{instance!r} is not valid under any of the given schemas",
+            Message(
+                "{instance!r} is not valid under any of the given schemas",
+                instance=instance,
+            ),
             context=all_errors,
         )
 
 
+@is_valid_for(anyOf)
+def _anyOf(validator, anyOf, instance, schema):
+    return any(
+        validator._child_for(subschema).is_valid(instance)
+        for subschema in anyOf
+    )
+
+
 def oneOf(validator, oneOf, instance, schema):
     subschemas = enumerate(oneOf)
     all_errors = []
@@ -395,28 +777,60 @@ def oneOf(validator, oneOf, instance, schema):
         all_errors.extend(errs)
     else:
         yield ValidationError(
-            f"{instance!r} is not valid under any of the given schemas",
+            Message(
+                "{instance!r} is not valid under any of the given schemas",
+                instance=instance,
+            ),
             context=all_errors,
         )
 
     more_valid = [
         each for _, each in subschemas
-        if validator.evolve(schema=each).is_valid(instance)
+        if validator._child_for(each).is_valid(instance)
     ]
     if more_valid:
         more_valid.append(first_valid)
         reprs = ", ".join(repr(schema) for schema in more_valid)
-        yield ValidationError(f"{instance!r} is valid under each of {reprs}")
+        message = Message(
+            "{instance!r} is valid under each of {reprs}",
+            instance=instance,
+            reprs=reprs,
+        )
+        yield ValidationError(message)
+
+
+@is_valid_for(oneOf)
+def _oneOf(validator, oneOf, instance, schema):
+    subschemas = iter(oneOf)
+    for subschema in subschemas:
+        if validator._child_for(subschema).is_valid(instance):
+            break
+    else:
+        return False
+
+    return not any(
+        validator._child_for(each).is_valid(instance)
+        for each in subschemas
+    )
 
 
 def not_(validator, not_schema, instance, schema):
-    if validator.evolve(schema=not_schema).is_valid(instance):
-        message = f"{instance!r} should not be valid under {not_schema!r}"
+    if validator._child_for(not_schema).is_valid(instance):
+        message = Message(
+            "{instance!r} should not be valid under {not_schema!r}",
+            instance=instance,
+            not_schema=not_schema,
+        )
         yield ValidationError(message)
 
 
+@is_valid_for(not_)
+def _not(validator, not_schema, instance, schema):
+    return not validator._child_for(not_schema).is_valid(instance)
+
+
 def if_(validator, if_schema, instance, schema):
-    if validator.evolve(schema=if_schema).is_valid(instance):
+    if validator._child_for(if_schema).is_valid(instance):
         if "then" in schema:
             then = schema["then"]
             yield from validator.descend(instance, then, schema_path="then")
@@ -425,6 +839,18 @@ def if_(validator, if_schema, instance, schema):
         yield from validator.descend(instance, else_, schema_path="else")
 
 
+@is_valid_for(if_)
+def _if(validator, if_schema, instance, schema):
+    if validator._child_for(if_schema).is_valid(instance):
+        if "then" in schema:
+            then = schema["then"]
+            return validator._child_for(then).is_valid(instance)
+    elif "else" in schema:
+        else_ = schema["else"]
+        return validator._child_for(else_).is_valid(instance)
+    return True
+
+
 def unevaluatedItems(validator, unevaluatedItems, instance, schema):
     evaluated_item_indexes = find_evaluated_item_indexes_by_schema(
         validator, instance, schema,
@@ -438,6 +864,16 @@ def unevaluatedItems(validator, unevaluatedItems, instance, schema):
         yield ValidationError(error % extras_msg(unevaluated_items))
 
 
+@is_valid_for(unevaluatedItems)
+def _unevaluatedItems(validator, unevaluatedItems, instance, schema):
+    evaluated_item_indexes = find_evaluated_item_indexes_by_schema(
+        validator, instance, schema,
+    )
+    return all(
+        index in evaluated_item_indexes for index, _ in enumerate(instance)
+    )
+
+
 def unevaluatedProperties(validator, unevaluatedProperties, instance, schema):
     evaluated_property_keys = find_evaluated_property_keys_by_schema(
         validator, instance, schema,
@@ -458,6 +894,24 @@ def unevaluatedProperties(validator, unevaluatedProperties, instance, schema):
         yield ValidationError(error % extras_msg(unevaluated_property_keys))
 
 
+@is_valid_for(unevaluatedProperties)
+def _unevaluatedProperties(
+    validator,
+    unevaluatedProperties,
+    instance,
+    schema,
+):
+    evaluated_property_keys = find_evaluated_property_keys_by_schema(
+        validator, instance, schema,
+    )
+    validator = validator._child_for(unevaluatedProperties)
+    return all(
+        validator.is_valid(instance[property])
+        for property in instance
+        if property not in evaluated_property_keys
+    )
+
+
 def prefixItems(validator, prefixItems, instance, schema):
     if not validator.is_type(instance, "array"):
         return
@@ -469,3 +923,14 @@ def prefixItems(validator, prefixItems, instance, schema):
             schema_path=index,
             path=index,
         )
+
+
+@is_valid_for(prefixItems)
+def _prefixItems(validator, prefixItems, instance, schema):
+    if not validator.is_type(instance, "array"):
+        return True
+
+    return all(
+        validator._child_for(subschema).is_valid(item)
+        for item, subschema in zip(instance, prefixItems)
+    )
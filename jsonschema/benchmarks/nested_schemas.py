@@ -0,0 +1,52 @@
+"""
+A performance benchmark of validating under nested (and referenced) schemas.
+
+Each instance is validated both by a validator and by the same validator
+once compiled (see `jsonschema.protocols.Validator.compile`), with
+``is_valid`` and with ``iter_errors`` (for instances with and without
+errors).
+"""
+from pyperf import Runner
+
+from jsonschema import Draft202012Validator
+
+schema = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "children": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+    },
+    "required": ["name"],
+    "$defs": {
+        "node": {
+            "type": "object",
+            "properties": {"value": {"type": "integer", "minimum": 0}},
+            "required": ["value"],
+        },
+    },
+}
+valid = {
+    "name": "root",
+    "tags": ["a"] * 20,
+    "children": [{"value": value} for value in range(50)],
+}
+invalid = {
+    "name": "",
+    "tags": ["a", 1] * 10,
+    "children": [{"value": -value} for value in range(50)],
+}
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    validator = Draft202012Validator(schema)
+    for name, each in ("", validator), ("compiled ", validator.compile()):
+        runner.bench_func(f"{name}is_valid", each.is_valid, valid)
+        for instance, kind in (valid, "valid"), (invalid, "invalid"):
+            runner.bench_func(
+                f"{name}iter_errors ({kind})",
+                lambda each, instance: list(each.iter_errors(instance)),
+                each,
+                instance,
+            )
@@ -2,10 +2,18 @@
 The ``jsonschema`` command line.
 """
 
-from json import JSONDecodeError
+from contextlib import closing
+from decimal import Decimal
+from functools import partial
+from io import StringIO
 from textwrap import dedent
 import argparse
+import glob
+import importlib
 import json
+import mmap
+import os
+import re
 import sys
 import traceback
 
@@ -16,8 +24,11 @@ except ImportError:
 
 import attr
 
+from jsonschema import parallel, streaming
+from jsonschema._bundle import bundle
 from jsonschema._reflect import namedAny
-from jsonschema.exceptions import SchemaError
+from jsonschema._remote import DiskCache
+from jsonschema.exceptions import RefResolutionError, SchemaError
 from jsonschema.validators import RefResolver, validator_for
 
 
@@ -31,6 +42,7 @@ class _Outputter(object):
     _formatter = attr.ib()
     _stdout = attr.ib()
     _stderr = attr.ib()
+    _loads = attr.ib(default=json.loads)
 
     @classmethod
     def from_arguments(cls, arguments, stdout, stderr):
@@ -38,28 +50,41 @@ class _Outputter(object):
             formatter = _PlainFormatter(arguments["error_format"])
         elif arguments["output"] == "pretty":
             formatter = _PrettyFormatter()
-        return cls(formatter=formatter, stdout=stdout, stderr=stderr)
+        return cls(
+            formatter=formatter,
+            stdout=stdout,
+            stderr=stderr,
+            loads=arguments["loads"],
+        )
 
-    def load(self, path):
+    def open(self, path, mode="r"):
         try:
-            file = open(path)
+            return open(path, mode)
         except FileNotFoundError:
             self.filenotfound_error(path=path, exc_info=sys.exc_info())
             raise _CannotLoadFile()
 
-        with file:
+    def load(self, path):
+        with self.open(path) as file:
             try:
-                return json.load(file)
-            except JSONDecodeError:
+                return self._loads(file.read())
+            except ValueError:
                 self.parsing_error(path=path, exc_info=sys.exc_info())
                 raise _CannotLoadFile()
 
+    def write(self, stdout, stderr):
+        self._stdout.write(stdout)
+        self._stderr.write(stderr)
+
     def filenotfound_error(self, **kwargs):
         self._stderr.write(self._formatter.filenotfound_error(**kwargs))
 
     def parsing_error(self, **kwargs):
         self._stderr.write(self._formatter.parsing_error(**kwargs))
 
+    def resolution_error(self, **kwargs):
+        self._stderr.write(self._formatter.resolution_error(**kwargs))
+
     def validation_error(self, **kwargs):
         self._stderr.write(self._formatter.validation_error(**kwargs))
 
@@ -98,6 +123,13 @@ class _PrettyFormatter(object):
             body=exc_lines,
         )
 
+    def resolution_error(self, path, error):
+        return self._ERROR_MSG.format(
+            path=path,
+            type=error.__class__.__name__,
+            body=error,
+        )
+
     def validation_error(self, instance_path, error):
         return self._ERROR_MSG.format(
             path=instance_path,
@@ -123,6 +155,11 @@ class _PlainFormatter(object):
             exc_info[1],
         )
 
+    def resolution_error(self, path, error):
+        return "Failed to resolve a reference within {!r}: {}\n".format(
+            path, error,
+        )
+
     def validation_error(self, instance_path, error):
         return self._error_format.format(file_name=instance_path, error=error)
 
@@ -136,6 +173,18 @@ def _namedAnyWithDefault(name):
     return namedAny(name)
 
 
+def _json_backend(name):
+    """
+    The loads function of the named JSON module.
+    """
+    try:
+        return importlib.import_module(name).loads
+    except ImportError:
+        raise argparse.ArgumentTypeError(f"{name!r} can't be imported")
+    except AttributeError:
+        raise argparse.ArgumentTypeError(f"{name!r} has no loads function")
+
+
 parser = argparse.ArgumentParser(
     description="JSON Schema Validation CLI",
 )
@@ -146,7 +195,11 @@ parser.add_argument(
     help="""
         a path to a JSON instance (i.e. filename.json) to validate (may
         be specified multiple times). If no instances are provided via this
-        option, one will be expected on standard input.
+        option, one will be expected on standard input. A directory may be
+        given, in which case each *.json file (or *.jsonl or *.ndjson file
+        with --jsonl) within it (or within its non-hidden subdirectories)
+        is validated, as may a (quoted) glob pattern such as
+        'configs/**/*.json'.
     """,
 )
 parser.add_argument(
@@ -187,6 +240,95 @@ parser.add_argument(
         resolve relative references to a particular URI (or local path)
     """,
 )
+parser.add_argument(
+    "--cache-dir",
+    help="""
+        a directory in which to cache schemas retrieved over HTTP(S), so
+        that they are retrieved again only once stale (and then only if
+        they have changed) rather than on every run
+    """,
+)
+parser.add_argument(
+    "--offline",
+    action="store_true",
+    help="""
+        never retrieve schemas over HTTP(S), using only those already in
+        the --cache-dir (whether stale or not)
+    """,
+)
+parser.add_argument(
+    "--stream",
+    action="store_true",
+    help="""
+        validate each instance as it is parsed, rather than once loaded,
+        so that arrays (or objects) too large to load are validated one
+        item (or property) at a time
+    """,
+)
+parser.add_argument(
+    "--jsonl",
+    action="store_true",
+    help="""
+        treat each instance as JSON Lines (i.e. newline-delimited JSON),
+        validating each of its (non-blank) lines as a separate instance,
+        one at a time. Errors are reported for each line (by number).
+    """,
+)
+parser.add_argument(
+    "--fail-fast",
+    action="store_true",
+    help="""
+        stop once an instance is invalid (or cannot be loaded), rather
+        than continuing with the rest
+    """,
+)
+parser.add_argument(
+    "--mmap",
+    action="store_true",
+    help="""
+        map instance files larger than 1 MiB into memory, rather than
+        reading them, which avoids holding a copy of their contents while
+        they are decoded
+    """,
+)
+parser.add_argument(
+    "-j", "--jobs",
+    type=int,
+    default=1,
+    help="""
+        the number of processes to validate instances with (in parallel).
+        Output is nonetheless in the order the instances were given.
+    """,
+)
+parser.add_argument(
+    "--json-backend",
+    metavar="MODULE",
+    type=_json_backend,
+    help="""
+        the name of a module whose loads function (which must accept
+        str or bytes, as json.loads does) should be used to decode JSON,
+        e.g. orjson
+    """,
+)
+parser.add_argument(
+    "--decimal",
+    action="store_true",
+    help="""
+        decode non-integral numbers as decimal.Decimals rather than
+        floats, so that they are exact (as integers already are). json is
+        used instead of the --json-backend if it doesn't support doing so
+        (via parse_float).
+    """,
+)
+parser.add_argument(
+    "--bundle",
+    action="store_true",
+    help="""
+        rather than validating any instances, write the schema, bundled
+        together with every schema it references (i.e. with each of them
+        embedded within it), to standard output
+    """,
+)
 parser.add_argument(
     "--version",
     action="version",
@@ -204,11 +346,41 @@ def parse_args(args):
         raise parser.error(
             "--error-format can only be used with --output plain",
         )
+    if arguments["offline"] and arguments["cache_dir"] is None:
+        raise parser.error("--offline can only be used with --cache-dir")
+    if arguments["bundle"] and arguments["instances"]:
+        raise parser.error("--bundle cannot be used with --instance")
+    if arguments["jobs"] < 1:
+        raise parser.error("--jobs must be at least 1")
+    if arguments["stream"] and arguments["jsonl"]:
+        raise parser.error("--stream cannot be used with --jsonl")
+    if arguments["bundle"] and arguments["decimal"]:
+        raise parser.error("--bundle cannot be used with --decimal")
+    arguments["loads"] = _loads_for(
+        loads=arguments["json_backend"] or json.loads,
+        decimal=arguments["decimal"],
+    )
     if arguments["output"] == "plain" and arguments["error_format"] is None:
-        arguments["error_format"] = "{error.instance}: {error.message}\n"
+        if arguments["jsonl"]:
+            arguments["error_format"] = "{file_name}: {error.message}\n"
+        else:
+            arguments["error_format"] = "{error.instance}: {error.message}\n"
     return arguments
 
 
+def _loads_for(loads, decimal):
+    """
+    A function which decodes JSON, using the given loads if possible.
+    """
+    if decimal:
+        try:
+            loads("1.0", parse_float=Decimal)
+        except TypeError:
+            loads = json.loads
+        loads = partial(loads, parse_float=Decimal)
+    return loads
+
+
 def _validate_instance(instance_path, instance, validator, outputter):
     invalid = False
     for error in validator.iter_errors(instance):
@@ -220,6 +392,231 @@ def _validate_instance(instance_path, instance, validator, outputter):
     return invalid
 
 
+def _validate_stream(instance_path, file, validator, outputter, loads):
+    invalid = False
+    try:
+        for error in streaming.iter_errors(validator, file, loads=loads):
+            invalid = True
+            outputter.validation_error(
+                instance_path=instance_path, error=error,
+            )
+    except ValueError:
+        outputter.parsing_error(path=instance_path, exc_info=sys.exc_info())
+        return True
+
+    if not invalid:
+        outputter.validation_success(instance_path=instance_path)
+    return invalid
+
+
+def _validate_lines(
+    instance_path,
+    file,
+    validator,
+    outputter,
+    loads,
+    fail_fast,
+):
+    exit_code = 0
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+
+        line_path = "{}:{}".format(instance_path, line_number)
+        try:
+            instance = loads(line)
+        except ValueError:
+            outputter.parsing_error(path=line_path, exc_info=sys.exc_info())
+            invalid = True
+        else:
+            invalid = _validate_instance(
+                instance_path=line_path,
+                instance=instance,
+                validator=validator,
+                outputter=outputter,
+            )
+
+        exit_code |= invalid
+        if invalid and fail_fast:
+            break
+    return exit_code
+
+
+def _discover(paths, jsonl):
+    """
+    The paths of instances, with directories and glob patterns expanded.
+
+    Each path a directory or pattern expands to is given only once, even if
+    (e.g. for a recursive pattern, which matches directories as well as the
+    files within them) it is found more than once.
+    """
+    suffixes = (".jsonl", ".ndjson") if jsonl else (".json",)
+    for path in paths:
+        if _GLOB_PATTERN.search(path) and not os.path.exists(path):
+            matches = sorted(glob.iglob(path, recursive=True))
+            if not matches:
+                yield path
+        else:
+            matches = [path]
+
+        seen = set()
+        for match in matches:
+            if os.path.isdir(match):
+                found = sorted(_walk(match, suffixes))
+            else:
+                found = [match]
+            for each in found:
+                normalized = os.path.normpath(each)
+                if normalized not in seen:
+                    seen.add(normalized)
+                    yield each
+
+
+_GLOB_PATTERN = re.compile(r"[*?[]")
+
+
+def _walk(directory, suffixes):
+    directories = [directory]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                elif entry.is_dir():
+                    directories.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    yield entry.path
+
+
+def _read(file, use_mmap):
+    """
+    Read the whole of a file, mapping it into memory if it's large.
+    """
+    if use_mmap and os.fstat(file.fileno()).st_size >= _MMAP_SIZE:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, json.detect_encoding(mapped[:4]))
+    return file.read()
+
+
+_MMAP_SIZE = 2 ** 20
+
+
+def _validate_file(
+    instance_path,
+    file,
+    validator,
+    outputter,
+    arguments,
+    use_mmap=False,
+):
+    if arguments["jsonl"]:
+        return _validate_lines(
+            instance_path=instance_path,
+            file=file,
+            validator=validator,
+            outputter=outputter,
+            loads=arguments["loads"],
+            fail_fast=arguments["fail_fast"],
+        )
+    elif arguments["stream"]:
+        return _validate_stream(
+            instance_path=instance_path,
+            file=file,
+            validator=validator,
+            outputter=outputter,
+            loads=arguments["loads"],
+        )
+
+    try:
+        instance = arguments["loads"](_read(file, use_mmap=use_mmap))
+    except ValueError:
+        outputter.parsing_error(path=instance_path, exc_info=sys.exc_info())
+        return True
+    return _validate_instance(
+        instance_path=instance_path,
+        instance=instance,
+        validator=validator,
+        outputter=outputter,
+    )
+
+
+def _validate_path(path, validator, outputter, arguments):
+    # whole documents are read in bulk (as bytes), and decoded at once
+    whole = not (arguments["jsonl"] or arguments["stream"])
+    try:
+        file = outputter.open(path, mode="rb" if whole else "r")
+    except _CannotLoadFile:
+        return True
+    with file:
+        return _validate_file(
+            instance_path=path,
+            file=file,
+            validator=validator,
+            outputter=outputter,
+            arguments=arguments,
+            use_mmap=arguments["mmap"],
+        )
+
+
+def _validate_in_parallel(paths, validator, outputter, arguments):
+    """
+    Validate the instances at each path across a pool of processes.
+
+    Each process creates its own validator (equivalent to the given one)
+    once, and validates a chunk of paths at a time, capturing its output,
+    which is then written out in the order of the paths.
+    """
+    chunks = parallel._map_chunks(
+        _validate_paths,
+        paths,
+        chunksize=_PATHS_PER_CHUNK,
+        max_in_flight=2 * arguments["jobs"],
+        ordered=True,
+        max_workers=arguments["jobs"],
+        initializer=_initialize_worker,
+        initargs=(arguments, validator.schema, validator.resolver),
+    )
+    for _, results in chunks:
+        for invalid, stdout, stderr in results:
+            outputter.write(stdout=stdout, stderr=stderr)
+            yield invalid
+
+
+# how many paths a process validates at once, to amortize the cost of
+# communicating with it across more than one (typically small) file
+_PATHS_PER_CHUNK = 16
+
+# the arguments and validator of the process, when it's a worker
+_worker = None
+
+
+def _initialize_worker(arguments, schema, resolver):
+    global _worker
+    _worker = arguments, arguments["validator"](schema, resolver=resolver)
+
+
+def _validate_paths(paths):
+    arguments, validator = _worker
+    results = []
+    for path in paths:
+        stdout, stderr = StringIO(), StringIO()
+        outputter = _Outputter.from_arguments(
+            arguments=arguments,
+            stdout=stdout,
+            stderr=stderr,
+        )
+        invalid = _validate_path(
+            path=path,
+            validator=validator,
+            outputter=outputter,
+            arguments=arguments,
+        )
+        results.append((invalid, stdout.getvalue(), stderr.getvalue()))
+        if invalid and arguments["fail_fast"]:
+            break
+    return results
+
+
 def main(args=sys.argv[1:]):
     sys.exit(run(arguments=parse_args(args=args)))
 
@@ -248,37 +645,79 @@ def run(arguments, stdout=sys.stdout, stderr=sys.stderr, stdin=sys.stdin):
         )
         return 1
 
-    if arguments["instances"]:
-        load, instances = outputter.load, arguments["instances"]
+    handlers = {}
+    if arguments["cache_dir"] is not None:
+        cache = DiskCache(arguments["cache_dir"], offline=arguments["offline"])
+        handlers.update(http=cache, https=cache)
+
+    if arguments["base_uri"] is not None:
+        resolver = RefResolver(
+            base_uri=arguments["base_uri"],
+            referrer=schema,
+            handlers=handlers,
+            loads=arguments["loads"],
+            id_of=arguments["validator"].ID_OF,
+        )
+    elif handlers or arguments["loads"] is not json.loads:
+        resolver = RefResolver.from_schema(
+            schema,
+            id_of=arguments["validator"].ID_OF,
+            handlers=handlers,
+            loads=arguments["loads"],
+        )
     else:
-        def load(_):
-            try:
-                return json.load(stdin)
-            except JSONDecodeError:
-                outputter.parsing_error(
-                    path="<stdin>", exc_info=sys.exc_info(),
-                )
-                raise _CannotLoadFile()
-        instances = ["<stdin>"]
+        resolver = None
 
-    resolver = RefResolver(
-        base_uri=arguments["base_uri"],
-        referrer=schema,
-    ) if arguments["base_uri"] is not None else None
+    if arguments["bundle"]:
+        if resolver is None:
+            resolver = RefResolver.from_schema(
+                schema, id_of=arguments["validator"].ID_OF,
+            )
+        try:
+            bundled = bundle(
+                schema, resolver=resolver, cls=arguments["validator"],
+            )
+        except RefResolutionError as error:
+            outputter.resolution_error(path=arguments["schema"], error=error)
+            return 1
+        json.dump(bundled, stdout, indent=4)
+        stdout.write("\n")
+        return 0
 
     validator = arguments["validator"](schema, resolver=resolver)
-    exit_code = 0
-    for each in instances:
-        try:
-            instance = load(each)
-        except _CannotLoadFile:
-            exit_code = 1
-        else:
-            exit_code |= _validate_instance(
-                instance_path=each,
-                instance=instance,
+    if not arguments["instances"]:
+        return int(
+            _validate_file(
+                instance_path="<stdin>",
+                file=stdin,
                 validator=validator,
                 outputter=outputter,
-            )
+                arguments=arguments,
+            ),
+        )
+
+    paths = _discover(arguments["instances"], jsonl=arguments["jsonl"])
+    if arguments["jobs"] > 1:
+        results = _validate_in_parallel(
+            paths=paths,
+            validator=validator,
+            outputter=outputter,
+            arguments=arguments,
+        )
+    else:
+        results = (
+            _validate_path(
+                path=each,
+                validator=validator,
+                outputter=outputter,
+                arguments=arguments,
+            ) for each in paths
+        )
 
+    exit_code = 0
+    with closing(results):
+        for invalid in results:
+            exit_code |= invalid
+            if exit_code and arguments["fail_fast"]:
+                break
     return exit_code
@@ -17,8 +17,18 @@ STRONG_MATCHES: frozenset[str] = frozenset()
 
 _unset = _utils.Unset()
 
+#: Schemas and instances with more values than this are shown by `str` using
+#: ``message_repr`` rather than being pretty printed in full.
+_MAX_PRETTY_PRINTED = 1000
+
 
 class _Error(Exception):
+
+    #: The repr used for values (e.g. instances) within messages, which are
+    #: rendered when first accessed. By default, it abbreviates only large
+    #: values. Set it to e.g. `repr` to always show values in full.
+    message_repr = _utils.abbreviated_repr
+
     def __init__(
         self,
         message,
@@ -44,9 +54,11 @@ class _Error(Exception):
             schema_path,
             parent,
         )
-        self.message = message
-        self.path = self.relative_path = deque(path)
-        self.schema_path = self.relative_schema_path = deque(schema_path)
+        self._message = message
+        self._path = deque(path)
+        self._schema_path = deque(schema_path)
+        self._located = False
+        self._location = self._base = None
         self.context = list(context)
         self.cause = self.__cause__ = cause
         self.validator = validator
@@ -61,6 +73,36 @@ class _Error(Exception):
     def __repr__(self):
         return f"<{self.__class__.__name__}: {self.message!r}>"
 
+    def __reduce__(self):
+        # (the rest of the error is its state, rather than its arguments,
+        # so that it's pickled after the error itself, which its context
+        # refers back to as their parent)
+        state = dict(self.__dict__, _message=self.message)
+        state.update(
+            _path=self.relative_path,
+            _schema_path=self.relative_schema_path,
+            _location=None,
+            _base=None,
+        )
+        return self.__class__, (self.message,), state
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            if isinstance(v, _utils.Unset):
+                v = _unset
+            self.__dict__[k] = v
+        self.__cause__ = self.cause
+
+    @property
+    def args(self):
+        # the message is rendered (into the arguments) once they're needed
+        self.message
+        return Exception.args.__get__(self)
+
+    @args.setter
+    def args(self, args):
+        Exception.args.__set__(self, args)
+
     def __str__(self):
         essential_for_verbose = (
             self.validator, self.validator_value, self.instance, self.schema,
@@ -83,17 +125,60 @@ class _Error(Exception):
             {self.message}
 
             Failed validating {self.validator!r} in {schema_path}:
-                {indent(pformat(self.schema, width=72), prefix).lstrip()}
+                {indent(self._pformat(self.schema), prefix).lstrip()}
 
             On {instance_path}:
-                {indent(pformat(self.instance, width=72), prefix).lstrip()}
+                {indent(self._pformat(self.instance), prefix).lstrip()}
             """.rstrip(),
         )
 
+    def _pformat(self, value):
+        if _utils.exceeds(value, _MAX_PRETTY_PRINTED):
+            return type(self).message_repr(value)
+        return pformat(value, width=72)
+
     @classmethod
     def create_from(cls, other):
         return cls(**other._contents())
 
+    @property
+    def message(self):
+        message = self._message
+        if isinstance(message, _utils.Message):
+            message = self._message = message.render(type(self).message_repr)
+            args = Exception.args.__get__(self)
+            Exception.args.__set__(self, (message,) + args[1:])
+        return message
+
+    @message.setter
+    def message(self, message):
+        self.args  # render the original message into the arguments first
+        self._message = message
+
+    @property
+    def path(self):
+        self._resolve_location()
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        self._resolve_location()
+        self._path = path
+
+    relative_path = path
+
+    @property
+    def schema_path(self):
+        self._resolve_location()
+        return self._schema_path
+
+    @schema_path.setter
+    def schema_path(self, schema_path):
+        self._resolve_location()
+        self._schema_path = schema_path
+
+    relative_schema_path = schema_path
+
     @property
     def absolute_path(self):
         parent = self.parent
@@ -129,6 +214,46 @@ class _Error(Exception):
             if getattr(self, k) is _unset:
                 setattr(self, k, v)
 
+    def _locate(self, location):
+        """
+        Note where this error occurred, if it wasn't already noted.
+
+        Errors are located once, by the innermost validator they pass
+        through, and their paths only include the location once they're
+        accessed.
+        """
+        if not self._located:
+            self._located = True
+            self._location = self._base = location
+
+    def _rebase(self, base):
+        """
+        Make this error's paths relative to a (less deeply nested) location.
+
+        Errors' paths are relative to the validator whose errors are being
+        iterated over, just as if each validator they pass through added
+        its part of the paths to them, but that happens only once they're
+        accessed.
+        """
+        self._base = base
+
+    def _resolve_location(self):
+        location, base = self._location, self._base
+        if location is base:
+            return
+        self._location = base
+
+        path, schema_path = location.paths()
+        if base is not None:
+            base_path, base_schema_path = base.paths()
+            for _ in base_path:
+                path.popleft()
+            for _ in base_schema_path:
+                schema_path.popleft()
+
+        self._path.extendleft(reversed(path))
+        self._schema_path.extendleft(reversed(schema_path))
+
     def _contents(self):
         attrs = (
             "message", "cause", "context", "validator", "validator_value",
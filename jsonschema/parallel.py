@@ -0,0 +1,184 @@
+"""
+Validation of many instances at once, across a pool of processes.
+"""
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+import os
+
+from jsonschema.validators import specialize
+
+#: The result of validating one instance.
+#:
+#: ``index`` is the position of the instance within those validated,
+#: ``valid`` whether it is valid, and ``errors`` a list of its validation
+#: errors, each serialized to a `dict` (with the ``message``, ``path``,
+#: ``schema_path`` and ``validator`` of the error).
+Result = namedtuple("Result", "index valid errors")
+
+# the validator of the process, when it's a worker
+_validator = None
+
+
+def iter_results(
+    validator,
+    instances,
+    workers=None,
+    chunksize=64,
+    ordered=True,
+    max_in_flight=None,
+):
+    """
+    Lazily validate each of the given instances, in a pool of processes.
+
+    Each worker process creates its own validator (equivalent to the
+    given one) once, and then validates chunks of instances with it. Its
+    class, schema, resolver and format checker must therefore be
+    picklable (which validator classes are if they're importable under
+    their name, as the ones included with `jsonschema` are, or if they're
+    created by `jsonschema.validators.specialize` from one which is).
+
+    Arguments:
+
+        validator:
+
+            the validator to validate the instances with
+
+        instances (collections.abc.Iterable):
+
+            the instances to validate, which are consumed only as fast as
+            they are validated
+
+        workers (int):
+
+            the number of processes to validate with, by default the
+            number of CPUs
+
+        chunksize (int):
+
+            how many instances to send to a process at once
+
+        ordered (bool):
+
+            whether to yield results in the order of their instances,
+            rather than as soon as they are completed
+
+        max_in_flight (int):
+
+            the greatest number of chunks submitted to processes but
+            whose results haven't yet been yielded, by default twice the
+            number of processes
+
+    Returns:
+
+        an iterable of `Result`\\ s
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+
+    chunks = _map_chunks(
+        _validate,
+        instances,
+        chunksize=chunksize,
+        max_in_flight=max_in_flight,
+        ordered=ordered,
+        max_workers=workers,
+        initializer=_initialize,
+        initargs=_initargs(validator),
+    )
+    for start, results in chunks:
+        for index, (valid, errors) in enumerate(results, start=start):
+            yield Result(index=index, valid=valid, errors=errors)
+
+
+def _map_chunks(function, items, chunksize, max_in_flight, ordered, **kwargs):
+    """
+    Lazily call a function on chunks of items, in a pool of processes.
+
+    Yields the index of the first item of each chunk along with what the
+    function returned for it, either in the order of the chunks or as
+    soon as each is done. At most ``max_in_flight`` chunks are submitted
+    without their results having been yielded, so that the items are
+    consumed only as fast as they're processed.
+
+    Any other arguments are passed along to `ProcessPoolExecutor`.
+    """
+    items = iter(items)
+    executor = ProcessPoolExecutor(**kwargs)
+    in_flight, starts = deque(), {}
+    try:
+        start = 0
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = list(islice(items, chunksize))
+                if not chunk:
+                    break
+                future = executor.submit(function, chunk)
+                in_flight.append(future)
+                starts[future] = start
+                start += len(chunk)
+            if not in_flight:
+                return
+
+            if ordered:
+                done = [in_flight.popleft()]
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+            for future in done:
+                yield starts.pop(future), future.result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown()
+
+
+def _initargs(validator):
+    """
+    What a worker needs to create a validator equivalent to the given one.
+
+    Specialized validator classes are created on the fly, so can't be
+    pickled, and are instead recreated by workers from their original class.
+    """
+    cls = validator.__class__
+    unspecialized = getattr(cls, "_unspecialized", None)
+    return (
+        cls if unspecialized is None else unspecialized,
+        unspecialized is not None,
+        validator.schema,
+        validator.resolver,
+        validator.format_checker,
+    )
+
+
+def _initialize(cls, specialized, schema, resolver, format_checker):
+    global _validator
+    if specialized:
+        cls = specialize(cls)
+    _validator = cls(schema, resolver=resolver, format_checker=format_checker)
+
+
+def _validate(instances):
+    return [_result(instance) for instance in instances]
+
+
+def _result(instance):
+    # most instances are valid, and checking validity is quicker than
+    # collecting errors, so errors are only collected for invalid ones
+    if _validator.is_valid(instance):
+        return True, []
+    errors = [
+        dict(
+            message=error.message,
+            path=list(error.path),
+            schema_path=list(error.schema_path),
+            validator=error.validator,
+        )
+        for error in _validator.iter_errors(instance)
+    ]
+    return False, errors
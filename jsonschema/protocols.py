@@ -7,7 +7,7 @@ typing.Protocol classes for jsonschema interfaces.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Iterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar, Iterator
 import sys
 
 # doing these imports with `try ... except ImportError` doesn't pass mypy
@@ -83,6 +83,10 @@ class Validator(Protocol):
     #: :validator:`format` properties in JSON schemas.
     FORMAT_CHECKER: ClassVar[jsonschema.FormatChecker]
 
+    #: The regular expression engine (an object with a ``compile``
+    #: function, such as `re`) used to compile the patterns in schemas.
+    REGEX_ENGINE: ClassVar[Any]
+
     #: The schema that was passed in when initializing the object.
     schema: dict | bool
 
@@ -157,6 +161,55 @@ class Validator(Protocol):
         ValidationError: [2, 3, 4] is too long
         """
 
+    def aiter_errors(
+        self,
+        instance: dict,
+        offload_above: int | None = None,
+        executor: Any = None,
+    ) -> AsyncIterator[ValidationError]:
+        r"""
+        Lazily yield each of the validation errors in the given instance,
+        without blocking the running event loop.
+
+        Any remote documents referenced are first retrieved concurrently
+        (see `RefResolver.aprefetch`), so that resolving references never
+        waits for them. If any of them cannot be retrieved, a
+        `jsonschema.exceptions.RefResolutionError` is raised rather than
+        validating.
+
+        :argument int offload_above: if provided, instances with more
+            than this many values (counting each array item and object
+            value) are instead validated within ``executor``, so that
+            validating them doesn't hold up the loop
+        :argument concurrent.futures.Executor executor: the executor to
+            validate large instances within (by default, that of the
+            loop)
+
+        :rtype: an `collections.abc.AsyncIterator` of
+            `jsonschema.exceptions.ValidationError`\s
+
+        >>> import asyncio
+        >>> async def errors_in(instance):
+        ...     validator = Draft202012Validator({"maxItems" : 2})
+        ...     return [
+        ...         error.message
+        ...         async for error in validator.aiter_errors(instance)
+        ...     ]
+        >>> asyncio.run(errors_in([2, 3, 4]))
+        ['[2, 3, 4] is too long']
+        """
+
+    async def avalidate(self, instance: dict, **kwargs: Any) -> None:
+        """
+        Check if the instance is valid under the current `schema`, without
+        blocking the running event loop.
+
+        Takes the same optional arguments as `aiter_errors`.
+
+        :raises: `jsonschema.exceptions.ValidationError` if the
+            instance is invalid
+        """
+
     def evolve(self, **kwargs) -> "Validator":
         """
         Create a new validator like this one, but with given changes.
@@ -0,0 +1,671 @@
+"""
+Validation of JSON documents as they are parsed, rather than once loaded.
+"""
+from fractions import Fraction
+from json import JSONDecodeError
+import hashlib
+import json
+import re
+
+from jsonschema import _legacy_validators, _utils, _validators
+from jsonschema.exceptions import ValidationError
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SCALAR = re.compile(r"[^,\]}\s]*")
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# how many unexpected items are kept to be shown in additionalItems' message
+_EXTRAS_SHOWN = 20
+
+# the keywords applied to a (top-level) array or object which can be
+# applied item by item (or property by property), by their functions
+_ARRAY_KEYWORDS = frozenset(
+    [
+        _legacy_validators.contains_draft6_draft7,
+        _legacy_validators.items_draft3_draft4,
+        _legacy_validators.items_draft6_draft7_draft201909,
+        _validators.additionalItems,
+        _validators.contains,
+        _validators.items,
+        _validators.maxItems,
+        _validators.minItems,
+        _validators.prefixItems,
+        _validators.type,
+        _validators.uniqueItems,
+    ],
+)
+_OBJECT_KEYWORDS = frozenset(
+    [
+        _validators.additionalProperties,
+        _validators.maxProperties,
+        _validators.minProperties,
+        _validators.patternProperties,
+        _validators.properties,
+        _validators.propertyNames,
+        _validators.required,
+        _validators.type,
+    ],
+)
+
+
+def iter_errors(validator, file, chunk_size=2 ** 16, loads=json.loads):
+    """
+    Lazily yield the validation errors in a JSON document, parsing it as
+    it goes.
+
+    If the document is an array (or an object), each of its items (or
+    properties) is parsed and validated in turn, so that only one of them
+    needs to be in memory at once, rather than the whole document. This is
+    possible when each of the keywords applying to the document itself is
+    one which can be applied an item (or property) at a time, namely
+    :validator:`type`, :validator:`items`, :validator:`prefixItems`,
+    :validator:`additionalItems`, :validator:`contains`,
+    :validator:`minItems`, :validator:`maxItems` and
+    :validator:`uniqueItems` for arrays, and :validator:`type`,
+    :validator:`properties`, :validator:`patternProperties`,
+    :validator:`additionalProperties`, :validator:`propertyNames`,
+    :validator:`required`, :validator:`minProperties` and
+    :validator:`maxProperties` for objects. (:validator:`uniqueItems` is
+    applied by remembering a digest of each item.) Otherwise, e.g. for a
+    top-level :validator:`$ref` or :validator:`unevaluatedItems`, the
+    document is loaded and then validated as usual.
+
+    Errors are yielded as soon as the item they're within is parsed, and
+    errors about the document as a whole (e.g. from :validator:`minItems`)
+    once it's been parsed. Since the document isn't kept, the
+    `jsonschema.exceptions.ValidationError.instance` of the latter is a
+    stand-in for it, shown as ``[...]`` (or ``{...}``) within their
+    messages, which are otherwise the ones validating the loaded document
+    would produce (except that :validator:`additionalItems` shows only the
+    first few unexpected items, and how many more there were).
+
+    Arguments:
+
+        validator:
+
+            the validator to validate the document with
+
+        file:
+
+            a (text) file containing the document
+
+        chunk_size (int):
+
+            how much of the document to read at once
+
+        loads (collections.abc.Callable):
+
+            the function to decode each item (or property) with, e.g.
+            `json.loads` with a ``parse_float`` of `decimal.Decimal`
+
+    Raises:
+
+        `json.JSONDecodeError`:
+
+            if the document isn't valid JSON (having yielded any errors
+            in the part of it preceding the invalid JSON), or whichever
+            error ``loads`` raises for an item which isn't
+    """
+    reader = _Reader(file, chunk_size, loads)
+    start = reader.peek()
+    if start == "[" and _can_stream(validator, _ARRAY_KEYWORDS):
+        yield from _iter_array_errors(validator, reader)
+    elif start == "{" and _can_stream(validator, _OBJECT_KEYWORDS):
+        yield from _iter_object_errors(validator, reader)
+    else:
+        yield from validator.iter_errors(reader.rest())
+        return
+    reader.end()
+
+
+def _can_stream(validator, keywords):
+    schema = validator.schema
+    if schema is True:
+        return True
+    elif not isinstance(schema, dict):
+        return False
+    return all(
+        validator.VALIDATORS[keyword] in keywords
+        for keyword in schema
+        if keyword in validator.VALIDATORS
+    )
+
+
+def _iter_array_errors(validator, reader):
+    schema = _keywords(validator)
+    VALIDATORS = validator.VALIDATORS
+
+    if "type" in schema:
+        yield from _type(validator, [], schema)
+
+    # which subschemas (and at which schema paths) apply to each item
+    prefix, rest = [], []
+    items = schema.get("items")
+    if "prefixItems" in schema:
+        prefix = [
+            (subschema, ("prefixItems", index))
+            for index, subschema in enumerate(schema["prefixItems"])
+        ]
+    if "items" in schema and VALIDATORS["items"] is _validators.items:
+        if items is not False:
+            rest.append((items, ("items",)))
+    elif "items" in schema and isinstance(items, list):
+        prefix = [
+            (subschema, ("items", index))
+            for index, subschema in enumerate(items)
+        ]
+    elif "items" in schema:
+        rest.append((items, ("items",)))
+
+    additional = schema.get("additionalItems", True)
+    if (
+        "additionalItems" in schema
+        and isinstance(items, list)
+        and validator.is_type(additional, "object")
+    ):
+        rest.append((additional, ("additionalItems",)))
+    # (the first few items beyond those allowed, for the error message)
+    extras = [] if additional is False and isinstance(items, list) else None
+
+    min_contains, max_contains, matches = 1, None, 0
+    if "contains" in schema:
+        contains_validator = validator._child_for(schema["contains"])
+        if VALIDATORS["contains"] is _validators.contains:
+            # (which are applied by contains, rather than being keywords)
+            min_contains = validator.schema.get("minContains", 1)
+            max_contains = validator.schema.get("maxContains")
+
+    unique = schema.get("uniqueItems", False)
+    seen = set()
+
+    count = 0
+    for index, item in reader.items():
+        count += 1
+        if (
+            extras is not None
+            and len(prefix) <= index < len(prefix) + _EXTRAS_SHOWN
+        ):
+            extras.append(item)
+        applicable = [prefix[index]] if index < len(prefix) else rest
+        for subschema, schema_path in applicable:
+            yield from _descend(validator, item, subschema, index, schema_path)
+
+        if "contains" in schema and contains_validator.is_valid(item):
+            matches += 1
+            if max_contains is not None and matches == max_contains + 1:
+                yield _error(
+                    validator,
+                    _ARRAY,
+                    "Too many items match the given schema "
+                    f"(expected at most {max_contains})",
+                    "contains",
+                    keyword="maxContains",
+                    value=max_contains,
+                )
+
+        if unique:
+            digest = _digest(item)
+            if digest in seen:
+                yield _error(
+                    validator,
+                    _ARRAY,
+                    _utils.Message(
+                        "{instance!r} has non-unique elements",
+                        instance=_ARRAY,
+                    ),
+                    "uniqueItems",
+                )
+                unique = False
+            seen.add(digest)
+
+    if items is False and VALIDATORS["items"] is _validators.items:
+        allowed = len(prefix)
+        if count > allowed:
+            yield _error(
+                validator,
+                _ARRAY,
+                f"Expected at most {allowed} items, but found {count}",
+                "items",
+            )
+    elif extras:
+        joined, verb = _utils.extras_msg(extras)
+        unshown = count - len(prefix) - len(extras)
+        if unshown:
+            joined += f", and {unshown} more"
+        yield _error(
+            validator,
+            _ARRAY,
+            f"Additional items are not allowed ({joined} {verb} unexpected)",
+            "additionalItems",
+        )
+
+    if "contains" in schema and matches < min_contains:
+        if VALIDATORS["contains"] is not _validators.contains:
+            yield _error(
+                validator,
+                _ARRAY,
+                _utils.Message(
+                    "None of {instance!r} are valid under the given schema",
+                    instance=_ARRAY,
+                ),
+                "contains",
+            )
+        elif not matches:
+            yield _error(
+                validator,
+                _ARRAY,
+                _utils.Message(
+                    "{instance!r} does not contain items "
+                    "matching the given schema",
+                    instance=_ARRAY,
+                ),
+                "contains",
+            )
+        else:
+            yield _error(
+                validator,
+                _ARRAY,
+                "Too few items match the given schema (expected at least "
+                f"{min_contains} but only {matches} matched)",
+                "contains",
+                keyword="minContains",
+                value=min_contains,
+            )
+
+    if "minItems" in schema and count < schema["minItems"]:
+        yield _error(
+            validator,
+            _ARRAY,
+            _utils.Message("{instance!r} is too short", instance=_ARRAY),
+            "minItems",
+        )
+    if "maxItems" in schema and count > schema["maxItems"]:
+        yield _error(
+            validator,
+            _ARRAY,
+            _utils.Message("{instance!r} is too long", instance=_ARRAY),
+            "maxItems",
+        )
+
+
+def _iter_object_errors(validator, reader):
+    schema = _keywords(validator)
+
+    if "type" in schema:
+        yield from _type(validator, {}, schema)
+
+    properties = schema.get("properties", {})
+    patterns = [
+        (pattern, subschema, validator._patterns.compile(pattern).search)
+        for pattern, subschema in schema.get("patternProperties", {}).items()
+    ]
+    additional = schema.get("additionalProperties", True)
+    extras = []
+    required = set(schema.get("required", ()))
+
+    count = 0
+    for property, value in reader.properties():
+        count += 1
+        required.discard(property)
+
+        if "propertyNames" in schema:
+            for error in validator._child_for(
+                schema["propertyNames"],
+            ).iter_errors(property):
+                error.schema_path.appendleft("propertyNames")
+                yield error
+
+        if property in properties:
+            yield from _descend(
+                validator,
+                value,
+                properties[property],
+                property,
+                ("properties", property),
+            )
+
+        matched = False
+        for pattern, subschema, search in patterns:
+            if search(property):
+                matched = True
+                yield from _descend(
+                    validator,
+                    value,
+                    subschema,
+                    property,
+                    ("patternProperties", pattern),
+                )
+
+        if property in properties or matched:
+            continue
+        elif validator.is_type(additional, "object"):
+            yield from _descend(
+                validator,
+                value,
+                additional,
+                property,
+                ("additionalProperties",),
+            )
+        elif not additional:
+            extras.append(property)
+
+    if extras:
+        if "patternProperties" in schema:
+            verb = "does" if len(extras) == 1 else "do"
+            joined = ", ".join(repr(each) for each in sorted(extras))
+            patterns = ", ".join(
+                repr(each) for each in sorted(schema["patternProperties"])
+            )
+            message = (
+                f"{joined} {verb} not match any of the regexes: {patterns}"
+            )
+        else:
+            joined, verb = _utils.extras_msg(extras)
+            message = (
+                "Additional properties are not allowed "
+                f"({joined} {verb} unexpected)"
+            )
+        yield _error(validator, _OBJECT, message, "additionalProperties")
+
+    for property in schema.get("required", ()):
+        if property in required:
+            yield _error(
+                validator,
+                _OBJECT,
+                f"{property!r} is a required property",
+                "required",
+            )
+
+    if "minProperties" in schema and count < schema["minProperties"]:
+        yield _error(
+            validator,
+            _OBJECT,
+            _utils.Message(
+                "{instance!r} does not have enough properties",
+                instance=_OBJECT,
+            ),
+            "minProperties",
+        )
+    if "maxProperties" in schema and count > schema["maxProperties"]:
+        yield _error(
+            validator,
+            _OBJECT,
+            _utils.Message(
+                "{instance!r} has too many properties",
+                instance=_OBJECT,
+            ),
+            "maxProperties",
+        )
+
+
+def _keywords(validator):
+    """
+    The keywords of the validator's schema which it knows (and applies).
+    """
+    if validator.schema is True:
+        return {}
+    return {
+        keyword: value
+        for keyword, value in validator.schema.items()
+        if keyword in validator.VALIDATORS
+    }
+
+
+def _type(validator, instance, schema):
+    types = _utils.ensure_list(schema["type"])
+    if not any(validator.is_type(instance, type) for type in types):
+        document = _ARRAY if isinstance(instance, list) else _OBJECT
+        reprs = ", ".join(repr(type) for type in types)
+        message = _utils.Message(
+            "{instance!r} is not of type {reprs}",
+            instance=document,
+            reprs=reprs,
+        )
+        yield _error(validator, document, message, "type")
+
+
+def _descend(validator, instance, schema, path, schema_path):
+    validator = validator._child_for(schema)
+    # most items are valid, and checking so is quicker than iterating
+    if validator.is_valid(instance):
+        return
+    for error in validator.iter_errors(instance):
+        error.path.appendleft(path)
+        error.schema_path.extendleft(reversed(schema_path))
+        yield error
+
+
+def _error(
+    validator, document, message, keyword_path, keyword=None, value=None,
+):
+    """
+    An error about the document as a whole.
+    """
+    if keyword is None:
+        keyword, value = keyword_path, validator.schema[keyword_path]
+    return ValidationError(
+        message,
+        validator=keyword,
+        validator_value=value,
+        instance=document,
+        schema=validator.schema,
+        schema_path=(keyword_path,),
+    )
+
+
+class _Document(object):
+    """
+    A stand-in for a document which isn't kept, within errors about it.
+    """
+
+    def __init__(self, repr):
+        self._repr = repr
+
+    def __repr__(self):
+        return self._repr
+
+
+_ARRAY, _OBJECT = _Document("[...]"), _Document("{...}")
+
+
+def _digest(instance):
+    """
+    A digest of an instance which is equal only for equal instances.
+    """
+    dumped = json.dumps(_canonical(instance))
+    return hashlib.sha256(dumped.encode("utf-8")).digest()
+
+
+def _canonical(instance):
+    """
+    A JSON-serializable form of an instance, equal only for equal instances.
+
+    Numbers (e.g. `int`, `float` or `decimal.Decimal` ones) are equal when
+    their values are, but aren't equal to booleans.
+    """
+    if isinstance(instance, str):
+        return ["string", instance]
+    elif isinstance(instance, bool) or instance is None:
+        return [instance]
+    elif isinstance(instance, list):
+        return ["array", [_canonical(each) for each in instance]]
+    elif isinstance(instance, dict):
+        return [
+            "object",
+            sorted([k, _canonical(v)] for k, v in instance.items()),
+        ]
+
+    try:
+        number = Fraction(instance)
+    except (TypeError, ValueError, OverflowError):  # e.g. NaN
+        return ["other", repr(instance)]
+    return ["number", str(number.numerator), str(number.denominator)]
+
+
+class _Reader(object):
+    """
+    Read the values within a JSON array or object from a file, one by one.
+
+    Where each value ends is found by scanning for the brackets and
+    quotes delimiting it, so that each can then be decoded on its own.
+    Only as much of the file as the value being read (or a chunk, if
+    larger) is kept in memory.
+    """
+
+    def __init__(self, file, chunk_size, loads):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._loads = loads
+        self._buffer = ""
+        self._position = 0
+
+    def _read(self):
+        """
+        Read more of the file, returning whether there was any more to read.
+        """
+        if self._position >= self._chunk_size:
+            self._buffer = self._buffer[self._position:]
+            self._position = 0
+        # read more each time, so that a huge value isn't scanned again and
+        # again for each small chunk of it
+        chunk = self._file.read(max(self._chunk_size, len(self._buffer)))
+        self._buffer += chunk
+        return bool(chunk)
+
+    def _error(self, message, position=None):
+        if position is None:
+            position = self._position
+        return JSONDecodeError(message, self._buffer, position)
+
+    def peek(self):
+        """
+        Skip any whitespace, returning the next character (or "" if none).
+        """
+        while True:
+            end = _WHITESPACE.match(self._buffer, self._position).end()
+            self._position = end
+            if end < len(self._buffer):
+                return self._buffer[end]
+            elif not self._read():
+                return ""
+
+    def value(self):
+        """
+        Read the next value.
+        """
+        if not self.peek():
+            raise self._error("Expecting value")
+
+        # reading may move the current position, so it's found afterwards
+        end = self._end_of_value()
+        start = self._position
+        try:
+            value = self._loads(self._buffer[start:end])
+        except JSONDecodeError as error:
+            raise self._error(error.msg, start + error.pos)
+        self._position = end
+        return value
+
+    def _end_of_value(self):
+        """
+        Find the end of the value at the current position.
+
+        The file is read until it's been found.
+        """
+        if self._buffer[self._position] not in '[{"':
+            while True:
+                end = _SCALAR.match(self._buffer, self._position).end()
+                if end < len(self._buffer) or not self._read():
+                    return end
+
+        position = self._position
+
+        depth, within_string = 0, False
+        while True:
+            if within_string:
+                end = _STRING.match(self._buffer, position).end()
+                if end < len(self._buffer) and self._buffer[end] == '"':
+                    position, within_string = end + 1, False
+                    if not depth:
+                        return position
+                    continue
+                position = end
+            else:
+                match = _STRUCTURE.search(self._buffer, position)
+                if match is not None:
+                    position = match.end()
+                    character = match.group()
+                    if character == '"':
+                        within_string = True
+                    elif character in "[{":
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if not depth:
+                            return position
+                    continue
+                position = len(self._buffer)
+
+            # positions are only invalidated by reading when they precede
+            # the current one, which these never do
+            offset = self._position
+            if not self._read():
+                raise self._error("Unterminated value")
+            position -= offset - self._position
+
+    def _expect(self, character):
+        if self.peek() != character:
+            raise self._error(f"Expecting {character!r} delimiter")
+        self._position += 1
+
+    def _members(self, end):
+        """
+        Iterate over the members of an array or object, calling ``read``.
+        """
+        self._position += 1
+        if self.peek() == end:
+            self._position += 1
+            return
+        while True:
+            yield
+            if self.peek() == ",":
+                self._position += 1
+                continue
+            self._expect(end)
+            return
+
+    def items(self):
+        """
+        Read the items of the array at the current position.
+        """
+        for index, _ in enumerate(self._members("]")):
+            yield index, self.value()
+
+    def properties(self):
+        """
+        Read the properties of the object at the current position.
+        """
+        for _ in self._members("}"):
+            if self.peek() != '"':
+                raise self._error(
+                    "Expecting property name enclosed in double quotes",
+                )
+            property = self.value()
+            self._expect(":")
+            yield property, self.value()
+
+    def rest(self):
+        """
+        Read the (whole) remainder of the file as one value.
+        """
+        remainder = self._buffer[self._position:] + self._file.read()
+        self._buffer, self._position = "", 0
+        return self._loads(remainder)
+
+    def end(self):
+        """
+        Ensure nothing but whitespace remains.
+        """
+        if self.peek():
+            raise self._error("Extra data")
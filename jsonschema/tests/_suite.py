@@ -111,10 +111,15 @@ class Version(object):
     def to_unittest_testcase(self, *suites, **kwargs):
         name = kwargs.pop("name", "Test" + self.name.title().replace("-", ""))
         methods = {
-            test.method_name: test.to_unittest_method(**kwargs)
+            method.__name__: method
             for suite in suites
             for tests in suite
             for test in tests
+            for method in (
+                test.to_unittest_method(**kwargs),
+                test.to_unittest_method(compiled=True, **kwargs),
+                test.to_unittest_method(specialized=True, **kwargs),
+            )
         }
         cls = type(name, (unittest.TestCase,), methods)
 
@@ -183,27 +188,56 @@ class _Test(object):
             re.sub(delimiters, "_", self.description),
         )
 
-    def to_unittest_method(self, skip=lambda test: None, **kwargs):
-        if self.valid:
+    def to_unittest_method(
+        self,
+        skip=lambda test: None,
+        compiled=False,
+        specialized=False,
+        **kwargs,
+    ):
+        if specialized:
+            def fn(this):
+                valid = self.is_valid(specialized=True, **kwargs)
+                this.assertEqual(valid, self.valid)
+        elif self.valid:
             def fn(this):
-                self.validate(**kwargs)
+                self.validate(compiled=compiled, **kwargs)
+                this.assertTrue(self.is_valid(compiled=compiled, **kwargs))
         else:
             def fn(this):
                 with this.assertRaises(jsonschema.ValidationError):
-                    self.validate(**kwargs)
+                    self.validate(compiled=compiled, **kwargs)
+                this.assertFalse(self.is_valid(compiled=compiled, **kwargs))
 
         fn.__name__ = self.method_name
+        if compiled:
+            fn.__name__ += "_compiled"
+        elif specialized:
+            fn.__name__ += "_specialized"
         reason = skip(self)
         return unittest.skipIf(reason is not None, reason)(fn)
 
-    def validate(self, Validator, **kwargs):
+    def validate(self, Validator, compiled=False, **kwargs):
+        validator = self._validator(Validator=Validator, **kwargs)
+        if compiled:
+            validator = validator.compile()
+        validator.validate(instance=self.data)
+
+    def is_valid(self, Validator, compiled=False, specialized=False, **kwargs):
+        if specialized:
+            Validator = jsonschema.validators.specialize(Validator)
+        validator = self._validator(Validator=Validator, **kwargs)
+        if compiled:
+            validator = validator.compile()
+        return validator.is_valid(instance=self.data)
+
+    def _validator(self, Validator, **kwargs):
         resolver = jsonschema.RefResolver.from_schema(
             schema=self.schema,
             store=self._remotes,
             id_of=Validator.ID_OF,
         )
-        validator = Validator(schema=self.schema, resolver=resolver, **kwargs)
-        validator.validate(instance=self.data)
+        return Validator(schema=self.schema, resolver=resolver, **kwargs)
 
     def validate_ignoring_errors(self, Validator):  # pragma: no cover
         try:
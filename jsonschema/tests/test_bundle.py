@@ -0,0 +1,282 @@
+from unittest import TestCase
+
+from jsonschema import (
+    Draft4Validator,
+    Draft7Validator,
+    Draft202012Validator,
+    RefResolutionError,
+    RefResolver,
+    bundle,
+)
+
+
+def unretrievable(uri):
+    raise AssertionError(f"{uri!r} was retrieved")
+
+
+class TestBundle(TestCase):
+    def resolver(self, schema, store):
+        return RefResolver.from_schema(schema, store=store)
+
+    def test_no_references(self):
+        schema = {"$id": "http://example.com/", "type": "integer"}
+        self.assertIs(bundle(schema), schema)
+
+    def test_boolean_schema(self):
+        self.assertIs(bundle(True), True)
+
+    def test_external_references_are_embedded(self):
+        schema = {
+            "$id": "http://example.com/root.json",
+            "items": {"$ref": "item.json"},
+        }
+        item = {"type": "integer"}
+        bundled = bundle(
+            schema,
+            resolver=self.resolver(
+                schema, store={"http://example.com/item.json": item},
+            ),
+        )
+        self.assertEqual(
+            bundled,
+            {
+                "$id": "http://example.com/root.json",
+                "items": {"$ref": "item.json"},
+                "$defs": {
+                    "http://example.com/item.json": {
+                        "$id": "http://example.com/item.json",
+                        "type": "integer",
+                    },
+                },
+            },
+        )
+
+    def test_it_does_not_modify_the_schema(self):
+        schema = {
+            "$id": "http://example.com/root.json",
+            "$defs": {"foo": {}},
+            "$ref": "other.json",
+        }
+        bundle(
+            schema,
+            resolver=self.resolver(
+                schema, store={"http://example.com/other.json": {}},
+            ),
+        )
+        self.assertEqual(
+            schema,
+            {
+                "$id": "http://example.com/root.json",
+                "$defs": {"foo": {}},
+                "$ref": "other.json",
+            },
+        )
+
+    def test_references_are_followed_transitively(self):
+        schema = {"$id": "http://example.com/root.json", "$ref": "a.json"}
+        store = {
+            "http://example.com/a.json": {"$ref": "b.json#/$defs/c"},
+            "http://example.com/b.json": {
+                "$defs": {"c": {"$ref": "http://example.com/root.json"}},
+            },
+        }
+        bundled = bundle(schema, resolver=self.resolver(schema, store))
+        self.assertEqual(
+            sorted(bundled["$defs"]),
+            ["http://example.com/a.json", "http://example.com/b.json"],
+        )
+
+    def test_embedded_resources_are_not_retrieved(self):
+        schema = {
+            "$id": "http://example.com/root.json",
+            "$defs": {"foo": {"$id": "foo.json", "type": "string"}},
+            "$ref": "foo.json",
+        }
+        resolver = RefResolver.from_schema(
+            schema, handlers={"http": unretrievable},
+        )
+        self.assertIs(bundle(schema, resolver=resolver), schema)
+
+    def test_base_uri_of_the_resolver(self):
+        schema = {"$ref": "item.json"}
+        resolver = RefResolver(
+            base_uri="http://example.com/root.json",
+            referrer=schema,
+            store={"http://example.com/item.json": {"type": "integer"}},
+        )
+        self.assertEqual(
+            bundle(schema, resolver=resolver)["$id"],
+            "http://example.com/root.json",
+        )
+
+    def test_unresolvable_references(self):
+        schema = {"$ref": "http://example.com/foo.json"}
+        resolver = RefResolver.from_schema(
+            schema, handlers={"http": unretrievable},
+        )
+        with self.assertRaises(RefResolutionError):
+            bundle(schema, resolver=resolver)
+
+    def test_it_validates_the_same_without_retrieval(self):
+        schema = {
+            "$id": "http://example.com/root.json",
+            "type": "object",
+            "properties": {
+                "name": {"$ref": "strings.json#/$defs/name"},
+                "tags": {"type": "array", "items": {"$ref": "tag.json"}},
+                "meta": {"$ref": "http://json-schema.org/draft-07/schema"},
+            },
+        }
+        store = {
+            "http://example.com/strings.json": {
+                "$defs": {"name": {"type": "string", "minLength": 2}},
+            },
+            "http://example.com/tag.json": {
+                "enum": ["f", "bar"],
+                "not": {"$ref": "strings.json#/$defs/name"},
+            },
+        }
+        validator = Draft202012Validator(
+            schema, resolver=self.resolver(schema, store),
+        )
+        bundled = bundle(schema, resolver=self.resolver(schema, store))
+        self.assertIn(
+            "http://json-schema.org/draft-07/schema", bundled["$defs"],
+        )
+        bundled = Draft202012Validator(
+            bundled,
+            resolver=RefResolver.from_schema(
+                bundled, handlers={"http": unretrievable},
+            ),
+        )
+
+        instances = [
+            {},
+            {"name": "foo", "tags": ["f"], "meta": {"type": "string"}},
+            {"name": "f"},
+            {"name": 12},
+            {"tags": ["baz"]},
+            {"meta": {"type": 12}},
+            {"meta": {"minLength": -1}},
+        ]
+        self.assertEqual(
+            [validator.is_valid(each) for each in instances],
+            [bundled.is_valid(each) for each in instances],
+        )
+        self.assertEqual(
+            [validator.is_valid(each) for each in instances],
+            [True, True, False, False, False, False, False],
+        )
+
+    def test_draft7_root(self):
+        schema = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "http://example.com/root.json",
+            "$ref": "item.json",
+        }
+        store = {"http://example.com/item.json": {"type": "integer"}}
+        bundled = bundle(schema, resolver=self.resolver(schema, store))
+        bundled = Draft7Validator(
+            bundled,
+            resolver=RefResolver.from_schema(
+                bundled, handlers={"http": unretrievable},
+            ),
+        )
+        self.assertEqual(
+            (bundled.is_valid(12), bundled.is_valid("12")),
+            (True, False),
+        )
+
+        self.assertEqual(
+            bundled.schema["definitions"]["http://example.com/item.json"],
+            {"$id": "http://example.com/item.json", "type": "integer"},
+        )
+        self.assertNotIn("$defs", bundled.schema)
+
+    def test_draft4_root(self):
+        schema = {
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "id": "http://example.com/root.json",
+            "$ref": "item.json",
+        }
+        store = {"http://example.com/item.json": {"type": "integer"}}
+        bundled = bundle(schema, resolver=self.resolver(schema, store))
+        self.assertEqual(
+            bundled["definitions"],
+            {
+                "http://example.com/item.json": {
+                    "id": "http://example.com/item.json",
+                    "type": "integer",
+                },
+            },
+        )
+        bundled = Draft4Validator(
+            bundled,
+            resolver=RefResolver.from_schema(
+                bundled,
+                id_of=Draft4Validator.ID_OF,
+                handlers={"http": unretrievable},
+            ),
+        )
+        self.assertEqual(
+            (bundled.is_valid(12), bundled.is_valid("12")),
+            (True, False),
+        )
+
+    def test_resources_keep_their_own_ids(self):
+        schema = {
+            "$id": "http://example.com/root.json",
+            "properties": {
+                "foo": {"$ref": "item.json"},
+                "bar": {"$ref": "item.json#/$defs/string"},
+            },
+        }
+        store = {
+            "http://example.com/item.json": {
+                "$id": "http://example.org/schemas/item.json",
+                "$defs": {"string": {"type": "string"}},
+                "$ref": "int.json",
+            },
+            "http://example.org/schemas/int.json": {"type": "integer"},
+        }
+        bundled = bundle(schema, resolver=self.resolver(schema, store))
+        self.assertEqual(
+            bundled,
+            {
+                "$id": "http://example.com/root.json",
+                "properties": {
+                    "foo": {"$ref": "http://example.org/schemas/item.json"},
+                    "bar": {
+                        "$ref": (
+                            "http://example.org/schemas/item.json"
+                            "#/$defs/string"
+                        ),
+                    },
+                },
+                "$defs": {
+                    "http://example.org/schemas/item.json": {
+                        "$id": "http://example.org/schemas/item.json",
+                        "$defs": {"string": {"type": "string"}},
+                        "$ref": "int.json",
+                    },
+                    "http://example.org/schemas/int.json": {
+                        "$id": "http://example.org/schemas/int.json",
+                        "type": "integer",
+                    },
+                },
+            },
+        )
+
+        validator = Draft202012Validator(
+            bundled,
+            resolver=RefResolver.from_schema(
+                bundled, handlers={"http": unretrievable},
+            ),
+        )
+        self.assertEqual(
+            [
+                validator.is_valid(instance)
+                for instance in [{"foo": 1}, {"foo": "1"}, {"bar": "1"}]
+            ],
+            [True, False, True],
+        )
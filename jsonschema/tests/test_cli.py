@@ -1,5 +1,6 @@
 from contextlib import redirect_stderr, redirect_stdout
-from io import StringIO
+from decimal import Decimal
+from io import BytesIO, StringIO
 from json import JSONDecodeError
 from pathlib import Path
 from textwrap import dedent
@@ -9,6 +10,7 @@ import os
 import subprocess
 import sys
 import tempfile
+import types
 
 try:  # pragma: no cover
     from importlib import metadata
@@ -17,7 +19,7 @@ except ImportError:  # pragma: no cover
 
 from pyrsistent import m
 
-from jsonschema import Draft4Validator, Draft202012Validator, cli
+from jsonschema import DiskCache, Draft4Validator, Draft202012Validator, cli
 from jsonschema.exceptions import (
     RefResolutionError,
     SchemaError,
@@ -46,10 +48,12 @@ def fake_validator(*errors):
 
 
 def fake_open(all_contents):
-    def open(path):
+    def open(path, mode="r"):
         contents = all_contents.get(path)
         if contents is None:
             raise FileNotFoundError(path)
+        if "b" in mode:
+            return BytesIO(contents.encode("utf-8"))
         return StringIO(contents)
     return open
 
@@ -776,6 +780,265 @@ class TestCLI(TestCase):
             error, "unknown url type: 'foo.json'",
         )
 
+    def test_successful_validation_via_cache_dir(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        uri = "http://example.com/definitions.json"
+        cache = DiskCache(directory.name)
+        cache._save(
+            cache._path_of(uri),
+            uri=uri,
+            document={"definitions": {"num": {"type": "integer"}}},
+            etag=None,
+            last_modified=None,
+            expires=0,
+        )
+
+        schema = f'{{"$ref": "{uri}#/definitions/num"}}'
+        self.assertOutputs(
+            files=dict(some_schema=schema, some_instance='"1"'),
+            argv=[
+                "-i", "some_instance",
+                "--cache-dir", directory.name,
+                "--offline",
+                "some_schema",
+            ],
+            exit_code=1,
+            stdout="",
+            stderr="1: '1' is not of type 'integer'\n",
+        )
+
+    def test_offline_with_nothing_cached(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        schema = '{"$ref": "http://example.com/definitions.json"}'
+
+        with self.assertRaises(RefResolutionError) as e:
+            self.assertOutputs(
+                files=dict(some_schema=schema, some_instance="1"),
+                argv=[
+                    "-i", "some_instance",
+                    "--cache-dir", directory.name,
+                    "--offline",
+                    "--base-uri", "http://example.com/",
+                    "some_schema",
+                ],
+            )
+        self.assertIn("is not cached", str(e.exception))
+
+    def test_bundle(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        uri = "http://example.com/definitions.json"
+        cache = DiskCache(directory.name)
+        cache._save(
+            cache._path_of(uri),
+            uri=uri,
+            document={"definitions": {"num": {"type": "integer"}}},
+            etag=None,
+            last_modified=None,
+            expires=0,
+        )
+
+        schema = {"$ref": f"{uri}#/definitions/num"}
+        stdout, stderr = self.run_cli(
+            files=dict(some_schema=json.dumps(schema)),
+            argv=[
+                "--cache-dir", directory.name,
+                "--offline",
+                "--bundle",
+                "some_schema",
+            ],
+        )
+        self.assertEqual(
+            (json.loads(stdout), stderr),
+            (
+                {
+                    "$ref": f"{uri}#/definitions/num",
+                    "$defs": {
+                        uri: {
+                            "$id": uri,
+                            "definitions": {"num": {"type": "integer"}},
+                        },
+                    },
+                },
+                "",
+            ),
+        )
+
+    def test_bundle_unresolvable_reference(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        stdout, stderr = self.run_cli(
+            files=dict(some_schema='{"$ref": "http://example.com/foo"}'),
+            argv=[
+                "--cache-dir", directory.name,
+                "--offline",
+                "--bundle",
+                "some_schema",
+            ],
+            exit_code=1,
+        )
+        self.assertFalse(stdout)
+        self.assertIn(
+            "Failed to resolve a reference within 'some_schema': ", stderr,
+        )
+
+    def test_stream(self):
+        self.assertOutputs(
+            files=dict(
+                some_schema='{"items": {"type": "integer"}}',
+                some_instance='[1, "foo", 2, "bar"]',
+            ),
+            argv=["--stream", "-i", "some_instance", "some_schema"],
+            exit_code=1,
+            stderr="""\
+                foo: 'foo' is not of type 'integer'
+                bar: 'bar' is not of type 'integer'
+            """,
+        )
+
+    def test_stream_stdin(self):
+        self.assertOutputs(
+            files=dict(some_schema='{"minItems": 3}'),
+            stdin=StringIO("[1, 2, 3]"),
+            argv=["--stream", "--output", "pretty", "some_schema"],
+            stdout="===[SUCCESS]===(<stdin>)===\n",
+        )
+
+    def test_stream_invalid_JSON(self):
+        instance = '[1, "foo",'
+        self.assertOutputs(
+            files=dict(
+                some_schema='{"items": {"type": "integer"}}',
+                some_instance=instance,
+            ),
+            argv=["--stream", "-i", "some_instance", "some_schema"],
+            exit_code=1,
+            stderr="""\
+                foo: 'foo' is not of type 'integer'
+                Failed to parse 'some_instance': {}
+            """.format(_message_for(instance)),
+        )
+
+    def test_jsonl(self):
+        self.assertOutputs(
+            files=dict(
+                some_schema='{"type": "integer"}',
+                some_instance='1\n"foo"\n\n2\n{}\n',
+            ),
+            argv=["--jsonl", "-i", "some_instance", "some_schema"],
+            exit_code=1,
+            stderr="""\
+                some_instance:2: 'foo' is not of type 'integer'
+                some_instance:5: {} is not of type 'integer'
+            """,
+        )
+
+    def test_jsonl_invalid_line(self):
+        self.assertOutputs(
+            files=dict(some_schema="{}", some_instance="1\n[1, \n3\n"),
+            argv=["--jsonl", "-i", "some_instance", "some_schema"],
+            exit_code=1,
+            stderr="""\
+                Failed to parse 'some_instance:2': {}
+            """.format(_message_for("[1, \n")),
+        )
+
+    def test_jsonl_stdin_pretty_output(self):
+        self.assertOutputs(
+            files=dict(some_schema='{"type": "integer"}'),
+            stdin=StringIO("1\n2\n"),
+            argv=["--jsonl", "--output", "pretty", "some_schema"],
+            stdout="""\
+                ===[SUCCESS]===(<stdin>:1)===
+                ===[SUCCESS]===(<stdin>:2)===
+            """,
+        )
+
+    def test_jsonl_fail_fast(self):
+        self.assertOutputs(
+            files=dict(
+                some_schema='{"type": "integer"}',
+                some_instance='1\n"foo"\n"bar"\n',
+                some_other_instance='"baz"\n',
+            ),
+            argv=[
+                "--jsonl",
+                "--fail-fast",
+                "-i", "some_instance",
+                "-i", "some_other_instance",
+                "some_schema",
+            ],
+            exit_code=1,
+            stderr="some_instance:2: 'foo' is not of type 'integer'\n",
+        )
+
+    def test_fail_fast(self):
+        self.assertOutputs(
+            files=dict(
+                some_schema='{"type": "integer"}',
+                some_instance='"foo"',
+                some_other_instance='"bar"',
+            ),
+            argv=[
+                "--fail-fast",
+                "-i", "some_instance",
+                "-i", "some_other_instance",
+                "some_schema",
+            ],
+            exit_code=1,
+            stderr="foo: 'foo' is not of type 'integer'\n",
+        )
+
+    def test_decimal(self):
+        files = dict(some_schema='{"multipleOf": 0.01}', some_instance="0.07")
+        self.assertOutputs(
+            files=files,
+            argv=["-i", "some_instance", "some_schema"],
+            exit_code=1,
+            stderr="0.07: 0.07 is not a multiple of 0.01\n",
+        )
+        self.assertOutputs(
+            files=files,
+            argv=["--decimal", "-i", "some_instance", "some_schema"],
+        )
+
+    def test_stream_decimal_unique_items(self):
+        self.assertOutputs(
+            files=dict(
+                some_schema='{"uniqueItems": true}',
+                some_instance="[0.1, 1, 0.10]",
+            ),
+            argv=[
+                "--stream", "--decimal", "-i", "some_instance", "some_schema",
+            ],
+            exit_code=1,
+            stderr="[...]: [...] has non-unique elements\n",
+        )
+
+    def test_json_backend(self):
+        decoded = []
+
+        def loads(document):
+            decoded.append(document)
+            return json.loads(document)
+
+        backend = types.ModuleType("fake_json")
+        backend.loads = loads
+        self.addCleanup(sys.modules.pop, "fake_json")
+        sys.modules["fake_json"] = backend
+
+        self.assertOutputs(
+            files=dict(some_schema='{"type": "integer"}', some_instance="12"),
+            argv=[
+                "--json-backend", "fake_json",
+                "-i", "some_instance",
+                "some_schema",
+            ],
+        )
+        self.assertEqual(decoded, ['{"type": "integer"}', b"12"])
+
     def test_it_validates_using_the_latest_validator_when_unspecified(self):
         # There isn't a better way now I can think of to ensure that the
         # latest version was used, given that the call to validator_for
@@ -882,6 +1145,65 @@ class TestParser(TestCase):
         )
         self.assertFalse(stdout)
 
+    def test_offline_without_cache_dir(self):
+        stdout, stderr = self.cli_output_for("--offline", "mem://some/schema")
+        self.assertIn("--offline can only be used with --cache-dir", stderr)
+        self.assertFalse(stdout)
+
+    def test_bundle_with_instances(self):
+        stdout, stderr = self.cli_output_for(
+            "--bundle", "-i", "foo", "mem://some/schema",
+        )
+        self.assertIn("--bundle cannot be used with --instance", stderr)
+        self.assertFalse(stdout)
+
+    def test_stream_with_jsonl(self):
+        stdout, stderr = self.cli_output_for(
+            "--stream", "--jsonl", "mem://some/schema",
+        )
+        self.assertIn("--stream cannot be used with --jsonl", stderr)
+        self.assertFalse(stdout)
+
+    def test_jobs_must_be_positive(self):
+        stdout, stderr = self.cli_output_for("--jobs", "0", "mem://schema")
+        self.assertIn("--jobs must be at least 1", stderr)
+        self.assertFalse(stdout)
+
+    def test_unavailable_json_backend(self):
+        stdout, stderr = self.cli_output_for(
+            "--json-backend", "jsonschema.tests.nonexistent", "schema",
+        )
+        self.assertIn(
+            "'jsonschema.tests.nonexistent' can't be imported",
+            stderr,
+        )
+        self.assertFalse(stdout)
+
+    def test_json_backend_without_loads(self):
+        stdout, stderr = self.cli_output_for(
+            "--json-backend", "jsonschema.tests", "schema",
+        )
+        self.assertIn("'jsonschema.tests' has no loads function", stderr)
+        self.assertFalse(stdout)
+
+    def test_decimal_with_json_backend_without_parse_float(self):
+        backend = types.ModuleType("fake_json")
+        backend.loads = lambda document: 12
+        self.addCleanup(sys.modules.pop, "fake_json")
+        sys.modules["fake_json"] = backend
+
+        arguments = cli.parse_args(
+            ["--decimal", "--json-backend", "fake_json", "schema"],
+        )
+        self.assertEqual(
+            repr(arguments["loads"]("[1.1]")), repr([Decimal("1.1")]),
+        )
+
+    def test_bundle_with_decimal(self):
+        stdout, stderr = self.cli_output_for("--bundle", "--decimal", "schema")
+        self.assertIn("--bundle cannot be used with --decimal", stderr)
+        self.assertFalse(stdout)
+
 
 class TestCLIIntegration(TestCase):
     def test_license(self):
@@ -909,3 +1231,200 @@ class TestCLIIntegration(TestCase):
             stderr=subprocess.STDOUT,
         )
         self.assertEqual(output, output_for_help)
+
+    def jsonschema_in(self, directory, *argv):
+        process = subprocess.run(
+            [sys.executable, "-m", "jsonschema", *argv],
+            cwd=directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        return process.returncode, process.stdout, process.stderr
+
+    def test_jobs(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        path.joinpath("schema.json").write_text('{"type": "integer"}')
+
+        instances = []
+        for i in range(40):
+            instance = path / f"instance{i}.json"
+            instance.write_text("12" if i % 7 else f'"{i}"')
+            instances.extend(["-i", instance.name])
+        path.joinpath("invalid0.json").write_text("{")
+        instances.extend(["-i", "invalid0.json", "-i", "missing.json"])
+
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name,
+                "--jobs", "3", "--output", "pretty", *instances, "schema.json",
+            ),
+            self.jsonschema_in(
+                directory.name,
+                "--output", "pretty", *instances, "schema.json",
+            ),
+        )
+
+        exit_code, stdout, stderr = self.jsonschema_in(
+            directory.name, "--jobs", "3", *instances, "schema.json",
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            stderr.splitlines()[:6],
+            [f"{i}: '{i}' is not of type 'integer'" for i in range(0, 40, 7)],
+        )
+
+    def test_jobs_all_valid(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        path.joinpath("schema.json").write_text('{"type": "integer"}')
+        path.joinpath("instance.json").write_text("12")
+
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name,
+                "-j", "2",
+                "-i", "instance.json",
+                "-i", "instance.json",
+                "schema.json",
+            ),
+            (0, "", ""),
+        )
+
+    def test_directory_of_instances(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        path.joinpath("schema.json").write_text('{"type": "integer"}')
+        instances = path / "instances"
+        instances.joinpath("sub", "deeper").mkdir(parents=True)
+        instances.joinpath(".hidden").mkdir()
+        instances.joinpath("b.json").write_text('"b"')
+        instances.joinpath("a.json").write_text('"a"')
+        instances.joinpath("c.txt").write_text('"c"')
+        instances.joinpath("sub", "d.json").write_text('"d"')
+        instances.joinpath("sub", "deeper", "e.json").write_text("12")
+        instances.joinpath(".hidden", "f.json").write_text('"f"')
+
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name,
+                "--output", "pretty",
+                "-i", "instances",
+                "schema.json",
+            )[1],
+            "===[SUCCESS]===({})===\n".format(
+                os.path.join("instances", "sub", "deeper", "e.json"),
+            ),
+        )
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name, "-i", "instances", "schema.json",
+            ),
+            (
+                1,
+                "",
+                "a: 'a' is not of type 'integer'\n"
+                "b: 'b' is not of type 'integer'\n"
+                "d: 'd' is not of type 'integer'\n",
+            ),
+        )
+
+    def test_glob_of_instances(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        path.joinpath("schema.json").write_text('{"type": "integer"}')
+        path.joinpath("sub").mkdir()
+        path.joinpath("a.json").write_text('"a"')
+        path.joinpath("sub", "b.json").write_text('"b"')
+        path.joinpath("sub", "c.jsonl").write_text('"c"\n"d"\n')
+
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name, "-i", "**/[ab].json", "schema.json",
+            ),
+            (
+                1,
+                "",
+                "a: 'a' is not of type 'integer'\n"
+                "b: 'b' is not of type 'integer'\n",
+            ),
+        )
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name, "--jsonl", "-i", "sub", "schema.json",
+            ),
+            (
+                1,
+                "",
+                "{0}:1: 'c' is not of type 'integer'\n"
+                "{0}:2: 'd' is not of type 'integer'\n".format(
+                    os.path.join("sub", "c.jsonl"),
+                ),
+            ),
+        )
+
+    def test_recursive_glob_matching_directories(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        path.joinpath("schema.json").write_text('{"type": "integer"}')
+        path.joinpath("instances", "sub").mkdir(parents=True)
+        path.joinpath("instances", "a.json").write_text('"a"')
+        path.joinpath("instances", "sub", "b.json").write_text('"b"')
+
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name, "-i", "instances/**", "schema.json",
+            ),
+            (
+                1,
+                "",
+                "a: 'a' is not of type 'integer'\n"
+                "b: 'b' is not of type 'integer'\n",
+            ),
+        )
+
+    def test_glob_without_matches(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        path.joinpath("schema.json").write_text("{}")
+
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name, "-i", "*/*.json", "schema.json",
+            ),
+            (1, "", "'*/*.json' does not exist.\n"),
+        )
+
+    def test_mmap(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        path.joinpath("schema.json").write_text(
+            '{"items": {"type": "integer"}}',
+        )
+        instance = list(range(2 ** 18)) + ["foo"]
+        path.joinpath("large.json").write_text(json.dumps(instance))
+        path.joinpath("small.json").write_text('["bar"]')
+
+        self.assertEqual(
+            self.jsonschema_in(
+                directory.name,
+                "--mmap",
+                "-i", "large.json",
+                "-i", "small.json",
+                "schema.json",
+            ),
+            (
+                1,
+                "",
+                "foo: 'foo' is not of type 'integer'\n"
+                "bar: 'bar' is not of type 'integer'\n",
+            ),
+        )
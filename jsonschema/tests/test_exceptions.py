@@ -1,4 +1,5 @@
 from unittest import TestCase
+import reprlib
 import textwrap
 
 from jsonschema import Draft4Validator, exceptions
@@ -469,6 +470,98 @@ class TestErrorInitReprStr(TestCase):
         self.assertIn(repr(instance), str(error))
 
 
+class TestDeferredMessages(TestCase):
+    def test_messages_are_rendered_when_accessed(self):
+        reprs = []
+
+        class Instance(object):
+            def __repr__(this):
+                reprs.append(this)
+                return "<instance>"
+
+        instance = Instance()
+        validator = Draft4Validator({"not": {}})
+        error, = validator.iter_errors(instance)
+        self.assertEqual(reprs, [])
+
+        self.assertEqual(
+            (error.message, error.message),
+            (
+                "<instance> should not be valid under {}",
+                "<instance> should not be valid under {}",
+            ),
+        )
+        self.assertEqual(reprs, [instance])
+
+    def test_message_repr(self):
+        abbreviated = reprlib.Repr()
+        abbreviated.maxlist = 3
+
+        self.addCleanup(
+            setattr,
+            exceptions.ValidationError,
+            "message_repr",
+            exceptions.ValidationError.message_repr,
+        )
+        exceptions.ValidationError.message_repr = abbreviated.repr
+
+        validator = Draft4Validator({"maxItems": 2})
+        error, = validator.iter_errors(list(range(1000)))
+        self.assertEqual(error.message, "[0, 1, 2, ...] is too long")
+
+    def test_message_repr_with_a_plain_function(self):
+        self.addCleanup(
+            setattr,
+            exceptions.ValidationError,
+            "message_repr",
+            exceptions.ValidationError.message_repr,
+        )
+        exceptions.ValidationError.message_repr = lambda value: "<value>"
+
+        validator = Draft4Validator({"enum": [1, 2]})
+        error, = validator.iter_errors(3)
+        self.assertEqual(error.message, "<value> is not one of <value>")
+
+    def test_large_values_are_abbreviated_by_default(self):
+        validator = Draft4Validator({"maxItems": 2})
+        error, = validator.iter_errors(list(range(1000)))
+        self.assertEqual(
+            error.message,
+            repr(list(range(100)))[:-1] + ", ...] is too long",
+        )
+
+    def test_str_abbreviates_large_instances(self):
+        validator = Draft4Validator({"maxItems": 2})
+        error, = validator.iter_errors(list(range(100000)))
+        self.assertLess(len(str(error)), 2000)
+
+    def test_args_hold_the_rendered_message(self):
+        validator = Draft4Validator({"type": "string"})
+        error, = validator.iter_errors(12)
+        self.assertEqual(error.args[0], "12 is not of type 'string'")
+
+    def test_args_keep_the_original_message_when_it_is_set(self):
+        validator = Draft4Validator({"type": "string"})
+        error, = validator.iter_errors(12)
+        error.message = "Not a string!"
+        self.assertEqual(
+            (error.args[0], error.message),
+            ("12 is not of type 'string'", "Not a string!"),
+        )
+
+    def test_setting_the_message(self):
+        validator = Draft4Validator({"minimum": 2})
+        error, = validator.iter_errors(1)
+        error.message = "Too small!"
+        self.assertEqual(error.message, "Too small!")
+
+    def test_create_from_renders_the_message(self):
+        validator = Draft4Validator({"type": "string"})
+        error, = validator.iter_errors(12)
+        schema_error = exceptions.SchemaError.create_from(error)
+        self.assertEqual(schema_error.message, "12 is not of type 'string'")
+
+
 class TestHashable(TestCase):
     def test_hashable(self):
         set([exceptions.ValidationError("")])
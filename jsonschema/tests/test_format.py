@@ -3,10 +3,24 @@ Tests for the parts of jsonschema related to the :validator:`format` property.
 """
 
 from unittest import TestCase
+import subprocess
+import sys
 
 from jsonschema import FormatChecker, FormatError, ValidationError
 from jsonschema.validators import Draft4Validator
 
+_OPTIONAL_DEPENDENCIES = [
+    "fqdn",
+    "idna",
+    "isoduration",
+    "jsonpointer",
+    "rfc3339_validator",
+    "rfc3986_validator",
+    "rfc3987",
+    "uri_template",
+    "webcolors",
+]
+
 BOOM = ValueError("Boom!")
 BANG = ZeroDivisionError("Bang!")
 
@@ -57,6 +71,19 @@ class TestFormatChecker(TestCase):
         with self.assertRaises(type(BANG)):
             checker.check(instance="bang", format="boom")
 
+    def test_it_catches_errors_registered_by_name(self):
+        checker = FormatChecker()
+        checker.checks(
+            "boom", raises=("builtins.KeyError", "builtins.ValueError"),
+        )(boom)
+
+        with self.assertRaises(FormatError) as cm:
+            checker.check(instance=12, format="boom")
+        self.assertIs(cm.exception.cause, BOOM)
+
+        with self.assertRaises(type(BANG)):
+            checker.check(instance="bang", format="boom")
+
     def test_format_error_causes_become_validation_error_causes(self):
         checker = FormatChecker()
         checker.checks("boom", raises=ValueError)(boom)
@@ -77,6 +104,30 @@ class TestFormatChecker(TestCase):
         with self.assertRaises(FormatError):
             checker.check(instance="not-an-ipv4", format="ipv4")
 
+    def test_optional_dependencies_are_imported_lazily(self):
+        code = (
+            "import sys, jsonschema; "
+            "print(sorted(set(sys.modules) & {}))"
+        ).format(set(_OPTIONAL_DEPENDENCIES))
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.strip(), b"[]")
+
+    def test_dependencies_which_fail_to_import_are_unchecked(self):
+        # e.g. newer webcolors no longer have CSS21_NAMES_TO_HEX
+        code = """
+import importlib.machinery, sys, types
+webcolors = types.ModuleType("webcolors")
+webcolors.__spec__ = importlib.machinery.ModuleSpec("webcolors", None)
+sys.modules["webcolors"] = webcolors
+
+from jsonschema import Draft3Validator, FormatChecker
+checker = FormatChecker()
+validator = Draft3Validator({"format": "color"}, format_checker=checker)
+print(validator.is_valid("not a color"), validator.is_valid(12))
+"""
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.strip(), b"True True")
+
     def test_repr(self):
         checker = FormatChecker(formats=())
         checker.checks("foo")(lambda thing: True)  # pragma: no cover
@@ -15,6 +15,7 @@ from jsonschema import (
     Draft7Validator,
     Draft201909Validator,
     Draft202012Validator,
+    ECMA262Engine,
     draft3_format_checker,
     draft4_format_checker,
     draft6_format_checker,
@@ -24,6 +25,7 @@ from jsonschema import (
 )
 from jsonschema.tests._helpers import bug
 from jsonschema.tests._suite import Suite
+from jsonschema.validators import extend
 
 SUITE = Suite()
 DRAFT3 = SUITE.version(name="draft3")
@@ -437,3 +439,10 @@ TestDraft202012Format = DRAFT202012.to_unittest_testcase(
         or complex_email_validation(test)
     ),
 )
+
+
+TestDraft202012ECMARegex = DRAFT202012.to_unittest_testcase(
+    DRAFT202012.optional_tests_of(name="ecmascript-regex"),
+    Validator=extend(Draft202012Validator, regex_engine=ECMA262Engine()),
+    format_checker=draft202012_format_checker,
+)
@@ -0,0 +1,115 @@
+from unittest import TestCase
+import pickle
+
+from jsonschema import Draft202012Validator, RefResolver, parallel
+from jsonschema.parallel import Result, iter_results
+from jsonschema.validators import specialize
+
+
+class TestIterResults(TestCase):
+    def test_results_are_in_order(self):
+        validator = Draft202012Validator({"type": "integer", "minimum": 0})
+        results = iter_results(
+            validator, [1, "foo", 2, -1], workers=2, chunksize=1,
+        )
+        self.assertEqual(
+            list(results),
+            [
+                Result(index=0, valid=True, errors=[]),
+                Result(
+                    index=1,
+                    valid=False,
+                    errors=[
+                        {
+                            "message": "'foo' is not of type 'integer'",
+                            "path": [],
+                            "schema_path": ["type"],
+                            "validator": "type",
+                        },
+                    ],
+                ),
+                Result(index=2, valid=True, errors=[]),
+                Result(
+                    index=3,
+                    valid=False,
+                    errors=[
+                        {
+                            "message": "-1 is less than the minimum of 0",
+                            "path": [],
+                            "schema_path": ["minimum"],
+                            "validator": "minimum",
+                        },
+                    ],
+                ),
+            ],
+        )
+
+    def test_results_as_completed(self):
+        validator = Draft202012Validator({"items": {"type": "integer"}})
+        instances = [[i] if i % 3 else ["foo"] for i in range(50)]
+        results = iter_results(
+            validator, instances, workers=2, chunksize=4, ordered=False,
+        )
+        self.assertEqual(
+            sorted((index, valid) for index, valid, _ in results),
+            [(i, bool(i % 3)) for i in range(50)],
+        )
+
+    def test_errors_have_paths(self):
+        validator = Draft202012Validator({"items": {"type": "integer"}})
+        (result,) = iter_results(validator, [[1, "foo"]], workers=1)
+        self.assertEqual(
+            [(error["path"], error["schema_path"]) for error in result.errors],
+            [([1], ["items", "type"])],
+        )
+
+    def test_instances_are_consumed_lazily(self):
+        consumed = []
+
+        def instances():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = iter_results(
+            Draft202012Validator({}),
+            instances(),
+            workers=1,
+            chunksize=3,
+            max_in_flight=2,
+        )
+        self.assertEqual(next(results).index, 0)
+        self.assertEqual(len(consumed), 6)
+        self.assertEqual(len(list(results)), 99)
+
+    def test_references_are_resolved_by_workers(self):
+        schema = {"$ref": "http://example.com/int"}
+        resolver = RefResolver.from_schema(
+            schema, store={"http://example.com/int": {"type": "integer"}},
+        )
+        validator = Draft202012Validator(schema, resolver=resolver)
+        results = iter_results(validator, [1, "1"], workers=1)
+        self.assertEqual([valid for _, valid, _ in results], [True, False])
+
+    def test_specialized_validators(self):
+        cls = specialize(Draft202012Validator)
+        validator = cls({"items": {"type": "integer"}})
+        results = iter_results(validator, [[1], ["foo"]], workers=1)
+        self.assertEqual([valid for _, valid, _ in results], [True, False])
+
+    def test_workers_specialize_specialized_validators(self):
+        cls = specialize(Draft202012Validator)
+        initargs = pickle.loads(pickle.dumps(parallel._initargs(cls({}))))
+        self.addCleanup(setattr, parallel, "_validator", None)
+        parallel._initialize(*initargs)
+        self.assertIs(
+            parallel._validator._unspecialized, Draft202012Validator,
+        )
+
+    def test_nothing_to_validate(self):
+        results = iter_results(Draft202012Validator({}), [], workers=1)
+        self.assertEqual(list(results), [])
+
+    def test_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            next(iter_results(Draft202012Validator({}), [1], chunksize=0))
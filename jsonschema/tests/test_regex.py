@@ -0,0 +1,220 @@
+"""
+Tests for the translation of ECMA-262 regular expressions.
+
+Matching itself is covered by the (optional) ``ecmascript-regex`` tests in
+`test_jsonschema_test_suite`; these check the translation more granularly.
+"""
+from unittest import TestCase, mock, skipIf
+import re
+import sys
+import warnings
+
+from jsonschema._regex import ECMA262Engine, translate
+
+try:
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None
+
+
+def matches(pattern, string):
+    return re.search(translate(pattern), string) is not None
+
+
+class TestTranslate(TestCase):
+    def test_digits_are_ascii(self):
+        self.assertEqual(
+            (matches(r"^\d$", "1"), matches(r"^\d$", "٠")),
+            (True, False),
+        )
+
+    def test_word_characters_are_ascii(self):
+        self.assertEqual(
+            (matches(r"^\w$", "a"), matches(r"^\w$", "é")),
+            (True, False),
+        )
+
+    def test_whitespace_is_unicode(self):
+        self.assertEqual(
+            (matches(r"^\s$", "\ufeff"), matches(r"^\S$", "\ufeff")),
+            (True, False),
+        )
+
+    def test_dollar_does_not_match_before_a_trailing_newline(self):
+        self.assertFalse(matches("^abc$", "abc\n"))
+
+    def test_dot_does_not_match_line_terminators(self):
+        self.assertEqual(
+            (matches("^.$", "\u2028"), matches("^.$", "\u0085")),
+            (False, True),
+        )
+
+    def test_control_escapes(self):
+        self.assertEqual(
+            (matches(r"^\cC$", "\x03"), matches(r"^\cc$", "\x03")),
+            (True, True),
+        )
+
+    def test_unicode_code_point_escapes(self):
+        self.assertTrue(matches(r"^\u{1F600}$", "\U0001F600"))
+
+    def test_named_groups_and_backreferences(self):
+        self.assertEqual(
+            (
+                matches(r"^(?<a>x+)-\k<a>$", "xx-xx"),
+                matches(r"^(?<a>x+)-\k<a>$", "xx-x"),
+                matches(r"(?<=a)b", "ab"),
+                matches(r"(?<!a)b", "ab"),
+            ),
+            (True, False, True, False),
+        )
+
+    def test_word_boundaries_are_ascii(self):
+        self.assertEqual(
+            (matches(r"a\b", "a!"), matches(r"a\b", "aé")),
+            (True, True),
+        )
+        self.assertFalse(matches(r"a\B", "a!"))
+
+    def test_backspace_within_a_class(self):
+        self.assertTrue(matches(r"^[\b]$", "\x08"))
+
+    def test_complemented_sets_within_a_class(self):
+        self.assertEqual(
+            (
+                matches(r"^[a\D]$", "a"),
+                matches(r"^[a\D]$", "b"),
+                matches(r"^[a\D]$", "1"),
+            ),
+            (True, True, False),
+        )
+
+    def test_complemented_sets_within_a_negated_class(self):
+        self.assertEqual(
+            (
+                matches(r"^[^a\D]$", "1"),
+                matches(r"^[^a\D]$", "a"),
+                matches(r"^[^\S\W]$", " "),
+                matches(r"^[^\S\W]$", "a"),
+            ),
+            (True, False, False, False),
+        )
+
+    def test_empty_classes(self):
+        self.assertEqual(
+            (
+                matches("^[]$", ""),
+                matches("^a[]?$", "a"),
+                matches("^[^]$", "\n"),
+            ),
+            (False, True, True),
+        )
+
+    def test_characters_which_are_special_only_in_python_classes(self):
+        self.assertTrue(matches("^[[&&]+$", "[&&["))
+
+    def test_properties(self):
+        self.assertEqual(
+            (
+                matches(r"^\p{Letter}+$", "héllo"),
+                matches(r"^\p{L}$", "1"),
+                matches(r"^\p{digit}$", "٠"),
+                matches(r"^\P{Lu}$", "a"),
+                matches(r"^\p{General_Category=Lu}$", "A"),
+                matches(r"^[\p{Lu}\d]+$", "A1"),
+            ),
+            (True, False, True, True, True, True),
+        )
+
+    def test_unknown_properties(self):
+        with self.assertRaises(re.error):
+            translate(r"\p{Klingon}")
+
+    def test_unsupported_properties(self):
+        with self.assertRaises(re.error):
+            translate(r"\p{Script=Greek}")
+
+    def test_trailing_backslash(self):
+        with self.assertRaises(re.error):
+            translate("a\\")
+
+    def test_unterminated_class(self):
+        with self.assertRaises(re.error):
+            translate("[a")
+
+
+class TestECMA262Engine(TestCase):
+    def test_compile(self):
+        self.assertIsNone(ECMA262Engine().compile(r"^\d$").search("٠"))
+
+    def test_falls_back_to_later_engines(self):
+        unsupported = mock.Mock(__name__="unsupported")
+        unsupported.compile.side_effect = Exception("no lookarounds here")
+        with self.assertWarns(UserWarning) as w:
+            compiled = ECMA262Engine(unsupported, re).compile("(?=a)")
+        self.assertEqual(
+            (compiled.pattern, unsupported.compile.call_args),
+            ("(?=a)", mock.call("(?=a)")),
+        )
+        self.assertIn("unsupported failed to compile '(?=a)'", str(w.warning))
+
+    def test_errors_from_the_last_engine(self):
+        unsupported = mock.Mock()
+        unsupported.compile.side_effect = Exception("nope")
+        with self.assertRaises(re.error):
+            ECMA262Engine(unsupported, re).compile("(")
+
+    @skipIf(re2 is None, "google-re2 is not installed")
+    def test_linear_time_with_re2(self):
+        engine = ECMA262Engine.linear_time()
+        self.assertEqual(engine.engines, (re2, re))
+
+        for pattern, matching, nonmatching in [
+            ("^abc$", "abc", "abc\n"),
+            ("^a.c", "abc", "a\u2028c"),
+            (r"^\s+$", "\ufeff", "a"),
+            (r"\bfoo", "a foo", "afoo"),
+            (r"a\B", "ab", "a!"),
+            ("^[a-z]+$", "abc", "aBc"),
+            (r"^\p{L}+$", "héllo", "h1"),
+            (r"^[^\p{L}]$", "1", "é"),
+            (r"^\d{3}$", "123", "١٢٣"),
+            (r"^\u{1F600}\u00e9$", "\U0001F600é", "x"),
+            (r"^[a\D]$", "b", "1"),
+            ("^a[]?$", "a", "ab"),
+            (r"^\\u0041$", "\\u0041", "A"),
+            (r"^(?<name>x)$", "x", "y"),
+        ]:
+            with self.subTest(pattern=pattern), warnings.catch_warnings():
+                warnings.simplefilter("error")
+                compiled = engine.compile(pattern)
+                self.assertNotIsInstance(compiled, re.Pattern)
+                self.assertEqual(
+                    (
+                        compiled.search(matching) is not None,
+                        compiled.search(nonmatching) is not None,
+                    ),
+                    (True, False),
+                )
+
+    @skipIf(re2 is None, "google-re2 is not installed")
+    def test_linear_time_with_re2_falls_back_for_unsupported_patterns(self):
+        engine = ECMA262Engine.linear_time()
+        for pattern in [
+            r"(a)\1",
+            r"(?<a>x)\k<a>",
+            "(?=a)",
+            "(?<!a)b",
+            r"[^a\D]",
+        ]:
+            with self.subTest(pattern=pattern), warnings.catch_warnings():
+                warnings.simplefilter("error")
+                self.assertIsInstance(engine.compile(pattern), re.Pattern)
+
+    def test_linear_time_without_re2(self):
+        with mock.patch.dict(sys.modules, re2=None):
+            engine = ECMA262Engine.linear_time()
+        self.assertEqual(engine.engines, (re,))
+
+    def test_repr(self):
+        self.assertEqual(repr(ECMA262Engine()), "<ECMA262Engine (re)>")
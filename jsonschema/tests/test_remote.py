@@ -0,0 +1,215 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase, mock
+import json
+import os
+import tempfile
+import threading
+
+from jsonschema import DiskCache, RefResolver
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Serve the documents of its server, honoring conditional requests.
+    """
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        document, headers = self.server.documents[self.path]
+        etag, modified = headers.get("ETag"), headers.get("Last-Modified")
+        unmodified = (
+            etag is not None and self.headers.get("If-None-Match") == etag
+        ) or (
+            modified is not None
+            and self.headers.get("If-Modified-Since") == modified
+        )
+
+        self.send_response(304 if unmodified else 200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if not unmodified:
+            self.wfile.write(json.dumps(document).encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDiskCache(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.documents = {}
+        self.server.requests = []
+        thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs=dict(poll_interval=0.01),
+        )
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = os.path.join(directory.name, "cache")
+
+    def serve(self, path, document, **headers):
+        self.server.documents[path] = document, headers
+        return f"http://127.0.0.1:{self.server.server_address[1]}{path}"
+
+    def requested(self):
+        return [path for path, _ in self.server.requests]
+
+    def test_fresh_documents_are_not_retrieved_again(self):
+        uri = self.serve("/foo", {"type": "integer"}, **{
+            "Cache-Control": "max-age=3600",
+        })
+        first = DiskCache(self.directory)(uri)
+        second = DiskCache(self.directory)(uri)
+        self.assertEqual(
+            (first, second, self.requested()),
+            ({"type": "integer"}, {"type": "integer"}, ["/foo"]),
+        )
+
+    def test_stale_documents_are_revalidated_by_etag(self):
+        uri = self.serve("/foo", {"type": "integer"}, ETag='"1"')
+        cache = DiskCache(self.directory)
+        cache(uri)
+        self.server.documents["/foo"] = {"type": "string"}, {"ETag": '"1"'}
+        self.assertEqual(
+            (cache(uri), self.server.requests[-1][1].get("If-None-Match")),
+            ({"type": "integer"}, '"1"'),
+        )
+
+    def test_stale_documents_are_revalidated_by_last_modified(self):
+        modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        uri = self.serve("/foo", {"type": "integer"}, **{
+            "Last-Modified": modified,
+        })
+        cache = DiskCache(self.directory)
+        cache(uri)
+        self.server.documents["/foo"] = {"type": "string"}, {
+            "Last-Modified": modified,
+        }
+        self.assertEqual(
+            (
+                cache(uri),
+                self.server.requests[-1][1].get("If-Modified-Since"),
+            ),
+            ({"type": "integer"}, modified),
+        )
+
+    def test_changed_documents_are_retrieved_again(self):
+        uri = self.serve("/foo", {"type": "integer"}, ETag='"1"')
+        cache = DiskCache(self.directory)
+        cache(uri)
+        self.serve("/foo", {"type": "string"}, ETag='"2"')
+        self.assertEqual(
+            (cache(uri), cache(uri), self.requested()),
+            ({"type": "string"}, {"type": "string"}, ["/foo"] * 3),
+        )
+
+    def test_revalidation_refreshes_freshness(self):
+        uri = self.serve("/foo", {"type": "integer"}, ETag='"1"')
+        cache = DiskCache(self.directory)
+        cache(uri)
+        self.server.documents["/foo"] = {"type": "string"}, {
+            "ETag": '"1"',
+            "Cache-Control": "max-age=3600",
+        }
+        self.assertEqual(
+            (cache(uri), cache(uri), self.requested()),
+            ({"type": "integer"}, {"type": "integer"}, ["/foo", "/foo"]),
+        )
+
+    def test_no_store(self):
+        uri = self.serve("/foo", {"type": "integer"}, **{
+            "Cache-Control": "no-store",
+        })
+        cache = DiskCache(self.directory)
+        cache(uri)
+        cache(uri)
+        self.assertEqual(self.requested(), ["/foo", "/foo"])
+
+    def test_stale_documents_are_used_if_retrieving_fails(self):
+        uri = self.serve("/foo", {"type": "integer"})
+        cache = DiskCache(self.directory)
+        cache(uri)
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertEqual(cache(uri), {"type": "integer"})
+
+    def test_errors_are_raised_for_uncached_documents(self):
+        uri = self.serve("/foo", {})
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaises(OSError):
+            DiskCache(self.directory)(uri)
+
+    def test_offline(self):
+        uri = self.serve("/foo", {"type": "integer"})
+        DiskCache(self.directory)(uri)
+        self.assertEqual(
+            (DiskCache(self.directory, offline=True)(uri), self.requested()),
+            ({"type": "integer"}, ["/foo"]),
+        )
+
+    def test_offline_uncached(self):
+        uri = self.serve("/foo", {"type": "integer"})
+        with self.assertRaises(LookupError):
+            DiskCache(self.directory, offline=True)(uri)
+        self.assertEqual(self.requested(), [])
+
+    def test_corrupt_entries_are_ignored(self):
+        uri = self.serve("/foo", {"type": "integer"})
+        cache = DiskCache(self.directory)
+        os.makedirs(self.directory)
+        with open(cache._path_of(uri), "w") as file:
+            file.write("{")
+        self.assertEqual(cache(uri), {"type": "integer"})
+
+    def test_entries_removed_concurrently(self):
+        uri = self.serve("/foo", {"type": "integer"})
+        cache = DiskCache(self.directory)
+        cache(uri)
+        self.serve("/foo", {"type": "string"}, **{
+            "Cache-Control": "no-store",
+        })
+        with mock.patch.object(os, "remove", side_effect=FileNotFoundError):
+            self.assertEqual(cache(uri), {"type": "string"})
+
+    def test_unwritable_directories(self):
+        uri = self.serve("/foo", {"type": "integer"}, **{
+            "Cache-Control": "max-age=3600",
+        })
+        with open(self.directory, "w"):
+            pass
+        cache = DiskCache(self.directory)
+        self.assertEqual(
+            (cache(uri), cache(uri), self.requested()),
+            ({"type": "integer"}, {"type": "integer"}, ["/foo", "/foo"]),
+        )
+
+    def test_failing_to_write_entries(self):
+        uri = self.serve("/foo", {"type": "integer"}, **{
+            "Cache-Control": "max-age=3600",
+        })
+        cache = DiskCache(self.directory)
+        with mock.patch.object(os, "replace", side_effect=PermissionError):
+            self.assertEqual(cache(uri), {"type": "integer"})
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_as_a_resolver_handler(self):
+        uri = self.serve("/foo", {"$defs": {"bar": {"type": "integer"}}})
+        cache = DiskCache(self.directory)
+        resolver = RefResolver.from_schema(
+            {}, handlers={"http": cache, "https": cache},
+        )
+        with resolver.resolving(uri + "#/$defs/bar") as resolved:
+            self.assertEqual(resolved, {"type": "integer"})
+
+    def test_repr(self):
+        self.assertEqual(
+            (repr(DiskCache("foo")), repr(DiskCache("foo", offline=True))),
+            ("<DiskCache 'foo'>", "<DiskCache 'foo', offline>"),
+        )
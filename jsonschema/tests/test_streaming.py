@@ -0,0 +1,236 @@
+from decimal import Decimal
+from functools import partial
+from io import StringIO
+from json import JSONDecodeError
+from unittest import TestCase
+import json
+
+from jsonschema import Draft4Validator, Draft7Validator, Draft202012Validator
+from jsonschema.streaming import iter_errors
+
+
+class TestIterErrors(TestCase):
+    def errors(self, validator, instance, **kwargs):
+        file = StringIO(json.dumps(instance, indent=2))
+        return [
+            (error.message, list(error.path), list(error.schema_path))
+            for error in iter_errors(validator, file, **kwargs)
+        ]
+
+    def assertSameErrors(self, validator, instance):
+        """
+        Assert streaming finds the errors validation of the loaded instance
+        does (ignoring their order, and how the whole instance is shown).
+        """
+        expected = sorted(
+            _compared(error) for error in validator.iter_errors(instance)
+        )
+        for chunk_size in 1, 3, 2 ** 16:
+            file = StringIO(json.dumps(instance, indent=2))
+            got = iter_errors(validator, file, chunk_size=chunk_size)
+            self.assertEqual(
+                sorted(_compared(error) for error in got),
+                expected,
+                msg=f"chunk_size={chunk_size}",
+            )
+
+    def test_array_items(self):
+        validator = Draft202012Validator(
+            {
+                "type": "array",
+                "prefixItems": [{"type": "string"}],
+                "items": {"type": "integer", "minimum": 0},
+            },
+        )
+        self.assertSameErrors(validator, ["foo", 1, -1, "bar", 2.5, [{}]])
+
+    def test_object_properties(self):
+        validator = Draft202012Validator(
+            {
+                "type": "object",
+                "properties": {"foo": {"type": "string"}},
+                "patternProperties": {"^b": {"maxLength": 2}},
+                "additionalProperties": {"type": "integer"},
+                "propertyNames": {"maxLength": 3},
+                "required": ["foo", "quux"],
+            },
+        )
+        self.assertSameErrors(
+            validator,
+            {"foo": 12, "bar": "abc", "baz": "a", 'qu"x': {}, "toolong": 1},
+        )
+
+    def test_paths_of_nested_errors(self):
+        validator = Draft202012Validator(
+            {"items": {"properties": {"foo": {"items": {"type": "null"}}}}},
+        )
+        self.assertEqual(
+            self.errors(validator, [{}, {"foo": [None, 12]}]),
+            [
+                (
+                    "12 is not of type 'null'",
+                    [1, "foo", 1],
+                    ["items", "properties", "foo", "items", "type"],
+                ),
+            ],
+        )
+
+    def test_whole_array_errors(self):
+        validator = Draft202012Validator(
+            {"minItems": 3, "maxItems": 1, "contains": {"type": "string"}},
+        )
+        self.assertEqual(
+            sorted(path for _, _, path in self.errors(validator, [1, 2])),
+            [["contains"], ["maxItems"], ["minItems"]],
+        )
+        self.assertSameErrors(validator, [1, 2])
+        self.assertSameErrors(validator, [1, "2", 3])
+
+    def test_min_and_max_contains(self):
+        validator = Draft202012Validator(
+            {"contains": {"type": "string"}, "minContains": 2},
+        )
+        self.assertSameErrors(validator, ["foo", 1])
+        self.assertSameErrors(validator, ["foo", 1, "bar"])
+
+        validator = Draft202012Validator(
+            {"contains": {"type": "string"}, "maxContains": 1},
+        )
+        self.assertSameErrors(validator, ["foo", 1, "bar"])
+
+    def test_unique_items(self):
+        validator = Draft202012Validator({"uniqueItems": True})
+        self.assertSameErrors(validator, [1, {"a": [1]}, "1", {"a": [1.0]}])
+        self.assertSameErrors(validator, [1, True, 0, False])
+        self.assertSameErrors(validator, [{"a": 1, "b": 2}, {"b": 2, "a": 1}])
+        self.assertSameErrors(validator, [1, 1.5, "1.5", [1.5], 3, 3.0])
+
+    def test_unique_decimals(self):
+        validator = Draft202012Validator({"uniqueItems": True})
+        loads = partial(json.loads, parse_float=Decimal)
+        for document, invalid in [
+            ("[1, 1.0]", True),
+            ("[0.1, 0.10]", True),
+            ('[{"a": [1.5]}, {"a": [1.50]}]', True),
+            ("[0.1, 0.2]", False),
+            ("[1, 1.5, true]", False),
+        ]:
+            with self.subTest(document=document):
+                errors = iter_errors(
+                    validator, StringIO(document), loads=loads,
+                )
+                self.assertEqual(
+                    [error.message for error in errors],
+                    ["[...] has non-unique elements"] if invalid else [],
+                )
+
+    def test_whole_document_errors_have_a_stand_in_instance(self):
+        validator = Draft202012Validator({"maxItems": 1})
+        error, = iter_errors(validator, StringIO("[1, 2]"))
+        self.assertEqual(
+            (repr(error.instance), error.message),
+            ("[...]", "[...] is too long"),
+        )
+
+    def test_draft4_items(self):
+        validator = Draft4Validator(
+            {
+                "items": [{"type": "string"}],
+                "additionalItems": {"type": "integer"},
+            },
+        )
+        self.assertSameErrors(validator, [1, 2, "foo"])
+
+    def test_draft4_additionalItems_false(self):
+        validator = Draft4Validator(
+            {"items": [{"type": "string"}], "additionalItems": False},
+        )
+        self.assertSameErrors(validator, ["foo", 1, 2])
+
+    def test_many_additional_items(self):
+        validator = Draft4Validator(
+            {"items": [{"type": "string"}], "additionalItems": False},
+        )
+        file = StringIO(json.dumps(["foo"] + list(range(100000))))
+        error, = iter_errors(validator, file)
+        shown = ", ".join(str(each) for each in range(20))
+        self.assertEqual(
+            error.message,
+            "Additional items are not allowed "
+            f"({shown}, and 99980 more were unexpected)",
+        )
+
+    def test_draft7_contains(self):
+        validator = Draft7Validator({"contains": {"const": 3}})
+        self.assertSameErrors(validator, [1, 2])
+        self.assertSameErrors(validator, [1, 3])
+
+    def test_wrong_type(self):
+        validator = Draft202012Validator({"type": "object"})
+        self.assertSameErrors(validator, [1])
+
+    def test_other_keywords_load_the_instance(self):
+        validator = Draft202012Validator(
+            {
+                "$defs": {"int": {"type": "integer"}},
+                "items": {"$ref": "#/$defs/int"},
+                "unevaluatedItems": False,
+                "$ref": "#/$defs/int",
+            },
+        )
+        self.assertSameErrors(validator, [1, "foo"])
+
+    def test_scalars(self):
+        validator = Draft202012Validator({"type": "integer"})
+        self.assertSameErrors(validator, 12)
+        self.assertSameErrors(validator, "foo")
+        self.assertSameErrors(validator, None)
+
+    def test_empty(self):
+        validator = Draft202012Validator({"items": False, "minItems": 1})
+        self.assertSameErrors(validator, [])
+        self.assertSameErrors(validator, {})
+
+    def test_strings_containing_delimiters(self):
+        validator = Draft202012Validator({"items": {"maxLength": 3}})
+        self.assertSameErrors(validator, ["[{", '"]}\\', ',\\"', "a\nb"])
+
+    def test_invalid_json(self):
+        validator = Draft202012Validator({"items": {"type": "integer"}})
+        errors = iter_errors(validator, StringIO('[1, "foo", 2,, 3]'))
+        self.assertEqual(list(next(errors).path), [1])
+        with self.assertRaises(JSONDecodeError):
+            list(errors)
+
+    def test_unterminated(self):
+        validator = Draft202012Validator({})
+        with self.assertRaises(JSONDecodeError):
+            list(iter_errors(validator, StringIO('[1, {"foo": [2]')))
+
+    def test_extra_data(self):
+        validator = Draft202012Validator({})
+        with self.assertRaises(JSONDecodeError):
+            list(iter_errors(validator, StringIO("[1, 2] 3")))
+
+    def test_loads(self):
+        validator = Draft202012Validator(
+            {"items": {"multipleOf": Decimal("0.01")}},
+        )
+        file = StringIO("[0.07, 0.075]")
+        errors = iter_errors(
+            validator,
+            file,
+            loads=lambda document: json.loads(document, parse_float=Decimal),
+        )
+        self.assertEqual([list(error.path) for error in errors], [[1]])
+
+
+def _compared(error):
+    """
+    An error's message, path and schema path, with the whole instance (which
+    streaming doesn't keep) shown the same way whether or not it's kept.
+    """
+    message = error.message
+    if not error.path:
+        message = message.replace(repr(error.instance), "<instance>")
+    return message, list(error.path), list(error.schema_path)
@@ -1,6 +1,62 @@
-from unittest import TestCase
-
-from jsonschema._utils import equal
+from unittest import TestCase, mock
+import re
+
+from jsonschema._utils import (
+    Patterns,
+    URIDict,
+    equal,
+    exceeds,
+    find_patterns,
+)
+
+
+class TestURIDict(TestCase):
+    def test_unnormalized_uris(self):
+        uridict = URIDict()
+        uridict["http://example.com/schema#"] = 1
+        self.assertEqual(
+            (uridict["http://example.com/schema"], list(uridict)),
+            (1, ["http://example.com/schema"]),
+        )
+
+    def test_normalized_uris_are_not_normalized_again(self):
+        uridict = URIDict()
+        uridict["http://example.com/schema#"] = 1
+        with mock.patch.object(URIDict, "normalize") as normalize:
+            self.assertEqual(uridict["http://example.com/schema"], 1)
+        normalize.assert_not_called()
+
+
+class TestURIDictOverlaying(TestCase):
+    def test_contains_the_base(self):
+        base = URIDict({"http://example.com/": 1})
+        self.assertEqual(
+            dict(URIDict.overlaying(base)),
+            {"http://example.com/": 1},
+        )
+
+    def test_setting_does_not_modify_the_base(self):
+        base = URIDict({"http://example.com/": 1})
+        uridict = URIDict.overlaying(base)
+        uridict["http://example.com/"] = 2
+        uridict["http://example.com/other"] = 3
+        self.assertEqual(
+            (dict(uridict), dict(base)),
+            (
+                {"http://example.com/": 2, "http://example.com/other": 3},
+                {"http://example.com/": 1},
+            ),
+        )
+
+    def test_deleting_does_not_modify_the_base(self):
+        base = URIDict({"http://example.com/": 1, "http://example.com/b": 2})
+        uridict = URIDict.overlaying(base)
+        uridict["http://example.com/"] = 3
+        del uridict["http://example.com/"]
+        self.assertEqual(
+            (dict(uridict), len(base)),
+            ({"http://example.com/b": 2}, 2),
+        )
 
 
 class TestEqual(TestCase):
@@ -122,3 +178,75 @@ class TestListEqual(TestCase):
         list_1 = ["a", ["b", "c"], "d"]
         list_2 = ["a", [], "c"]
         self.assertFalse(equal(list_1, list_2))
+
+
+class TestPatterns(TestCase):
+    def test_compiles_once(self):
+        patterns = Patterns()
+        self.assertIs(patterns.compile("^a"), patterns.compile("^a"))
+
+    def test_search(self):
+        patterns = Patterns()
+        self.assertEqual(
+            (bool(patterns.search("b+", "abbc")), patterns.search("d", "a")),
+            (True, None),
+        )
+
+    def test_evicts_the_least_recently_used_pattern_when_full(self):
+        patterns = Patterns(maxsize=2)
+        for pattern in "a", "b", "a", "c":
+            patterns.compile(pattern)
+        self.assertEqual(list(patterns._compiled), ["a", "c"])
+
+    def test_compile_within(self):
+        schema = {"pattern": "^a", "patternProperties": {"^b": {}}}
+        patterns = Patterns()
+        patterns.compile_within(schema)
+        with mock.patch.object(patterns, "compile") as compile:
+            patterns.compile_within(schema)
+        self.assertEqual(
+            (sorted(patterns._compiled), compile.called),
+            (["^a", "^b"], False),
+        )
+
+    def test_invalid_patterns(self):
+        with self.assertRaises(re.error):
+            Patterns().compile("[")
+
+
+class TestFindPatterns(TestCase):
+    def test_patterns_within_subschemas(self):
+        schema = {
+            "pattern": "a",
+            "properties": {
+                "foo": {"pattern": "b"},
+                "pattern": {"type": "string"},
+            },
+            "patternProperties": {"c": {"items": [{"pattern": "d"}]}},
+            "$defs": {"bar": {"not": {"pattern": "e"}}},
+        }
+        self.assertEqual(
+            sorted(find_patterns(schema)),
+            ["a", "b", "c", "d", "e"],
+        )
+
+    def test_ignores_non_schemas(self):
+        schema = {
+            "const": {"pattern": "["},
+            "enum": [{"pattern": "["}],
+            "default": {"patternProperties": {"[": {}}},
+            "properties": {"foo": True},
+        }
+        self.assertEqual(list(find_patterns(schema)), [])
+
+
+class TestExceeds(TestCase):
+    def test_scalars(self):
+        self.assertEqual((exceeds(12, 0), exceeds(12, 1)), (True, False))
+
+    def test_nested(self):
+        instance = {"foo": [1, 2, {"bar": 3}], "baz": "quux"}
+        self.assertEqual(
+            (exceeds(instance, 6), exceeds(instance, 7)),
+            (True, False),
+        )
@@ -1,23 +1,36 @@
 from __future__ import annotations
 
 from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 from unittest import TestCase, mock
 from urllib.request import pathname2url
+import asyncio
+import functools
+import gc
+import itertools
 import json
 import os
+import pickle
+import re
+import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 import warnings
+import weakref
 
 import attr
 
 from jsonschema import (
+    ECMA262Engine,
     FormatChecker,
     TypeChecker,
+    _utils,
     exceptions,
     protocols,
     validators,
@@ -102,6 +115,63 @@ class TestCreateAndExtend(TestCase):
         errors = list(validator.iter_errors("goodbye"))
         self.assertEqual(len(errors), 3)
 
+    def test_is_valid(self):
+        valid = self.Validator({"fail": []})
+        invalid = self.Validator({"fail": [{"message": "Whoops!"}]})
+        self.assertEqual(
+            (valid.is_valid("hello"), invalid.is_valid("goodbye")),
+            (True, False),
+        )
+
+    def test_is_valid_uses_the_boolean_form_of_validators(self):
+        def is_valid(validator, value, instance, schema):
+            return instance == value
+
+        Validator = validators.create(
+            meta_schema=self.meta_schema,
+            validators=self.validators,
+            boolean_validators={"fail": is_valid},
+        )
+        validator = Validator({"fail": "hello"})
+        self.assertEqual(
+            (validator.is_valid("hello"), validator.is_valid("goodbye")),
+            (True, False),
+        )
+
+    def test_extending_keeps_boolean_forms_of_unchanged_validators(self):
+        def is_valid(validator, value, instance, schema):
+            return instance == value
+
+        Validator = validators.create(
+            meta_schema=self.meta_schema,
+            validators=self.validators,
+            boolean_validators={"fail": is_valid},
+        )
+        Extended = validators.extend(Validator, {"other": fail})
+        self.assertFalse(Extended({"fail": "hello"}).is_valid("goodbye"))
+
+    def test_wrapping_a_builtin_validator_drops_its_boolean_form(self):
+        original = validators.Draft202012Validator.VALIDATORS["maxLength"]
+
+        @functools.wraps(original)
+        def maxLength(validator, mL, instance, schema):
+            yield from original(validator, mL, instance, schema)
+            if instance == "forbidden":
+                yield exceptions.ValidationError("Forbidden!")
+
+        Validator = validators.extend(
+            validators.Draft202012Validator, {"maxLength": maxLength},
+        )
+        validator = Validator({"maxLength": 20})
+        self.assertEqual(
+            (validator.is_valid("fine"), validator.is_valid("forbidden")),
+            (True, False),
+        )
+        self.assertIn(
+            "maxLength",
+            validators.Draft202012Validator._BOOLEAN_VALIDATORS,
+        )
+
     def test_if_a_version_is_provided_it_is_registered(self):
         Validator = validators.create(
             meta_schema={"$id": "something"},
@@ -241,6 +311,60 @@ class TestCreateAndExtend(TestCase):
         Derived = validators.extend(Original)
         self.assertEqual(Derived.ID_OF(Derived.META_SCHEMA), correct_id)
 
+    def test_regex_engine(self):
+        """
+        Patterns are compiled by a validator class' regex engine, which is
+        carried along (unless replaced) when extending it.
+        """
+        compiled = []
+
+        class Engine(object):
+            def compile(self, pattern):
+                compiled.append(pattern)
+                return re.compile(pattern.upper())
+
+        Validator = validators.create(
+            meta_schema={},
+            validators=validators.Draft202012Validator.VALIDATORS,
+            regex_engine=Engine(),
+        )
+        Derived = validators.extend(Validator)
+        self.assertEqual(
+            (
+                Derived({"pattern": "^a"}).is_valid("A"),
+                compiled,
+                validators.extend(Derived, regex_engine=re).REGEX_ENGINE,
+                validators.Draft202012Validator.REGEX_ENGINE,
+            ),
+            (True, ["^a"], re, re),
+        )
+
+    def test_regex_format_uses_the_regex_engine(self):
+        ECMAValidator = validators.extend(
+            validators.Draft202012Validator,
+            regex_engine=ECMA262Engine(),
+        )
+        schema = {"format": "regex"}
+        checker = validators.Draft202012Validator.FORMAT_CHECKER
+        self.assertEqual(
+            [
+                Validator(schema, format_checker=checker).is_valid(r"\p{L}")
+                for Validator in (
+                    validators.Draft202012Validator,
+                    ECMAValidator,
+                    validators.specialize(validators.Draft202012Validator),
+                    validators.specialize(ECMAValidator),
+                )
+            ],
+            [False, True, False, True],
+        )
+
+        validator = validators.Draft202012Validator(
+            schema, format_checker=checker,
+        )
+        error, = validator.iter_errors(r"\p{L}")
+        self.assertEqual(error.message, r"'\\p{L}' is not a 'regex'")
+
 
 class TestValidationErrorMessages(TestCase):
     def message_for(self, instance, schema, *args, **kwargs):
@@ -1395,6 +1519,135 @@ class TestValidationErrorDetails(TestCase):
             ),
         )
 
+    def test_interleaved_iteration(self):
+        schema = {"items": {"properties": {"foo": {"type": "integer"}}}}
+        validator = validators.Draft202012Validator(schema)
+        errors = zip(
+            validator.iter_errors([{}, {"foo": "a"}, {"foo": "b"}]),
+            validator.iter_errors([{"foo": "c"}, {}, {"foo": "d"}]),
+        )
+        self.assertEqual(
+            [(list(one.path), list(two.path)) for one, two in errors],
+            [([1, "foo"], [0, "foo"]), ([2, "foo"], [2, "foo"])],
+        )
+
+    def test_descending_into_the_same_subschema_concurrently(self):
+        def both(validator, both, instance, schema):
+            return itertools.chain.from_iterable(
+                zip(
+                    validator.descend(instance[0], both, path=0),
+                    validator.descend(instance[1], both, path=1),
+                ),
+            )
+
+        Validator = validators.extend(
+            validators.Draft202012Validator,
+            validators={"both": both},
+        )
+        validator = Validator({"both": {"type": "integer"}})
+        self.assertEqual(
+            [
+                (list(error.path), list(error.schema_path))
+                for error in validator.iter_errors(["a", "b"])
+            ],
+            [([0], ["both", "type"]), ([1], ["both", "type"])],
+        )
+
+    def test_errors_from_evolved_validators_within_keywords(self):
+        def wrap(validator, wrap, instance, schema):
+            return validator.evolve(schema=wrap).iter_errors(instance)
+
+        Validator = validators.extend(
+            validators.Draft202012Validator,
+            validators={"wrap": wrap},
+        )
+        validator = Validator(
+            {"properties": {"foo": {"wrap": {"items": {"minimum": 3}}}}},
+        )
+        error, = validator.iter_errors({"foo": [4, 2]})
+        self.assertEqual(
+            (error.path, error.schema_path),
+            (
+                deque(["foo", 1]),
+                deque(["properties", "foo", "wrap", "items", "minimum"]),
+            ),
+        )
+
+    def test_context_paths_are_relative_to_their_parent(self):
+        schema = {
+            "properties": {
+                "foo": {"anyOf": [{"items": {"type": "integer"}}]},
+            },
+        }
+        validator = validators.Draft202012Validator(schema)
+        error, = validator.iter_errors({"foo": [1, "a"]})
+        child, = error.context
+        self.assertEqual(
+            (
+                child.path,
+                child.schema_path,
+                child.absolute_path,
+                child.absolute_schema_path,
+                error.path,
+                error.schema_path,
+            ),
+            (
+                deque([1]),
+                deque([0, "items", "type"]),
+                deque(["foo", 1]),
+                deque(["properties", "foo", "anyOf", 0, "items", "type"]),
+                deque(["foo"]),
+                deque(["properties", "foo", "anyOf"]),
+            ),
+        )
+
+    def test_paths_within_keywords_are_relative_to_the_keyword(self):
+        def custom(validator, custom, instance, schema):
+            for i, subschema in enumerate(custom):
+                for error in validator.descend(instance, subschema):
+                    error.path.appendleft(("custom", i))
+                    yield error
+
+        Validator = validators.extend(
+            validators.Draft202012Validator,
+            validators={"custom": custom},
+        )
+        validator = Validator(
+            {"properties": {"a": {"custom": [{"type": "string"}]}}},
+        )
+        error, = validator.iter_errors({"a": 1})
+        self.assertEqual(
+            (error.path, error.schema_path),
+            (
+                deque(["a", ("custom", 0)]),
+                deque(["properties", "a", "custom", "type"]),
+            ),
+        )
+
+    def test_pickled_errors_keep_relative_context_paths(self):
+        schema = {
+            "properties": {
+                "a": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            },
+        }
+        validator = validators.Draft202012Validator(schema)
+        error, = validator.iter_errors({"a": 1})
+        unpickled = pickle.loads(pickle.dumps(error))
+        self.assertEqual(
+            (
+                [list(each.relative_path) for each in unpickled.context],
+                [each.parent is unpickled for each in unpickled.context],
+                unpickled.absolute_path,
+                str(unpickled),
+            ),
+            (
+                [[], []],
+                [True, True],
+                deque(["a"]),
+                str(error),
+            ),
+        )
+
 
 class MetaSchemaTestsMixin(object):
     # TODO: These all belong upstream
@@ -1436,6 +1689,116 @@ class ValidatorTestMixin(MetaSchemaTestsMixin, object):
         schema, instance = self.invalid
         self.assertFalse(self.Validator(schema).is_valid(instance))
 
+    def test_is_valid_does_not_create_errors(self):
+        schema, instance = self.invalid
+        validator = self.Validator(
+            {
+                "definitions": {"invalid": schema},
+                "properties": {"foo": {"$ref": "#/definitions/invalid"}},
+            },
+        )
+        with mock.patch.object(exceptions._Error, "__init__") as init:
+            self.assertFalse(validator.is_valid({"foo": instance}))
+        init.assert_not_called()
+
+    def test_invalid_patterns_are_found_when_constructing(self):
+        with self.assertRaises(re.error):
+            self.Validator({"properties": {"foo": {"pattern": "["}}})
+
+    def test_patterns_are_compiled_once(self):
+        validator = self.Validator(
+            {
+                "properties": {"foo": {"pattern": "^a"}},
+                "patternProperties": {"^b": {}},
+                "additionalProperties": False,
+            },
+        )
+        with mock.patch.object(re, "compile") as compile:
+            self.assertEqual(
+                (
+                    validator.is_valid({"foo": "abc", "bar": 1}),
+                    validator.is_valid({"foo": "xyz"}),
+                    len(list(validator.iter_errors({"qux": 2}))),
+                ),
+                (True, False, 1),
+            )
+        compile.assert_not_called()
+
+    def test_evolve(self):
+        original = self.Validator({"type": "integer"})
+        new = original.evolve(
+            schema={"type": "string"},
+            format_checker=self.Validator.FORMAT_CHECKER,
+        )
+        self.assertEqual(
+            (new.schema, new.resolver, new.format_checker),
+            (
+                {"type": "string"},
+                original.resolver,
+                self.Validator.FORMAT_CHECKER,
+            ),
+        )
+        self.assertEqual(original.format_checker, None)
+
+    def test_evolve_to_a_subschema(self):
+        subschema = {"type": "integer"}
+        validator = self.Validator(
+            {"items": subschema},
+            format_checker=FormatChecker(),
+        )
+        evolved = validator.evolve(schema=subschema)
+        self.assertEqual(
+            (evolved.schema, evolved.resolver, evolved.format_checker),
+            (subschema, validator.resolver, validator.format_checker),
+        )
+        self.assertEqual(validator.schema, {"items": subschema})
+
+    def test_evolving_to_the_same_subschema_creates_a_new_validator(self):
+        subschema = {"type": "integer"}
+        validator = self.Validator({"items": subschema})
+        self.assertIsNot(
+            validator.evolve(schema=subschema),
+            validator.evolve(schema=subschema),
+        )
+
+    def test_evolving_compiles_the_new_schemas_patterns(self):
+        validator = self.Validator({})
+        evolved = validator.evolve(schema={"pattern": "^a"})
+        with mock.patch.object(re, "compile") as compile:
+            self.assertTrue(evolved.is_valid("abc"))
+        compile.assert_not_called()
+
+    def test_evolving_shares_compiled_patterns(self):
+        validator = self.Validator({"properties": {"foo": {"pattern": "^a"}}})
+        with mock.patch.object(_utils, "find_patterns") as find_patterns:
+            with mock.patch.object(re, "compile") as compile:
+                evolved = validator.evolve(format_checker=FormatChecker())
+                self.assertTrue(evolved.is_valid({"foo": "abc"}))
+        self.assertEqual(
+            (find_patterns.called, compile.called),
+            (False, False),
+        )
+
+    def test_evolving_within_a_keyword(self):
+        def both(validator, schemas, instance, schema):
+            for each in schemas:
+                yield from validator.evolve(schema=each).iter_errors(instance)
+
+        Validator = validators.extend(self.Validator, {"both": both})
+        validator = Validator({"items": {"both": [{"type": "string"}]}})
+        error, = validator.iter_errors([12])
+        self.assertEqual(
+            (error.path, error.schema_path),
+            (deque([0]), deque(["items", "both", "type"])),
+        )
+
+    def test_evolving_to_a_different_subschema(self):
+        one, two = {"type": "integer"}, {"type": "integer"}
+        validator = self.Validator({"items": [one, two]})
+        evolved = validator.evolve(schema=one)
+        self.assertIsNot(evolved, validator.evolve(schema=two))
+        self.assertIs(evolved.schema, one)
+
     def test_non_existent_properties_are_ignored(self):
         self.Validator({object(): object()}).validate(instance=object())
 
@@ -1470,6 +1833,8 @@ class ValidatorTestMixin(MetaSchemaTestsMixin, object):
 
         with self.assertRaises(exceptions.ValidationError):
             self.Validator(schema, resolver=resolver).validate(None)
+        validator = self.Validator(schema, resolver=resolver)
+        self.assertFalse(validator.is_valid(None))
 
     def test_is_type_is_true_for_valid_type(self):
         self.assertTrue(self.Validator({}).is_type("foo", "string"))
@@ -1724,95 +2089,539 @@ class TestDraft202012Validator(ValidatorTestMixin, TestCase):
     invalid = {"type": "integer"}, "foo"
 
 
-class TestValidatorFor(TestCase):
-    def test_draft_3(self):
-        schema = {"$schema": "http://json-schema.org/draft-03/schema"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft3Validator,
-        )
+class TestCompile(TestCase):
+    def test_errors_are_the_same_as_uncompiled(self):
+        schema = {
+            "$defs": {"positive": {"type": "integer", "minimum": 1}},
+            "properties": {
+                "foo": {"$ref": "#/$defs/positive"},
+                "bar": {"items": {"anyOf": [{"type": "string"}, False]}},
+            },
+        }
+        instance = {"foo": -1, "bar": ["a", 2, None]}
 
-        schema = {"$schema": "http://json-schema.org/draft-03/schema#"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft3Validator,
+        validator = validators.Draft202012Validator(schema)
+        compiled = validator.compile()
+        self.assertEqual(
+            [
+                (e.message, e.path, e.schema_path, e.schema, len(e.context))
+                for e in sorted_errors(compiled.iter_errors(instance))
+            ],
+            [
+                (e.message, e.path, e.schema_path, e.schema, len(e.context))
+                for e in sorted_errors(validator.iter_errors(instance))
+            ],
         )
 
-    def test_draft_4(self):
-        schema = {"$schema": "http://json-schema.org/draft-04/schema"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft4Validator,
+    def test_is_valid(self):
+        compiled = validators.Draft7Validator({"minItems": 2}).compile()
+        self.assertEqual(
+            (compiled.is_valid([1]), compiled.is_valid([1, 2])),
+            (False, True),
         )
 
-        schema = {"$schema": "http://json-schema.org/draft-04/schema#"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft4Validator,
+    def test_refs_are_resolved_once(self):
+        schema = {
+            "definitions": {"foo": {"type": "integer"}},
+            "items": {"$ref": "#/definitions/foo"},
+        }
+        compiled = validators.Draft7Validator(schema).compile()
+        resolve = compiled.resolver.resolve
+        with mock.patch.object(
+            compiled.resolver, "resolve", side_effect=resolve,
+        ) as patched:
+            compiled.validate([1, 2, 3])
+            compiled.validate([4, 5, 6])
+        self.assertEqual(patched.call_count, 1)
+
+    def test_evolving_to_a_subschema_stays_compiled(self):
+        schema = {"not": {"type": "string"}}
+        compiled = validators.Draft7Validator(schema).compile()
+        evolved = compiled.evolve(schema=schema["not"])
+        again = compiled.evolve(schema=schema["not"])
+        self.assertEqual(
+            (evolved is again, evolved._node, evolved.schema),
+            (False, again._node, schema["not"]),
         )
+        self.assertIsNotNone(evolved._node)
 
-    def test_draft_6(self):
-        schema = {"$schema": "http://json-schema.org/draft-06/schema"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft6Validator,
-        )
+    def test_evolving_to_an_unknown_schema(self):
+        compiled = validators.Draft7Validator({}).compile()
+        evolved = compiled.evolve(schema={"type": "string"})
+        self.assertFalse(evolved.is_valid(12))
+        self.assertIsNot(evolved, compiled.evolve(schema={"type": "string"}))
 
-        schema = {"$schema": "http://json-schema.org/draft-06/schema#"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft6Validator,
-        )
+    def test_evolving_other_attributes_is_not_compiled(self):
+        compiled = validators.Draft7Validator({"format": "email"}).compile()
+        evolved = compiled.evolve(format_checker=FormatChecker())
+        self.assertFalse(evolved.is_valid("foo"))
 
-    def test_draft_7(self):
-        schema = {"$schema": "http://json-schema.org/draft-07/schema"}
-        self.assertIs(
-            validators.validator_for(schema),
+    def test_custom_validators(self):
+        Validator = validators.extend(
             validators.Draft7Validator,
+            validators={"fail": fail},
         )
-
-        schema = {"$schema": "http://json-schema.org/draft-07/schema#"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft7Validator,
+        compiled = Validator({"items": {"fail": [{}]}}).compile()
+        error, = compiled.iter_errors([12])
+        self.assertEqual(
+            (error.message, error.path, error.schema_path),
+            ("You told me to fail!", deque([0]), deque(["items", "fail"])),
         )
 
-    def test_draft_201909(self):
-        schema = {"$schema": "https://json-schema.org/draft/2019-09/schema"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft201909Validator,
-        )
 
-        schema = {"$schema": "https://json-schema.org/draft/2019-09/schema#"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft201909Validator,
-        )
+class TestSpecialize(TestCase):
 
-    def test_draft_202012(self):
-        schema = {"$schema": "https://json-schema.org/draft/2020-12/schema"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft202012Validator,
-        )
+    Validator = validators.specialize(validators.Draft202012Validator)
 
-        schema = {"$schema": "https://json-schema.org/draft/2020-12/schema#"}
-        self.assertIs(
-            validators.validator_for(schema),
-            validators.Draft202012Validator,
+    def test_is_valid(self):
+        validator = self.Validator(
+            {
+                "type": "object",
+                "properties": {"foo": {"minimum": 3}},
+                "required": ["foo"],
+            },
+        )
+        self.assertEqual(
+            (
+                validator.is_valid({"foo": 3}),
+                validator.is_valid({"foo": 2}),
+                validator.is_valid({}),
+                validator.is_valid([]),
+            ),
+            (True, False, False, False),
         )
 
-    def test_True(self):
-        self.assertIs(
-            validators.validator_for(True),
-            validators._LATEST_VERSION,
+    def test_errors_are_the_same_as_unspecialized(self):
+        schema = {
+            "$defs": {"positive": {"type": "integer", "minimum": 1}},
+            "properties": {
+                "foo": {"$ref": "#/$defs/positive"},
+                "bar": {"items": {"anyOf": [{"type": "string"}, False]}},
+            },
+        }
+        instance = {"foo": -1, "bar": ["a", 2, None]}
+
+        validator = validators.Draft202012Validator(schema)
+        specialized = self.Validator(schema)
+        self.assertEqual(
+            [
+                (e.message, e.path, e.schema_path, e.schema)
+                for e in sorted_errors(specialized.iter_errors(instance))
+            ],
+            [
+                (e.message, e.path, e.schema_path, e.schema)
+                for e in sorted_errors(validator.iter_errors(instance))
+            ],
         )
 
-    def test_False(self):
-        self.assertIs(
-            validators.validator_for(False),
-            validators._LATEST_VERSION,
+    def test_valid_instances_are_not_interpreted(self):
+        validator = self.Validator({"items": {"type": "integer"}})
+        with mock.patch.object(
+            validators.Draft202012Validator, "iter_errors",
+        ) as iter_errors:
+            validator.validate([1, 2, 3])
+        iter_errors.assert_not_called()
+
+    def test_recursive_refs(self):
+        schema = {
+            "properties": {
+                "children": {"items": {"$ref": "#"}},
+                "value": {"type": "integer"},
+            },
+        }
+        validator = self.Validator(schema)
+        self.assertEqual(
+            (
+                validator.is_valid({"children": [{"children": [{}]}]}),
+                validator.is_valid({"children": [{"value": "foo"}]}),
+            ),
+            (True, False),
+        )
+
+    def test_custom_validators_are_interpreted(self):
+        Validator = validators.specialize(
+            validators.extend(
+                validators.Draft7Validator,
+                validators={"fail": fail},
+            ),
+        )
+        validator = Validator({"items": {"fail": [{}]}})
+        self.assertEqual(
+            (validator.is_valid([]), validator.is_valid([12])),
+            (True, False),
+        )
+
+    def test_custom_type_checker(self):
+        Validator = validators.specialize(
+            validators.extend(
+                validators.Draft7Validator,
+                type_checker=validators.Draft7Validator.TYPE_CHECKER.redefine(
+                    "string", lambda checker, instance: instance == "foo",
+                ),
+            ),
+        )
+        validator = Validator({"type": "string"})
+        self.assertEqual(
+            (validator.is_valid("foo"), validator.is_valid("bar")),
+            (True, False),
+        )
+
+    def test_dynamic_refs_are_interpreted(self):
+        schema = {
+            "$dynamicAnchor": "node",
+            "properties": {"child": {"$dynamicRef": "#node"}},
+            "type": "object",
+        }
+        validator = self.Validator(schema)
+        self.assertEqual(
+            (
+                validator.is_valid({"child": {"child": {}}}),
+                validator.is_valid({"child": {"child": 1}}),
+            ),
+            (True, False),
+        )
+
+    def test_format_checker(self):
+        validator = self.Validator(
+            {"format": "email"},
+            format_checker=FormatChecker(),
+        )
+        self.assertEqual(
+            (validator.is_valid("foo@example.com"), validator.is_valid("foo")),
+            (True, False),
+        )
+
+    def test_additionalProperties_with_backreferencing_patterns(self):
+        schema = {
+            "patternProperties": {"^(a)\\1$": {}, "^(b)\\1$": {}},
+            "additionalProperties": False,
+        }
+        validator = self.Validator(schema)
+        self.assertEqual(
+            (
+                validator.is_valid({"aa": 1}),
+                validator.is_valid({"bb": 1}),
+                validator.is_valid({"ab": 1}),
+            ),
+            (True, True, False),
+        )
+
+    def test_invalid_patterns_are_interpreted(self):
+        # invalid patterns within the schema itself are found up front
+        resolver = validators.RefResolver(
+            "",
+            {},
+            store={"http://example.com/invalid": {"pattern": "["}},
+        )
+        validator = self.Validator(
+            {"$ref": "http://example.com/invalid"},
+            resolver=resolver,
+        )
+        self.assertTrue(validator.is_valid(12))
+        with self.assertRaises(re.error):
+            validator.is_valid("foo")
+
+
+class TestAsync(TestCase):
+    def test_importing_does_not_import_asyncio(self):
+        code = (
+            "import sys, jsonschema; "
+            "print(sorted(set(sys.modules) & {'asyncio', 'concurrent'}))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.strip(), b"[]")
+
+    def test_aiter_errors(self):
+        validator = validators.Draft202012Validator(
+            {"items": {"type": "integer"}, "maxItems": 1},
+        )
+
+        async def errors():
+            return [e.message async for e in validator.aiter_errors([1, "2"])]
+
+        self.assertEqual(
+            asyncio.run(errors()),
+            [e.message for e in validator.iter_errors([1, "2"])],
+        )
+
+    def test_avalidate(self):
+        validator = validators.Draft202012Validator({"type": "integer"})
+        asyncio.run(validator.avalidate(12))
+        with self.assertRaises(exceptions.ValidationError):
+            asyncio.run(validator.avalidate("12"))
+
+    def test_async_handlers_are_awaited(self):
+        retrieved = []
+
+        async def handler(uri):
+            retrieved.append(uri)
+            await asyncio.sleep(0)
+            return {"type": "integer"}
+
+        schema = {"$ref": "http://example.com/int"}
+        validator = validators.Draft202012Validator(
+            schema,
+            resolver=validators.RefResolver.from_schema(
+                schema, handlers={"http": handler},
+            ),
+        )
+
+        async def validate():
+            await validator.avalidate(12)
+            await validator.avalidate(13)
+            with self.assertRaises(exceptions.ValidationError):
+                await validator.avalidate("12")
+
+        asyncio.run(validate())
+        self.assertEqual(retrieved, ["http://example.com/int"])
+
+    def test_sync_handlers_do_not_block_the_loop(self):
+        released = threading.Event()
+
+        def handler(uri):
+            self.assertTrue(released.wait(timeout=5))
+            return {"type": "integer"}
+
+        schema = {"$ref": "http://example.com/int"}
+        validator = validators.Draft202012Validator(
+            schema,
+            resolver=validators.RefResolver.from_schema(
+                schema, handlers={"http": handler},
+            ),
+        )
+
+        async def release():
+            await asyncio.sleep(0)
+            released.set()
+
+        async def validate():
+            await asyncio.gather(validator.avalidate(12), release())
+
+        asyncio.run(validate())
+
+    def test_concurrent_validations(self):
+        async def handler(uri):
+            await asyncio.sleep(0)
+            return {
+                "$defs": {"x": {"type": "string"}},
+                "items": {"$ref": "#/$defs/x"},
+            }
+
+        schema = {
+            "$defs": {"x": {"type": "integer"}},
+            "prefixItems": [
+                {"$ref": "http://example.com/other.json"},
+                {"$ref": "#/$defs/x"},
+            ],
+        }
+        validator = validators.Draft202012Validator(
+            schema,
+            resolver=validators.RefResolver.from_schema(
+                schema, handlers={"http": handler},
+            ),
+        )
+
+        async def errors(instance):
+            messages = []
+            async for error in validator.aiter_errors(instance):
+                messages.append(error.message)
+                await asyncio.sleep(0)
+            return messages
+
+        async def validate():
+            return await asyncio.gather(
+                errors([[1, 2], 1]),
+                errors([[], 1]),
+                errors([[], "1"]),
+            )
+
+        self.assertEqual(
+            asyncio.run(validate()),
+            [
+                ["1 is not of type 'string'", "2 is not of type 'string'"],
+                [],
+                ["'1' is not of type 'integer'"],
+            ],
+        )
+
+    def test_failed_retrieval(self):
+        retrieved = []
+
+        async def handler(uri):
+            retrieved.append(uri)
+            if len(retrieved) == 1:
+                raise ConnectionError(uri)
+            return {"type": "integer"}
+
+        schema = {"$ref": "http://example.com/int"}
+        validator = validators.Draft202012Validator(
+            schema,
+            resolver=validators.RefResolver.from_schema(
+                schema, handlers={"http": handler},
+            ),
+        )
+
+        with self.assertRaises(exceptions.RefResolutionError) as e:
+            asyncio.run(validator.avalidate(12))
+        self.assertIsInstance(e.exception._cause, ConnectionError)
+
+        asyncio.run(validator.avalidate(12))
+        self.assertEqual(retrieved, ["http://example.com/int"] * 2)
+
+    def test_large_instances_are_offloaded(self):
+        submitted = []
+
+        class Executor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(args)
+                return super().submit(fn, *args, **kwargs)
+
+        executor = Executor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        validator = validators.Draft202012Validator(
+            {"items": {"type": "integer"}},
+        )
+
+        async def errors(instance):
+            return [
+                error.message
+                async for error in validator.aiter_errors(
+                    instance, offload_above=3, executor=executor,
+                )
+            ]
+
+        self.assertEqual(
+            (asyncio.run(errors([1, "2"])), submitted),
+            (["'2' is not of type 'integer'"], []),
+        )
+        self.assertEqual(
+            asyncio.run(errors([1, 2, 3, "4"])),
+            ["'4' is not of type 'integer'"],
+        )
+        self.assertEqual(len(submitted), 1)
+
+    def test_async_handlers_outside_an_event_loop(self):
+        async def handler(uri):
+            return {"type": "integer"}
+
+        schema = {"$ref": "http://example.com/int"}
+        validator = validators.Draft202012Validator(
+            schema,
+            resolver=validators.RefResolver.from_schema(
+                schema, handlers={"http": handler},
+            ),
+        )
+        self.assertFalse(validator.is_valid("12"))
+
+    def test_async_handlers_synchronously_within_an_event_loop(self):
+        async def handler(uri):
+            return {"type": "integer"}
+
+        schema = {"$ref": "http://example.com/int"}
+        validator = validators.Draft202012Validator(
+            schema,
+            resolver=validators.RefResolver.from_schema(
+                schema, handlers={"http": handler},
+            ),
+        )
+
+        async def validate():
+            validator.is_valid(12)
+
+        with self.assertRaises(exceptions.RefResolutionError) as e:
+            asyncio.run(validate())
+        self.assertIn("must be retrieved asynchronously", str(e.exception))
+
+
+class TestValidatorFor(TestCase):
+    def test_draft_3(self):
+        schema = {"$schema": "http://json-schema.org/draft-03/schema"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft3Validator,
+        )
+
+        schema = {"$schema": "http://json-schema.org/draft-03/schema#"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft3Validator,
+        )
+
+    def test_draft_4(self):
+        schema = {"$schema": "http://json-schema.org/draft-04/schema"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft4Validator,
+        )
+
+        schema = {"$schema": "http://json-schema.org/draft-04/schema#"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft4Validator,
+        )
+
+    def test_draft_6(self):
+        schema = {"$schema": "http://json-schema.org/draft-06/schema"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft6Validator,
+        )
+
+        schema = {"$schema": "http://json-schema.org/draft-06/schema#"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft6Validator,
+        )
+
+    def test_draft_7(self):
+        schema = {"$schema": "http://json-schema.org/draft-07/schema"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft7Validator,
+        )
+
+        schema = {"$schema": "http://json-schema.org/draft-07/schema#"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft7Validator,
+        )
+
+    def test_draft_201909(self):
+        schema = {"$schema": "https://json-schema.org/draft/2019-09/schema"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft201909Validator,
+        )
+
+        schema = {"$schema": "https://json-schema.org/draft/2019-09/schema#"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft201909Validator,
+        )
+
+    def test_draft_202012(self):
+        schema = {"$schema": "https://json-schema.org/draft/2020-12/schema"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft202012Validator,
+        )
+
+        schema = {"$schema": "https://json-schema.org/draft/2020-12/schema#"}
+        self.assertIs(
+            validators.validator_for(schema),
+            validators.Draft202012Validator,
+        )
+
+    def test_True(self):
+        self.assertIs(
+            validators.validator_for(True),
+            validators._LATEST_VERSION,
+        )
+
+    def test_False(self):
+        self.assertIs(
+            validators.validator_for(False),
+            validators._LATEST_VERSION,
         )
 
     def test_custom_validator(self):
@@ -1864,6 +2673,10 @@ class TestValidatorFor(TestCase):
 
 
 class TestValidate(TestCase):
+    def setUp(self):
+        validators.validate.cache_clear()
+        self.addCleanup(validators.validate.cache_clear)
+
     def assertUses(self, schema, Validator):
         result = []
         with mock.patch.object(Validator, "check_schema", result.append):
@@ -1955,6 +2768,129 @@ class TestValidate(TestCase):
             validators.validate(12, schema)
         self.assertIn("12 is not of type", str(e.exception))
 
+    def test_equal_schemas_are_checked_once(self):
+        checked = []
+        check_schema = validators.Draft7Validator.check_schema
+        with mock.patch.object(
+            validators.Draft7Validator,
+            "check_schema",
+            lambda schema: checked.append(schema) or check_schema(schema),
+        ):
+            for instance in 12, 13:
+                validators.validate(
+                    instance,
+                    {"type": "integer"},
+                    cls=validators.Draft7Validator,
+                )
+            with self.assertRaises(exceptions.ValidationError):
+                validators.validate(
+                    "foo",
+                    {"type": "integer"},
+                    cls=validators.Draft7Validator,
+                )
+        self.assertEqual(
+            (checked, validators.validate.cache_info()),
+            (
+                [{"type": "integer"}],
+                (2, 1, 128, 1),
+            ),
+        )
+
+    def test_errors_refer_to_the_schema_passed_in(self):
+        schemas = [{"items": {"type": "integer"}} for _ in range(2)]
+        errors = []
+        for schema in schemas:
+            with self.assertRaises(exceptions.ValidationError) as e:
+                validators.validate(["foo"], schema)
+            errors.append(e.exception)
+        self.assertEqual(
+            [
+                (error.schema is schema["items"], error.validator)
+                for error, schema in zip(errors, schemas)
+            ],
+            [(True, "type"), (True, "type")],
+        )
+        self.assertEqual(validators.validate.cache_info()[:2], (1, 1))
+
+    def test_schemas_differing_only_in_python_are_cached_separately(self):
+        validators.validate(1, {"const": 1})
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate(1, {"const": True})
+        validators.validate(1, {"const": 1.0})
+        self.assertEqual(validators.validate.cache_info().misses, 3)
+
+    def test_cached_validators_are_keyed_by_arguments(self):
+        validators.validate("foo", {"format": "ipv4"})
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate(
+                "foo",
+                {"format": "ipv4"},
+                format_checker=FormatChecker(),
+            )
+        self.assertEqual(validators.validate.cache_info().currsize, 2)
+
+    def test_equivalent_format_checkers_share_a_cached_validator(self):
+        for _ in range(3):
+            with self.assertRaises(exceptions.ValidationError):
+                validators.validate(
+                    "foo",
+                    {"format": "ipv4"},
+                    format_checker=FormatChecker(),
+                )
+        self.assertEqual(validators.validate.cache_info(), (2, 1, 128, 1))
+
+    def test_changing_a_format_checker_after_validating_with_it(self):
+        checker = FormatChecker(formats=())
+        validators.validate("foo", {"format": "foo"}, format_checker=checker)
+        checker.checks("foo")(lambda instance: instance != "foo")
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate(
+                "foo", {"format": "foo"}, format_checker=checker,
+            )
+        validators.validate(
+            "foo", {"format": "foo"}, format_checker=FormatChecker(()),
+        )
+
+    def test_schemas_differing_only_in_key_types_are_not_cached(self):
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate({"1": 1}, {"properties": {"1": {"const": 2}}})
+        validators.validate({"1": 1}, {"properties": {1: {"const": 2}}})
+        self.assertEqual(validators.validate.cache_info()[1:], (2, 128, 1))
+
+    def test_schemas_with_tuples_are_not_cached(self):
+        validators.validate(1, {"enum": [1, 2]})
+        with self.assertRaises(exceptions.SchemaError):
+            validators.validate(1, {"enum": (1, 2)})
+
+    def test_mutating_a_schema_after_validating_with_it(self):
+        schema = {"type": "integer"}
+        validators.validate(12, schema)
+        schema["type"] = "string"
+        validators.validate("foo", schema)
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate("foo", {"type": "integer"})
+
+    def test_uncacheable_schemas(self):
+        schema = {"enum": [Decimal("1.5")]}
+        validators.validate(Decimal("1.5"), schema)
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate(2, schema)
+        self.assertEqual(validators.validate.cache_info(), (0, 2, 128, 0))
+
+    def test_least_recently_used_validators_are_evicted(self):
+        cache = validators._ValidatorCache(maxsize=2)
+        Validator = validators.Draft202012Validator
+        integer = {"type": "integer"}
+        first = cache.validator(Validator, integer, (), {})
+        cache.validator(Validator, {"type": "string"}, (), {})
+        cache.validator(Validator, integer, (), {})
+        cache.validator(Validator, {"type": "array"}, (), {})
+        again = cache.validator(Validator, integer, (), {})
+        self.assertEqual(
+            (again is first, cache.cache_info()),
+            (True, (2, 3, 2, 2)),
+        )
+
 
 class TestRefResolver(TestCase):
 
@@ -1994,6 +2930,359 @@ class TestRefResolver(TestCase):
         with resolver.resolving("http://bar/schema#/a") as resolved:
             self.assertEqual(resolved, schema["a"])
 
+    def test_it_indexes_the_referrer_once(self):
+        schema = {
+            "$defs": {
+                "foo": {"$anchor": "foo"},
+                "bar": {"$id": "http://example.com/bar"},
+                "baz": {"$dynamicAnchor": "baz"},
+            },
+        }
+        resolver = validators.RefResolver.from_schema(schema)
+        with mock.patch.object(
+            _utils, "search_schema", wraps=_utils.search_schema,
+        ) as search_schema:
+            resolved = [
+                resolver.resolve(ref)[1]
+                for ref in ["#foo", "http://example.com/bar", "#baz", "#foo"]
+            ]
+        self.assertEqual(
+            (resolved, search_schema.call_count),
+            (
+                [
+                    {"$anchor": "foo"},
+                    {"$id": "http://example.com/bar"},
+                    {"$dynamicAnchor": "baz"},
+                    {"$anchor": "foo"},
+                ],
+                1,
+            ),
+        )
+
+    def test_it_indexes_subschemas_only_by_their_drafts_id(self):
+        schema = {
+            "$defs": {
+                "foo": {"id": "http://example.com/foo"},
+                "bar": {"$id": "http://example.com/bar"},
+            },
+        }
+        resolvers = [
+            validators.Draft4Validator(schema).resolver,
+            validators.Draft202012Validator(schema).resolver,
+        ]
+        found = [
+            [
+                resolver._find_in_subschemas(url, "")
+                for url in ["http://example.com/foo", "http://example.com/bar"]
+            ] for resolver in resolvers
+        ]
+        self.assertEqual(
+            found,
+            [
+                [("http://example.com/foo", schema["$defs"]["foo"]), None],
+                [None, ("http://example.com/bar", schema["$defs"]["bar"])],
+            ],
+        )
+
+    def test_it_indexes_stored_documents_once(self):
+        definitions = {
+            "$defs": {
+                "foo": {"$anchor": "foo"},
+                "bar": {"type": "integer"},
+            },
+        }
+        resolver = validators.RefResolver(
+            "", {}, store={"http://example.com/defs": definitions},
+        )
+        with mock.patch.object(
+            _utils, "search_schema", wraps=_utils.search_schema,
+        ) as search_schema:
+            resolved = [
+                resolver.resolve_from_url("http://example.com/defs" + ref)
+                for ref in ["#foo", "#/$defs/bar", "#foo", "#/$defs/bar"]
+            ]
+        self.assertEqual(
+            (resolved, search_schema.call_count),
+            (
+                [
+                    {"$anchor": "foo"},
+                    {"type": "integer"},
+                    {"$anchor": "foo"},
+                    {"type": "integer"},
+                ],
+                1,
+            ),
+        )
+
+    def test_it_indexes_only_recently_used_documents(self):
+        first, second = {"$anchor": "foo"}, {"$anchor": "bar"}
+        resolver = validators.RefResolver("", {})
+        with mock.patch.object(validators, "_MAX_INDEXED_DOCUMENTS", 1):
+            resolver.resolve_fragment(first, "foo")
+            resolver.resolve_fragment(second, "bar")
+        self.assertEqual(
+            [document for document, _ in resolver._indexes.values()],
+            [second],
+        )
+
+    def test_unresolvable_pointers_are_not_remembered(self):
+        document = {}
+        resolver = validators.RefResolver("", {})
+        with self.assertRaises(exceptions.RefResolutionError):
+            resolver.resolve_fragment(document, "/foo")
+        document["foo"] = 12
+        self.assertEqual(resolver.resolve_fragment(document, "/foo"), 12)
+
+    def test_prefetch(self):
+        requested = []
+        documents = {
+            "/foo": {"$ref": "bar#/$defs/baz"},
+            "/bar": {"$defs": {"baz": {"type": "integer"}}},
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requested.append(self.path)
+                body = json.dumps(documents[self.path]).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(
+            target=server.serve_forever,
+            kwargs=dict(poll_interval=0.01),
+        )
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        validator = validators.Draft202012Validator(
+            {"items": {"$ref": f"{base}/foo"}},
+        )
+        validator.resolver.prefetch()
+        prefetched = sorted(requested)
+
+        server.shutdown()
+        self.assertEqual(
+            (
+                prefetched,
+                validator.is_valid([1, 2]),
+                validator.is_valid([1, "2"]),
+            ),
+            (["/bar", "/foo"], True, False),
+        )
+
+    def test_prefetch_is_concurrent(self):
+        both_fetching = threading.Barrier(2, timeout=5)
+
+        def fetch(uri):
+            both_fetching.wait()
+            return {"type": "integer"}
+
+        resolver = validators.RefResolver.from_schema(
+            {"anyOf": [{"$ref": "foo://one"}, {"$ref": "foo://two"}]},
+            handlers={"foo": fetch},
+        )
+        resolver.prefetch(max_workers=2)
+        self.assertEqual(
+            (resolver.store["foo://one"], resolver.store["foo://two"]),
+            ({"type": "integer"}, {"type": "integer"}),
+        )
+
+    def test_prefetch_skips_known_and_embedded_documents(self):
+        fetched = []
+
+        def fetch(uri):
+            fetched.append(uri)
+            return {"$ref": "http://example.com/one"}
+
+        schema = {
+            "$id": "http://example.com/root/",
+            "$defs": {
+                "embedded": {"$id": "embedded", "type": "integer"},
+                "known": {"$ref": "http://json-schema.org/draft-07/schema"},
+            },
+            "allOf": [
+                {"$ref": "embedded"},
+                {"$ref": "#/$defs/known"},
+                {"$ref": "http://example.com/one"},
+                {"$ref": "relative/to/root#/$defs/foo"},
+            ],
+        }
+        resolver = validators.RefResolver.from_schema(
+            schema, handlers={"http": fetch},
+        )
+        resolver.prefetch()
+        self.assertEqual(
+            sorted(fetched),
+            [
+                "http://example.com/one",
+                "http://example.com/root/relative/to/root",
+            ],
+        )
+
+    def test_prefetch_failures_are_deferred(self):
+        def fetch(uri):
+            raise ValueError("Oh no!")
+
+        resolver = validators.RefResolver.from_schema(
+            {"$ref": "foo://bar"}, handlers={"foo": fetch},
+        )
+        resolver.prefetch()
+        with self.assertRaises(exceptions.RefResolutionError):
+            resolver.resolve("foo://bar")
+
+    def test_it_does_not_keep_resolvers_alive(self):
+        resolver = validators.RefResolver.from_schema({"$anchor": "foo"})
+        resolver.resolve("#foo")
+        alive = weakref.ref(resolver)
+        del resolver
+        gc.collect()
+        self.assertIsNone(alive())
+
+    def test_each_thread_has_its_own_scope(self):
+        resolver = validators.RefResolver("http://example.com/", {})
+        resolver.push_scope("foo/")
+
+        scopes = []
+        thread = threading.Thread(
+            target=lambda: scopes.append(resolver.resolution_scope),
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(
+            (scopes, resolver.resolution_scope),
+            (["http://example.com/"], "http://example.com/foo/"),
+        )
+
+    def test_it_can_be_shared_across_threads(self):
+        schema = {
+            "$id": "http://example.com/root.json",
+            "properties": {
+                "foo": {
+                    "$id": "foo/",
+                    "$defs": {"int": {"$id": "int", "type": "integer"}},
+                    "items": {"$ref": "int"},
+                },
+                "bar": {
+                    "$id": "bar/",
+                    "$defs": {"str": {"$id": "str", "type": "string"}},
+                    "items": {"$ref": "str"},
+                },
+            },
+        }
+        validator = validators.Draft202012Validator(schema)
+        valid, invalid = {"foo": [1] * 20, "bar": ["1"] * 20}, {"foo": ["1"]}
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def validate():
+            barrier.wait()
+            results.append(
+                [
+                    (validator.is_valid(valid), validator.is_valid(invalid))
+                    for _ in range(50)
+                ],
+            )
+
+        threads = [threading.Thread(target=validate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [[(True, False)] * 50] * 8)
+
+    def test_interleaved_validations_have_their_own_scopes(self):
+        schema = {
+            "$defs": {"x": {"type": "integer"}},
+            "prefixItems": [
+                {"$ref": "http://example.com/other.json"},
+                {"$ref": "#/$defs/x"},
+            ],
+        }
+        other = {
+            "$id": "http://example.com/other.json",
+            "$defs": {"x": {"type": "string"}},
+            "items": {"$ref": "#/$defs/x"},
+        }
+        resolver = validators.RefResolver.from_schema(
+            schema,
+            store={other["$id"]: other},
+        )
+        validator = validators.Draft202012Validator(schema, resolver=resolver)
+
+        # suspended while within other.json
+        errors = validator.iter_errors([[1], 1])
+        self.assertEqual(next(errors).message, "1 is not of type 'string'")
+
+        self.assertEqual(list(validator.iter_errors([[], 1])), [])
+        self.assertTrue(validator.is_valid([[], 1]))
+        self.assertEqual(list(errors), [])
+
+    def test_finished_validations_are_reused(self):
+        schema = {"$defs": {"x": {"type": "integer"}}, "items": {"$ref": "#"}}
+        validator = validators.Draft202012Validator(schema)
+        validator.validate([[1]])
+        with mock.patch.object(
+            validators.RefResolver, "_with_own_scopes",
+        ) as with_own_scopes:
+            self.assertEqual(
+                (
+                    [e.message for e in validator.iter_errors([["a"]])],
+                    validator.is_valid([[1]]),
+                ),
+                ([], True),
+            )
+        with_own_scopes.assert_not_called()
+
+    def test_changed_validators_are_not_reused(self):
+        validator = validators.Draft202012Validator({"format": "email"})
+        self.assertTrue(validator.is_valid("foo"))
+        validator.format_checker = FormatChecker()
+        self.assertFalse(validator.is_valid("foo"))
+
+        resolver = validators.RefResolver("", {"type": "string"})
+        validator.resolver = resolver
+        validator.schema = {"$ref": "#"}
+        self.assertEqual(
+            (validator.is_valid(12), validator.resolver.resolution_scope),
+            (False, ""),
+        )
+
+    def test_pickling(self):
+        resolver = validators.RefResolver(
+            "http://example.com/",
+            {"$anchor": "foo"},
+            store={"http://example.com/bar": {"type": "integer"}},
+            handlers={"foo": json.loads},
+        )
+        resolver.push_scope("baz/")
+        unpickled = pickle.loads(pickle.dumps(resolver))
+        self.assertEqual(
+            (
+                unpickled.resolution_scope,
+                unpickled.resolve("#foo"),
+                unpickled.resolve("bar"),
+                unpickled.handlers,
+                unpickled.store["http://json-schema.org/draft-07/schema"],
+            ),
+            (
+                "http://example.com/",
+                ("http://example.com/#foo", {"$anchor": "foo"}),
+                ("http://example.com/bar", {"type": "integer"}),
+                {"foo": json.loads},
+                validators.Draft7Validator.META_SCHEMA,
+            ),
+        )
+
     def test_it_retrieves_stored_refs(self):
         with self.resolver.resolving(self.stored_uri) as resolved:
             self.assertIs(resolved, self.stored_schema)
@@ -2010,6 +3299,8 @@ class TestRefResolver(TestCase):
             self.addCleanup(
                 sys.modules.__setitem__, "requests", sys.modules["requests"],
             )
+        else:
+            self.addCleanup(sys.modules.pop, "requests")
         sys.modules["requests"] = ReallyFakeRequests({"http://bar": schema})
 
         with self.resolver.resolving(ref) as resolved:
@@ -2023,6 +3314,8 @@ class TestRefResolver(TestCase):
             self.addCleanup(
                 sys.modules.__setitem__, "requests", sys.modules["requests"],
             )
+        else:
+            self.addCleanup(sys.modules.pop, "requests")
         sys.modules["requests"] = None
 
         @contextmanager
@@ -2037,6 +3330,51 @@ class TestRefResolver(TestCase):
             pass
         self.assertEqual(resolved, 12)
 
+    def test_it_decodes_unstored_refs_with_loads(self):
+        ref = "http://bar#baz"
+
+        if "requests" in sys.modules:
+            self.addCleanup(
+                sys.modules.__setitem__, "requests", sys.modules["requests"],
+            )
+        else:
+            self.addCleanup(sys.modules.pop, "requests")
+        sys.modules["requests"] = None
+
+        @contextmanager
+        def fake_urlopen(url):
+            yield BytesIO(b'{"baz": 1.1}')
+
+        self.addCleanup(setattr, validators, "urlopen", validators.urlopen)
+        validators.urlopen = fake_urlopen
+
+        resolver = validators.RefResolver(
+            "", {}, loads=lambda s: json.loads(s, parse_float=Decimal),
+        )
+        with resolver.resolving(ref) as resolved:
+            pass
+        self.assertEqual(repr(resolved), repr(Decimal("1.1")))
+
+    def test_it_decodes_unstored_refs_via_requests_with_loads(self):
+        ref = "http://bar#baz"
+
+        if "requests" in sys.modules:
+            self.addCleanup(
+                sys.modules.__setitem__, "requests", sys.modules["requests"],
+            )
+        else:
+            self.addCleanup(sys.modules.pop, "requests")
+        sys.modules["requests"] = ReallyFakeRequests(
+            {"http://bar": {"baz": 1.1}},
+        )
+
+        resolver = validators.RefResolver(
+            "", {}, loads=lambda s: json.loads(s, parse_float=Decimal),
+        )
+        with resolver.resolving(ref) as resolved:
+            pass
+        self.assertEqual(repr(resolved), repr(Decimal("1.1")))
+
     def test_it_retrieves_local_refs_via_urlopen(self):
         with tempfile.NamedTemporaryFile(delete=False, mode="wt") as tempf:
             self.addCleanup(os.remove, tempf.name)
@@ -2046,6 +3384,32 @@ class TestRefResolver(TestCase):
         with self.resolver.resolving(ref) as resolved:
             self.assertEqual(resolved, "bar")
 
+    def test_resolvers_share_the_store_of_known_meta_schemas(self):
+        one = validators.RefResolver("", {})
+        two = validators.RefResolver("", {})
+        one.store["http://example.com/"] = {}
+        del one.store[validators.Draft7Validator.META_SCHEMA["$id"]]
+        self.assertEqual(
+            (
+                "http://example.com/" in two.store,
+                validators.Draft7Validator.META_SCHEMA["$id"] in two.store,
+                validators.Draft7Validator.META_SCHEMA["$id"] in one.store,
+            ),
+            (False, True, False),
+        )
+
+    def test_store_contains_newly_registered_meta_schemas(self):
+        validators.RefResolver("", {})
+        Validator = validators.create(
+            meta_schema={"$id": "something"},
+            version="my version",
+        )
+        self.addCleanup(validators._shared_store.cache_clear)
+        self.addCleanup(validators._META_SCHEMAS.pop, "something")
+        self.addCleanup(validators._VALIDATORS.pop, "my version")
+        resolver = validators.RefResolver("", {})
+        self.assertEqual(resolver.store["something"], Validator.META_SCHEMA)
+
     def test_it_can_construct_a_base_uri_from_a_schema(self):
         schema = {"id": "foo"}
         resolver = validators.RefResolver.from_schema(
@@ -2165,5 +3529,9 @@ class _ReallyFakeJSONResponse(object):
 
     _response = attr.ib()
 
+    @property
+    def text(self):
+        return self._response
+
     def json(self):
         return json.loads(self._response)
@@ -3,20 +3,28 @@ Creation and extension of validators, with implementations for existing drafts.
 """
 from __future__ import annotations
 
+from collections import ChainMap, OrderedDict, namedtuple
 from collections.abc import Sequence
 from functools import lru_cache
 from urllib.parse import unquote, urldefrag, urljoin, urlsplit
 from urllib.request import urlopen
 from warnings import warn
 import contextlib
+import copy
+import hashlib
+import inspect
 import json
+import re
 import reprlib
+import threading
 import typing
 import warnings
 
 import attr
 
 from jsonschema import (
+    _codegen,
+    _compiler,
     _format,
     _legacy_validators,
     _types,
@@ -83,6 +91,7 @@ def validates(version):
         _VALIDATORS[version] = cls
         meta_schema_id = cls.ID_OF(cls.META_SCHEMA)
         _META_SCHEMAS[meta_schema_id] = cls
+        _shared_store.cache_clear()
         return cls
     return _validates
 
@@ -96,6 +105,13 @@ def _id_of(schema):
     return schema.get("$id", "")
 
 
+def _legacy_id_of(schema):
+    """
+    Return the ID of a schema for drafts before ``$id`` existed.
+    """
+    return schema.get("id", "")
+
+
 def _store_schema_list():
     if not _VOCABULARIES:
         _VOCABULARIES.extend(_utils.load_schema("vocabularies").items())
@@ -104,6 +120,17 @@ def _store_schema_list():
     ] + _VOCABULARIES
 
 
+@lru_cache(maxsize=None)
+def _shared_store():
+    """
+    A store of the known meta schemas and vocabularies, shared by resolvers.
+
+    It must not be modified (resolvers instead overlay it), and is rebuilt
+    whenever a new validator is registered.
+    """
+    return _utils.URIDict(_store_schema_list())
+
+
 def create(
     meta_schema,
     validators=(),
@@ -112,6 +139,8 @@ def create(
     format_checker=_format.draft202012_format_checker,
     id_of=_id_of,
     applicable_validators=lambda schema: schema.items(),
+    regex_engine=re,
+    boolean_validators=(),
 ):
     """
     Create a new validator class.
@@ -168,6 +197,27 @@ def create(
             validators (names and callables) which will be called to
             validate the instance.
 
+        regex_engine:
+
+            the regular expression engine used to compile the patterns
+            in schemas (e.g. for :validator:`pattern`), which is any
+            object with a ``compile`` function (such as the `re` module
+            itself, or a `jsonschema.ECMA262Engine`). Patterns are
+            compiled when a validator is created, so an engine is
+            expected to raise `re.error` for invalid ones.
+
+            If unprovided, Python's `re` is used.
+
+        boolean_validators (collections.abc.Mapping):
+
+            a mapping from (some of) the names in ``validators`` to
+            callables taking the same arguments, but which return whether
+            the instance is valid rather than yielding errors, and which
+            are used by ``is_valid`` in their place.
+
+            The callables from ``jsonschema`` itself which are found in
+            ``validators`` have theirs used without needing to be given.
+
     Returns:
 
         a new `jsonschema.protocols.Validator` class
@@ -183,11 +233,46 @@ def create(
         TYPE_CHECKER = type_checker
         FORMAT_CHECKER = format_checker_arg
         ID_OF = staticmethod(id_of)
+        REGEX_ENGINE = regex_engine
+        _APPLICABLE_VALIDATORS = staticmethod(applicable_validators)
+        _BOOLEAN_VALIDATORS = {
+            **_utils.boolean_forms(validators),
+            **dict(boolean_validators),
+        }
 
         schema = attr.ib(repr=reprlib.repr)
         resolver = attr.ib(default=None, repr=False)
         format_checker = attr.ib(default=None)
-        evolve = attr.evolve
+
+        # the compiled regular expressions of every validator of the class
+        _patterns = _utils.Patterns(regex_engine)
+
+        # set on validators returned by `compile`
+        _node = None
+
+        # the child most recently created by `_child_for`, for reuse
+        _child = None
+
+        # where within the instance (and schema) this validator is, and,
+        # while it's iterating over errors, the keyword it's applying (and
+        # that keyword's location, once needed)
+        _location = None
+        _keyword = _keyword_location = None
+
+        # the frames created by `descend` (by the identity of their schema,
+        # which they keep alive), each reused once it's done iterating
+        _descendants = None
+        _iterating = False
+
+        # whether this validator is (a frame of) a single validation, whose
+        # resolver tracks that validation's resolution scopes alone
+        _scoped = False
+
+        # the frame of the last validation by this validator to finish, for
+        # the next one to reuse (along with its descendants), and on such a
+        # frame, the validator (and resolver) it was entered from
+        _idle = None
+        _origin = _entered_from = None
 
         def __attrs_post_init__(self):
             if self.resolver is None:
@@ -196,11 +281,47 @@ def create(
                     id_of=id_of,
                 )
 
+            # compile the schema's regular expressions now, both to reuse
+            # them and so that any invalid ones are found immediately, into
+            # a cache shared by each validator of the class (and so by those
+            # evolved from one another)
+            if self._patterns.engine is not self.REGEX_ENGINE:
+                # a subclass with a regex engine of its own
+                type(self)._patterns = _utils.Patterns(self.REGEX_ENGINE)
+            self._patterns.compile_within(self.schema)
+
         @classmethod
         def check_schema(cls, schema):
             for error in cls(cls.META_SCHEMA).iter_errors(schema):
                 raise exceptions.SchemaError.create_from(error)
 
+        def evolve(self, **changes):
+            if self._node is not None and changes.keys() == {"schema"}:
+                # stay compiled, with a copy of the schema's compiled validator
+                location = self._location_of_keyword()
+                return self._frame(changes["schema"], location)
+
+            evolved = attr.evolve(self, **changes)
+            if self._scoped:
+                # evolved during a validation (e.g. by a keyword), so its
+                # errors are located (and its references resolved) there
+                evolved._location = self._location_of_keyword()
+                evolved._scoped = "resolver" not in changes
+            return evolved
+
+        def compile(self):
+            """
+            Compile this validator's schema ahead of validating instances.
+
+            Returns:
+
+                a new validator which is equivalent to this one, but
+                which looks up the keywords applicable to each of its
+                subschemas (and resolves each :validator:`$ref`) only
+                once, rather than each time it validates an instance
+            """
+            return _compiler.Compiled(self).validator_for(self.schema)
+
         def iter_errors(self, instance, _schema=None):
             if _schema is not None:
                 warnings.warn(
@@ -213,58 +334,77 @@ def create(
                     DeprecationWarning,
                     stacklevel=2,
                 )
+                node = None
             else:
-                _schema = self.schema
-
-            if _schema is True:
-                return
-            elif _schema is False:
-                yield exceptions.ValidationError(
-                    f"False schema does not allow {instance!r}",
-                    validator=None,
-                    validator_value=None,
-                    instance=instance,
-                    schema=_schema,
-                )
-                return
+                _schema, node = self.schema, self._node
 
-            scope = id_of(_schema)
-            if scope:
-                self.resolver.push_scope(scope)
-            try:
-                for k, v in applicable_validators(_schema):
-                    validator = self.VALIDATORS.get(k)
-                    if validator is None:
-                        continue
-
-                    errors = validator(self, v, instance, _schema) or ()
-                    for error in errors:
-                        # set details if not already set by the called fn
-                        error._set(
-                            validator=k,
-                            validator_value=v,
-                            instance=instance,
-                            schema=_schema,
-                        )
-                        if k not in {"if", "$ref"}:
-                            error.schema_path.appendleft(k)
-                        yield error
-            finally:
-                if scope:
-                    self.resolver.pop_scope()
+            # Errors are iterated over by a copy of this validator, which
+            # tracks the keyword being applied, leaving this one untouched.
+            if self._scoped:
+                frame = self._frame(self.schema, self._location)
+            else:
+                frame = self._begin()
+            return frame._iter_errors(instance, _schema, node, frame._location)
 
         def descend(self, instance, schema, path=None, schema_path=None):
-            for error in self.evolve(schema=schema).iter_errors(instance):
-                if path is not None:
-                    error.path.appendleft(path)
-                if schema_path is not None:
-                    error.schema_path.appendleft(schema_path)
-                yield error
+            base = location = self._location_of_keyword()
+            if path is not None or schema_path is not None:
+                location = _utils.Location(
+                    base,
+                    () if path is None else (path,),
+                    () if schema_path is None else (schema_path,),
+                )
+            descendants, frame = self._descendants, None
+            if descendants is not None:
+                frame = descendants.get(id(schema))
+            if frame is None or frame._iterating:
+                frame = self._frame(schema, location)
+                if not self._scoped:
+                    frame._enter()
+                elif descendants is None:
+                    self._descendants = {id(schema): frame}
+                elif len(descendants) < _MAX_DESCENDANTS:
+                    descendants[id(schema)] = frame
+            else:
+                frame._location = location
+            frame._iterating = True
+            return frame._iter_errors(instance, schema, frame._node, base)
 
         def validate(self, *args, **kwargs):
             for error in self.iter_errors(*args, **kwargs):
                 raise error
 
+        async def aiter_errors(
+            self, instance, offload_above=None, executor=None,
+        ):
+            aprefetch = getattr(self.resolver, "aprefetch", None)
+            if aprefetch is not None:
+                await aprefetch()
+
+            if offload_above is None or not _utils.exceeds(
+                instance, offload_above,
+            ):
+                for error in self.iter_errors(instance):
+                    yield error
+                return
+
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            errors = await loop.run_in_executor(
+                executor, list, self.iter_errors(instance),
+            )
+            for error in errors:
+                yield error
+
+        async def avalidate(self, instance, **kwargs):
+            errors = self.aiter_errors(instance, **kwargs)
+            try:
+                async for error in errors:
+                    raise error
+            finally:
+                await errors.aclose()
+
         def is_type(self, instance, type):
             try:
                 return self.TYPE_CHECKER.is_type(instance, type)
@@ -285,8 +425,219 @@ def create(
                 )
                 self = self.evolve(schema=_schema)
 
-            error = next(self.iter_errors(instance), None)
-            return error is None
+            if not self._scoped:
+                self = self._begin()
+
+            schema = self.schema
+            if schema is True or schema is False:
+                if self._origin is not None:
+                    self._end()
+                return schema
+
+            scope, keywords, validators, boolean = self._keywords(
+                schema, self._node,
+            )
+            if scope:
+                self.resolver.push_scope(scope)
+            try:
+                for k, v in keywords:
+                    validator = validators.get(k)
+                    if validator is None:
+                        continue
+
+                    is_valid = boolean.get(k)
+                    if is_valid is None:
+                        errors = validator(self, v, instance, schema) or ()
+                        if next(iter(errors), None) is not None:
+                            return False
+                    elif not is_valid(self, v, instance, schema):
+                        return False
+                return True
+            finally:
+                if scope:
+                    self.resolver.pop_scope()
+                if self._origin is not None:
+                    self._end()
+
+        def _iter_errors(self, instance, schema, node, base):
+            """
+            Iterate over errors, with paths relative to the given location.
+            """
+            if schema is True or schema is False:
+                self._iterating = False
+                if self._origin is not None:
+                    self._end()
+                if schema:
+                    return
+                error = exceptions.ValidationError(
+                    f"False schema does not allow {instance!r}",
+                    validator=None,
+                    validator_value=None,
+                    instance=instance,
+                    schema=schema,
+                )
+                error._locate(self._location)
+                error._rebase(base)
+                yield error
+                return
+
+            if node is None:
+                scope = id_of(schema)
+                keywords = applicable_validators(schema)
+                validators = self.VALIDATORS
+            else:
+                scope = node.scope
+                keywords, validators = node.keywords, node.validators
+            if scope:
+                self.resolver.push_scope(scope)
+            try:
+                for k, v in keywords:
+                    validator = validators.get(k)
+                    if validator is None:
+                        continue
+
+                    self._keyword, self._keyword_location = k, None
+                    errors = validator(self, v, instance, schema) or ()
+                    for error in errors:
+                        # errors from subschemas were located (and had
+                        # their details set) where they occurred
+                        if not error._located:
+                            # set details if not already set by the fn
+                            error._set(
+                                validator=k,
+                                validator_value=v,
+                                instance=instance,
+                                schema=schema,
+                            )
+                            error._locate(self._location_of_keyword())
+                        error._rebase(base)
+                        yield error
+            finally:
+                if scope:
+                    self.resolver.pop_scope()
+                self._keyword = self._keyword_location = None
+                self._iterating = False
+                if self._origin is not None:
+                    self._end()
+
+        def _location_of_keyword(self):
+            """
+            The location of the keyword currently being applied, if any.
+            """
+            if self._keyword is None or self._keyword in {"if", "$ref"}:
+                return self._location
+            location = self._keyword_location
+            if location is None:
+                location = self._keyword_location = _utils.Location(
+                    parent=self._location,
+                    schema_path=(self._keyword,),
+                )
+            return location
+
+        def _child_for(self, schema):
+            """
+            A frame for applying a subschema to the instance being validated.
+
+            This happens once per keyword (and often per item or property)
+            while validating, so rather than going through __init__ as
+            `evolve` does, children are shallow copies of their parent, and
+            the last one is reused when applying the same subschema again
+            (e.g. to each item of an array).
+            """
+            location = self._location_of_keyword()
+            child = self._child
+            if (
+                child is None
+                or child.schema is not schema
+                or child._location is not location
+            ):
+                child = self._child = self._frame(schema, location)
+            return child
+
+        def _begin(self):
+            """
+            A frame for a validation by this validator, which isn't a frame.
+
+            The frame left by the last validation to finish is reused if
+            this validator is unchanged since, so that neither it nor its
+            descendants (nor its resolver) need copying again. Otherwise, a
+            new frame is entered.
+            """
+            frame = self.__dict__.pop("_idle", None)
+            if (
+                frame is None
+                or frame.schema is not self.schema
+                or frame.format_checker is not self.format_checker
+                or frame._entered_from is not self.resolver
+            ):
+                frame = self._frame(self.schema, self._location)
+                frame._enter()
+            frame._origin = self
+            return frame
+
+        def _end(self):
+            """
+            Finish a validation, leaving this frame to be reused by the next.
+            """
+            origin, self._origin = self._origin, None
+            origin._idle = self
+
+        def _enter(self):
+            """
+            Begin a validation with this (copied) validator.
+
+            Its resolver is replaced by one with its own stack of resolution
+            scopes, shared by the frames of this validation but by no other,
+            so that validations interleaved with one another (by threads,
+            generators or coroutines) never see each other's scopes.
+            """
+            self._entered_from = self.resolver
+            with_own_scopes = getattr(self.resolver, "_with_own_scopes", None)
+            if with_own_scopes is not None:
+                self.resolver = with_own_scopes()
+            self._scoped = True
+            self._child = self._descendants = None
+
+        def _frame(self, schema, location):
+            """
+            A copy of this validator, for applying ``schema`` at ``location``.
+
+            Its attributes are set one at a time (rather than by updating
+            its ``__dict__``), so that it shares the layout of the others,
+            which keeps looking up attributes on it fast.
+            """
+            resolver, scoped = self.resolver, self._scoped
+            if self._node is not None:
+                self = self._node.compiled.validator_for(schema)
+            frame = object.__new__(self.__class__)
+            frame.schema = schema
+            frame.resolver = resolver
+            frame.format_checker = self.format_checker
+            frame._node = self._node
+            frame._scoped = scoped
+            frame._location = location
+            return frame
+
+        def _keywords(self, schema, node):
+            """
+            The scope of a (non-boolean) schema, and its applicable keywords.
+
+            Each keyword comes along with its value, and is implemented by
+            the callable it maps to (along with any boolean form of it).
+            """
+            if node is not None:
+                return (
+                    node.scope,
+                    node.keywords,
+                    node.validators,
+                    node.boolean_validators,
+                )
+            return (
+                id_of(schema),
+                applicable_validators(schema),
+                self.VALIDATORS,
+                self._BOOLEAN_VALIDATORS,
+            )
 
     if version is not None:
         safe = version.title().replace(" ", "").replace("-", "")
@@ -302,6 +653,8 @@ def extend(
     version=None,
     type_checker=None,
     format_checker=None,
+    regex_engine=None,
+    boolean_validators=(),
 ):
     """
     Create a new validator class by extending an existing one.
@@ -348,6 +701,20 @@ def extend(
             If unprovided, the format checker of the extended
             `jsonschema.protocols.Validator` will be carried along.
 
+        regex_engine:
+
+            a regular expression engine, used to compile patterns, as in
+            `create`.
+
+            If unprovided, the regular expression engine of the extended
+            `jsonschema.protocols.Validator` will be carried along.
+
+        boolean_validators (collections.abc.Mapping):
+
+            a mapping of boolean forms of validator callables, as in
+            `create`. The boolean forms of any callables which ``validators``
+            replaces are not carried along.
+
     Returns:
 
         a new `jsonschema.protocols.Validator` class extending the one
@@ -364,13 +731,25 @@ def extend(
         old validator.
     """
 
+    validators = dict(validators)
     all_validators = dict(validator.VALIDATORS)
     all_validators.update(validators)
 
+    all_boolean_validators = {
+        k: is_valid
+        for k, is_valid in getattr(
+            validator, "_BOOLEAN_VALIDATORS", {},
+        ).items()
+        if k not in validators
+    }
+    all_boolean_validators.update(boolean_validators)
+
     if type_checker is None:
         type_checker = validator.TYPE_CHECKER
     if format_checker is None:
         format_checker = validator.FORMAT_CHECKER
+    if regex_engine is None:
+        regex_engine = validator.REGEX_ENGINE
     return create(
         meta_schema=validator.META_SCHEMA,
         validators=all_validators,
@@ -378,9 +757,83 @@ def extend(
         type_checker=type_checker,
         format_checker=format_checker,
         id_of=validator.ID_OF,
+        regex_engine=regex_engine,
+        boolean_validators=all_boolean_validators,
     )
 
 
+def specialize(validator):
+    """
+    Create a new validator class which generates code for each schema.
+
+    Instances of the new class generate (the first time they are asked
+    to validate an instance) a Python function for each subschema of
+    their schema, in which the checks made by each of its keywords are
+    inlined. `is_valid` then calls these functions directly, which is
+    typically much faster than interpreting the schema each time.
+
+    Errors are still collected by interpreting the schema, though only
+    once an instance is known to be invalid.
+
+    Arguments:
+
+        validator (jsonschema.protocols.Validator):
+
+            an existing validator class
+
+    Returns:
+
+        a new `jsonschema.protocols.Validator` class, which validates
+        identically to the one provided
+
+    .. note::
+
+        Code is only generated for the keywords ``jsonschema`` itself
+        implements. Any others (such as ones added via `extend`) are
+        interpreted, as are schemas which use dynamic references
+        (:validator:`$dynamicRef` or :validator:`$recursiveRef`).
+    """
+
+    class Specialized(validator):
+
+        _generated = _interpreter = None
+
+        # (which is what's pickled in place of this class, which can't be)
+        _unspecialized = validator
+
+        def evolve(self, **changes):
+            # generated code is specific to one schema, so don't copy it
+            return attr.evolve(self, **changes)
+
+        def iter_errors(self, instance, _schema=None):
+            if _schema is None and self.is_valid(instance):
+                return
+            yield from self._interpret().iter_errors(instance, _schema)
+
+        def is_valid(self, instance, _schema=None):
+            if _schema is not None:
+                return self._interpret().is_valid(instance, _schema)
+            if self._generated is None:
+                self._generated = _codegen.generate(self._interpret())
+            return self._generated(instance)
+
+        def _interpret(self):
+            """
+            An instance of the original class, used for anything other
+            than checking validity.
+            """
+            if self._interpreter is None:
+                self._interpreter = validator(
+                    schema=self.schema,
+                    resolver=self.resolver,
+                    format_checker=self.format_checker,
+                ).compile()
+            return self._interpreter
+
+    Specialized.__name__ = Specialized.__qualname__ = validator.__name__
+    return Specialized
+
+
 Draft3Validator = create(
     meta_schema=_utils.load_schema("draft3"),
     validators={
@@ -409,7 +862,7 @@ Draft3Validator = create(
     type_checker=_types.draft3_type_checker,
     format_checker=_format.draft3_format_checker,
     version="draft3",
-    id_of=lambda schema: schema.get("id", ""),
+    id_of=_legacy_id_of,
     applicable_validators=_legacy_validators.ignore_ref_siblings,
 )
 
@@ -446,7 +899,7 @@ Draft4Validator = create(
     type_checker=_types.draft4_type_checker,
     format_checker=_format.draft4_format_checker,
     version="draft4",
-    id_of=lambda schema: schema.get("id", ""),
+    id_of=_legacy_id_of,
     applicable_validators=_legacy_validators.ignore_ref_siblings,
 )
 
@@ -631,6 +1084,9 @@ class RefResolver(object):
     """
     Resolve JSON References.
 
+    A resolver (and so a validator using it) may be used by any number of
+    threads at once, each of which tracks its own resolution scope.
+
     Arguments:
 
         base_uri (str):
@@ -664,6 +1120,19 @@ class RefResolver(object):
             A cache that will be used for caching the results of
             resolved remote URLs.
 
+        loads (collections.abc.Callable):
+
+            A function which decodes a (remote) JSON document from a
+            `str`, such as a faster third-party one, or `json.loads`
+            with a ``parse_float`` of `decimal.Decimal` (which is what
+            is used if unprovided, with the default ``parse_float``).
+            Documents retrieved by a handler are decoded by the handler.
+
+        id_of (collections.abc.Callable):
+
+            A function that given a schema returns its ID, which is used
+            to find the subschemas of a document by their IDs.
+
     Attributes:
 
         cache_remote (bool):
@@ -680,6 +1149,8 @@ class RefResolver(object):
         handlers=(),
         urljoin_cache=None,
         remote_cache=None,
+        loads=json.loads,
+        id_of=_id_of,
     ):
         if urljoin_cache is None:
             urljoin_cache = lru_cache(1024)(urljoin)
@@ -689,14 +1160,54 @@ class RefResolver(object):
         self.referrer = referrer
         self.cache_remote = cache_remote
         self.handlers = dict(handlers)
+        self.loads = loads
+        self.id_of = id_of
 
-        self._scopes_stack = [base_uri]
-        self.store = _utils.URIDict(_store_schema_list())
+        self._scopes = _Scopes(base_uri)
+        self.store = _utils.URIDict.overlaying(_shared_store())
         self.store.update(store)
         self.store[base_uri] = referrer
 
         self._urljoin_cache = urljoin_cache
         self._remote_cache = remote_cache
+        self._indexes = OrderedDict()
+        self._indexes_lock = threading.Lock()
+        self._subschemas_cache = lru_cache(1024)(self._find_in_subschemas)
+        self._prefetched = False
+
+    def __getstate__(self):
+        # caches, locks and scopes are recreated when unpickling, and the
+        # meta schemas shared by every resolver are left out
+        state = dict(self.__dict__)
+        for name in (
+            "_scopes",
+            "_urljoin_cache",
+            "_remote_cache",
+            "_indexes",
+            "_indexes_lock",
+            "_subschemas_cache",
+        ):
+            del state[name]
+
+        store = self.store.store
+        if isinstance(store, ChainMap):
+            store = store.maps[0]
+        state.update(store=dict(store), _base_uri=self._scopes.stack[0])
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        base_uri, store = state.pop("_base_uri"), state.pop("store")
+        self.__dict__.update(state)
+
+        self._scopes = _Scopes(base_uri)
+        self.store = _utils.URIDict.overlaying(_shared_store())
+        self.store.update(store)
+        self._urljoin_cache = lru_cache(1024)(urljoin)
+        self._remote_cache = lru_cache(1024)(self.resolve_from_url)
+        self._indexes = OrderedDict()
+        self._indexes_lock = threading.Lock()
+        self._subschemas_cache = lru_cache(1024)(self._find_in_subschemas)
 
     @classmethod
     def from_schema(cls, schema, id_of=_id_of, *args, **kwargs):
@@ -714,7 +1225,31 @@ class RefResolver(object):
             `RefResolver`
         """
 
-        return cls(base_uri=id_of(schema), referrer=schema, *args, **kwargs)
+        return cls(
+            base_uri=id_of(schema),
+            referrer=schema,
+            id_of=id_of,
+            *args,
+            **kwargs,
+        )
+
+    @property
+    def _scopes_stack(self):
+        return self._scopes.stack
+
+    def _with_own_scopes(self):
+        """
+        A copy of this resolver with its own stack of resolution scopes.
+
+        Its store, caches and indexes remain shared with this resolver,
+        and its stack starts out as a copy of this resolver's current one.
+        (Its attributes are set one at a time, as for validators' frames.)
+        """
+        resolver = object.__new__(self.__class__)
+        for name, value in vars(self).items():
+            setattr(resolver, name, value)
+        resolver._scopes = _OwnScopes(list(self._scopes_stack))
+        return resolver
 
     def push_scope(self, scope):
         """
@@ -723,9 +1258,8 @@ class RefResolver(object):
         Treats further dereferences as being performed underneath the
         given scope.
         """
-        self._scopes_stack.append(
-            self._urljoin_cache(self.resolution_scope, scope),
-        )
+        stack = self._scopes.stack
+        stack.append(self._urljoin_cache(stack[-1], scope))
 
     def pop_scope(self):
         """
@@ -738,7 +1272,7 @@ class RefResolver(object):
         called.
         """
         try:
-            self._scopes_stack.pop()
+            self._scopes.stack.pop()
         except IndexError:
             raise exceptions.RefResolutionError(
                 "Failed to pop the scope from an empty stack. "
@@ -751,7 +1285,7 @@ class RefResolver(object):
         """
         Retrieve the current resolution scope.
         """
-        return self._scopes_stack[-1]
+        return self._scopes.stack[-1]
 
     @property
     def base_uri(self):
@@ -799,41 +1333,27 @@ class RefResolver(object):
         finally:
             self.pop_scope()
 
-    def _find_in_referrer(self, key):
-        return self._get_subschemas_cache()[key]
-
-    @lru_cache()
-    def _get_subschemas_cache(self):
-        cache = {key: [] for key in _SUBSCHEMAS_KEYWORDS}
-        for keyword, subschema in _utils.search_schema(
-            self.referrer, _match_subschema_keywords,
-        ):
-            cache[keyword].append(subschema)
-        return cache
-
-    @lru_cache()
-    def _find_in_subschemas(self, url):
-        subschemas = self._get_subschemas_cache()["$id"]
-        if not subschemas:
-            return None
+    def _find_in_subschemas(self, url, scope):
         uri, fragment = urldefrag(url)
-        for subschema in subschemas:
-            target_uri = self._urljoin_cache(
-                self.resolution_scope, subschema["$id"],
-            )
-            if target_uri.rstrip("/") == uri.rstrip("/"):
-                if fragment:
-                    subschema = self.resolve_fragment(subschema, fragment)
-                return url, subschema
-        return None
+        subschema = self._index_of(self.referrer).with_id(
+            uri,
+            scope=scope,
+            urljoin=self._urljoin_cache,
+        )
+        if subschema is None:
+            return None
+        if fragment:
+            subschema = self.resolve_fragment(subschema, fragment)
+        return url, subschema
 
     def resolve(self, ref):
         """
         Resolve the given reference.
         """
-        url = self._urljoin_cache(self.resolution_scope, ref).rstrip("/")
+        scope = self._scopes.stack[-1]
+        url = self._urljoin_cache(scope, ref).rstrip("/")
 
-        match = self._find_in_subschemas(url)
+        match = self._subschemas_cache(url, scope)
         if match is not None:
             return match
 
@@ -874,44 +1394,56 @@ class RefResolver(object):
         if not fragment:
             return document
 
-        if document is self.referrer:
-            find = self._find_in_referrer
-        else:
-
-            def find(key):
-                yield from _utils.search_schema(
-                    document,
-                    _utils.match_keyword(key),
-                )
+        index = self._index_of(document)
+        subschema = index.fragments.get(fragment)
+        if subschema is not None:
+            return subschema
 
-        for keyword in ["$anchor", "$dynamicAnchor"]:
-            for subschema in find(keyword):
-                if fragment == subschema[keyword]:
-                    return subschema
-        for keyword in ["id", "$id"]:
-            for subschema in find(keyword):
-                if "#" + fragment == subschema[keyword]:
-                    return subschema
+        try:
+            return index.pointers[fragment]
+        except KeyError:
+            pass
 
         # Resolve via path
+        resolved = document
         parts = unquote(fragment).split("/") if fragment else []
         for part in parts:
             part = part.replace("~1", "/").replace("~0", "~")
 
-            if isinstance(document, Sequence):
+            if isinstance(resolved, Sequence):
                 # Array indexes should be turned into integers
                 try:
                     part = int(part)
                 except ValueError:
                     pass
             try:
-                document = document[part]
+                resolved = resolved[part]
             except (TypeError, LookupError):
                 raise exceptions.RefResolutionError(
                     f"Unresolvable JSON pointer: {fragment!r}",
                 )
 
-        return document
+        index.pointers[fragment] = resolved
+        return resolved
+
+    def _index_of(self, document):
+        """
+        Retrieve the index of a document, indexing it if it hasn't been.
+
+        Indexes are kept for the most recently used documents, which are
+        identified by identity (and kept alive along with their index, so
+        that their identity isn't reused).
+        """
+        with self._indexes_lock:
+            indexed = self._indexes.get(id(document))
+            if indexed is None:
+                indexed = document, _SubschemaIndex(document, self.id_of)
+                self._indexes[id(document)] = indexed
+                if len(self._indexes) > _MAX_INDEXED_DOCUMENTS:
+                    self._indexes.popitem(last=False)
+            else:
+                self._indexes.move_to_end(id(document))
+            return indexed[1]
 
     def resolve_remote(self, uri):
         """
@@ -951,27 +1483,254 @@ class RefResolver(object):
 
         if scheme in self.handlers:
             result = self.handlers[scheme](uri)
+            if inspect.isawaitable(result):
+                result = _run(result, uri)
         elif scheme in ["http", "https"] and requests:
             # Requests has support for detecting the correct encoding of
             # json over http
-            result = requests.get(uri).json()
+            response = requests.get(uri)
+            if self.loads is json.loads:
+                result = response.json()
+            else:
+                result = self.loads(response.text)
         else:
             # Otherwise, pass off to urllib and assume utf-8
             with urlopen(uri) as url:
-                result = json.loads(url.read().decode("utf-8"))
+                result = self.loads(url.read().decode("utf-8"))
 
         if self.cache_remote:
             self.store[uri] = result
         return result
 
+    def prefetch(self, max_workers=8):
+        """
+        Concurrently retrieve the remote documents referenced by the referrer.
+
+        Rather than being retrieved (one at a time) when validation first
+        encounters a reference to them, any remote documents referenced
+        by the referrer (or, in turn, by the documents it references) are
+        retrieved ahead of time using a pool of threads, and then saved in
+        the store. This is typically done just after creating a validator,
+        i.e. ``Draft202012Validator(schema).resolver.prefetch()``.
+
+        Documents which fail to be retrieved are skipped, so that (as
+        without prefetching) any error is raised only if validation needs
+        them.
 
-_SUBSCHEMAS_KEYWORDS = ("$id", "id", "$anchor", "$dynamicAnchor")
+        Arguments:
+
+            max_workers (int):
+
+                the maximum number of documents to retrieve at once
+        """
+        from concurrent.futures import (
+            FIRST_COMPLETED,
+            ThreadPoolExecutor,
+            wait,
+        )
+
+        seen = set()
+
+        def submit(document, base_uri):
+            refs, embedded = _references(document, base_uri)
+            for url in refs - embedded:
+                if url in seen or url in self.store:
+                    continue
+                seen.add(url)
+                pending[executor.submit(self.resolve_remote, url)] = url
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            submit(self.referrer, self.base_uri)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    try:
+                        document = future.result()
+                    except Exception:
+                        continue
+                    self.store[url] = document
+                    submit(document, url)
 
+    async def aprefetch(self):
+        """
+        Retrieve the remote documents referenced, without blocking.
 
-def _match_subschema_keywords(value):
-    for keyword in _SUBSCHEMAS_KEYWORDS:
-        if keyword in value:
-            yield keyword, value
+        This is the equivalent of `prefetch` for use within an event loop,
+        and is done by ``aiter_errors`` and ``avalidate`` before they
+        validate, so that validating never blocks the loop waiting for a
+        remote document.
+
+        Handlers which are coroutine functions are awaited, while other
+        handlers (and retrieval with ``requests`` or ``urllib``) are run
+        within the loop's default executor. Once every document has been
+        retrieved, further calls do nothing.
+
+        Unlike `prefetch`, a document which fails to be retrieved is not
+        left to be retrieved (synchronously) during validation, which
+        would block the loop. Its error is instead raised, once the other
+        documents have been retrieved, as a `RefResolutionError`, and a
+        later call retries retrieving it.
+
+        Raises:
+
+            `jsonschema.exceptions.RefResolutionError`:
+
+                if any document fails to be retrieved
+        """
+        if self._prefetched:
+            return
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        seen, pending, error = set(), {}, None
+
+        def submit(document, base_uri):
+            refs, embedded = _references(document, base_uri)
+            for url in refs - embedded:
+                if url in seen or url in self.store:
+                    continue
+                seen.add(url)
+                handler = self.handlers.get(urlsplit(url).scheme)
+                if _is_async(handler):
+                    retrieve = handler(url)
+                else:
+                    retrieve = loop.run_in_executor(
+                        None, self.resolve_remote, url,
+                    )
+                pending[asyncio.ensure_future(retrieve)] = url
+
+        submit(self.referrer, self.base_uri)
+        while pending:
+            done, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED,
+            )
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    document = future.result()
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+                    continue
+                self.store[url] = document
+                submit(document, url)
+
+        if error is not None:
+            raise exceptions.RefResolutionError(error)
+        self._prefetched = True
+
+
+def _is_async(handler):
+    """
+    Check whether a handler is a coroutine function (or async callable).
+    """
+    return inspect.iscoroutinefunction(handler) or (
+        inspect.iscoroutinefunction(getattr(handler, "__call__", None))
+    )
+
+
+def _run(awaitable, uri):
+    """
+    Wait for an asynchronous handler outside of any event loop.
+    """
+    import asyncio
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError(
+            f"{uri!r} must be retrieved asynchronously within a running "
+            "event loop (e.g. by using aiter_errors or avalidate).",
+        )
+
+    async def wait_for():
+        return await awaitable
+    return asyncio.run(wait_for())
+
+
+_ANCHOR_KEYWORDS = ("$anchor", "$dynamicAnchor")
+_MAX_INDEXED_DOCUMENTS = 1024
+_MAX_DESCENDANTS = 1024
+
+
+class _Scopes(threading.local):
+    """
+    The stack of resolution scopes of a resolver, which each thread has one
+    of (starting from the resolver's base URI), so that a resolver (and its
+    validator) can be used by any number of threads at once.
+    """
+
+    def __init__(self, base_uri):
+        self.stack = [base_uri]
+
+
+class _OwnScopes(object):
+    """
+    The stack of resolution scopes of a single validation.
+    """
+
+    def __init__(self, stack):
+        self.stack = stack
+
+
+class _SubschemaIndex(object):
+    """
+    An index of the subschemas of a document which have IDs or anchors.
+
+    It's built with a single pass over the document, and belongs to (and
+    lives only as long as) the resolver which built it. It also remembers
+    the subschemas found at each JSON pointer resolved within the document.
+    """
+
+    def __init__(self, document, id_of=_id_of):
+        # IDs are whatever the draft's ``id_of`` says they are, so that e.g.
+        # ``id`` is only an ID in drafts before ``$id`` existed
+        def match(subschema):
+            for keyword in _ANCHOR_KEYWORDS:
+                yield keyword, subschema.get(keyword), subschema
+            yield "id", id_of(subschema), subschema
+
+        found = {keyword: [] for keyword in _ANCHOR_KEYWORDS + ("id",)}
+        for keyword, value, subschema in _utils.search_schema(document, match):
+            if value and isinstance(value, str):
+                found[keyword].append((value, subschema))
+
+        #: subschemas by the fragments identifying them, with anchors taking
+        #: precedence over dynamic anchors, then over (fragment-only) IDs
+        self.fragments = {}
+        for keyword in _ANCHOR_KEYWORDS:
+            for anchor, subschema in found[keyword]:
+                self.fragments.setdefault(anchor, subschema)
+        for id, subschema in found["id"]:
+            if id.startswith("#"):
+                self.fragments.setdefault(id[1:], subschema)
+
+        #: subschemas by the (already resolved) JSON pointers to them
+        self.pointers = {}
+
+        self._ids = found["id"]
+        self._ids_by_scope = {}
+
+    def with_id(self, uri, scope, urljoin):
+        """
+        Find the (first) subschema whose ID, within ``scope``, is ``uri``.
+        """
+        ids = self._ids_by_scope.get(scope)
+        if ids is None:
+            # filled before being shared, so that other threads never see
+            # only some of the IDs
+            ids = {}
+            for id, subschema in self._ids:
+                ids.setdefault(urljoin(scope, id).rstrip("/"), subschema)
+            ids = self._ids_by_scope.setdefault(scope, ids)
+        return ids.get(uri.rstrip("/"))
 
 
 def validate(instance, schema, cls=None, *args, **kwargs):
@@ -987,6 +1746,13 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     itself valid, since not doing so can lead to less obvious error
     messages and fail in less obvious or consistent ways.
 
+    Validators (whose schemas have been verified) are cached, keyed by
+    the content of their schema along with the validator class and any
+    other arguments, so that repeatedly validating under equal schemas
+    verifies each only once. The cache holds the 128 most recently used
+    validators, and has ``cache_info`` and ``cache_clear`` functions
+    like those of a `functools.lru_cache`.
+
     If you know you have a valid schema already, especially if you
     intend to validate multiple instances with the same schema, you
     likely would prefer using the `Validator.validate` method directly
@@ -1033,13 +1799,193 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     if cls is None:
         cls = validator_for(schema)
 
-    cls.check_schema(schema)
-    validator = cls(schema, *args, **kwargs)
+    validator = _CHECKED_VALIDATORS.validator(cls, schema, args, kwargs)
+    if validator.is_valid(instance):
+        return
     error = exceptions.best_match(validator.iter_errors(instance))
     if error is not None:
         raise error
 
 
+def _references(document, base_uri):
+    """
+    Find the URIs of the documents referenced within a document.
+
+    Returns:
+
+        a set of the URIs referenced, resolved against their nearest
+        enclosing ID, along with a set of the URIs of the resources the
+        document embeds (or is itself)
+    """
+    refs, embedded = set(), set()
+    values = [(document, base_uri)]
+    while values:
+        value, base_uri = values.pop()
+        if isinstance(value, list):
+            values.extend((each, base_uri) for each in value)
+            continue
+        if not isinstance(value, dict):
+            continue
+
+        for keyword in "$id", "id":
+            id = value.get(keyword)
+            if isinstance(id, str):
+                base_uri = urljoin(base_uri, id)
+                embedded.add(urldefrag(base_uri)[0].rstrip("/"))
+                break
+        ref = value.get("$ref")
+        if isinstance(ref, str):
+            url = urldefrag(urljoin(base_uri, ref))[0].rstrip("/")
+            if urlsplit(url).scheme:
+                refs.add(url)
+        values.extend((each, base_uri) for each in value.values())
+    return refs, embedded
+
+
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _ValidatorCache(object):
+    """
+    A bounded cache of validators whose schemas have been checked.
+
+    Validators are keyed by a hash of the canonical JSON serialization of
+    their schema (rather than its identity, since callers of `validate`
+    commonly pass a fresh but equal schema each time), and the least
+    recently used is evicted once the cache is full. A cached validator is
+    only reused for the very schema it was created with (which, since its
+    hash matched, hasn't changed since), and otherwise a new one is created
+    for the caller's schema without checking it again, so that errors
+    always refer to the schema passed to `validate`.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._validators = OrderedDict()
+        self._hits = self._misses = 0
+        self._lock = threading.Lock()
+
+    def validator(self, cls, schema, args, kwargs):
+        """
+        Retrieve a validator for the schema, checking it if necessary.
+        """
+        try:
+            key = (
+                cls,
+                _content_hash(schema),
+                args,
+                tuple(sorted((k, _key_for(v)) for k, v in kwargs.items())),
+            )
+            hash(key)
+        except (TypeError, ValueError):
+            # not JSON (e.g. containing arbitrary Python objects), or given
+            # unhashable arguments, so there's no way to tell if it's equal
+            key = validator = None
+        else:
+            with self._lock:
+                validator = self._validators.get(key)
+                if validator is not None:
+                    self._hits += 1
+                    self._validators.move_to_end(key)
+                    if validator.schema is schema:
+                        return validator
+
+        # format checkers are copied so that later changing one can't change
+        # the cached validator
+        kwargs = {k: _snapshot(v) for k, v in kwargs.items()}
+        if validator is not None:
+            # an equal schema was checked already, but errors should still
+            # refer to (the subschemas of) the caller's own one
+            return self._cache(key, cls(schema, *args, **kwargs))
+
+        cls.check_schema(schema)
+        validator = cls(schema, *args, **kwargs)
+        with self._lock:
+            self._misses += 1
+        if key is None:
+            return validator
+        return self._cache(key, validator)
+
+    def _cache(self, key, validator):
+        """
+        Cache a validator, evicting the least recently used if full.
+        """
+        with self._lock:
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+        return validator
+
+    def cache_info(self):
+        with self._lock:
+            return _CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._validators),
+            )
+
+    def cache_clear(self):
+        with self._lock:
+            self._validators.clear()
+            self._hits = self._misses = 0
+
+
+def _content_hash(schema):
+    """
+    A hash of the canonical JSON serialization of a schema.
+
+    Unlike hashing a (frozen) copy of the schema itself, this distinguishes
+    ``true`` from ``1`` and ``1`` from ``1.0``, which are equal in Python.
+
+    Schemas containing anything but JSON types raise `TypeError`, including
+    tuples and non-string keys, which would otherwise serialize just like
+    arrays and string keys do.
+    """
+    stack = [schema]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if not all(isinstance(k, str) for k in value):
+                raise TypeError(f"{value!r} has non-string keys")
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif not isinstance(value, (str, int, float, type(None))):
+            raise TypeError(f"{value!r} is not JSON")
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+def _key_for(argument):
+    """
+    Key an argument to `validate`, comparing format checkers by contents.
+
+    Callers commonly create a new (but equivalent) format checker each
+    time they validate, which shouldn't miss the cache.
+    """
+    if isinstance(argument, _format.FormatChecker):
+        checkers = sorted(argument.checkers.items(), key=lambda item: item[0])
+        return type(argument), tuple(checkers)
+    return argument
+
+
+def _snapshot(argument):
+    """
+    Copy a format checker, so later changes to it don't affect the cache.
+    """
+    if isinstance(argument, _format.FormatChecker):
+        argument = copy.copy(argument)
+        argument.checkers = dict(argument.checkers)
+    return argument
+
+
+_CHECKED_VALIDATORS = _ValidatorCache()
+validate.cache_info = _CHECKED_VALIDATORS.cache_info
+validate.cache_clear = _CHECKED_VALIDATORS.cache_clear
+
+
 def validator_for(schema, default=_LATEST_VERSION):
     """
     Retrieve the validator class appropriate for validating the given schema.
@@ -1063,7 +2009,8 @@ def validator_for(schema, default=_LATEST_VERSION):
     """
     if schema is True or schema is False or "$schema" not in schema:
         return default
-    if schema["$schema"] not in _META_SCHEMAS:
+    cls = _META_SCHEMAS.get(schema["$schema"])
+    if cls is None:
         warn(
             (
                 "The metaschema specified by $schema was not found. "
@@ -1073,4 +2020,5 @@ def validator_for(schema, default=_LATEST_VERSION):
             DeprecationWarning,
             stacklevel=2,
         )
-    return _META_SCHEMAS.get(schema["$schema"], _LATEST_VERSION)
+        return _LATEST_VERSION
+    return cls